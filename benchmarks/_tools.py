@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any, Final
+
+import sqlalchemy as sa
+
+from src.config.core import DbConfig
+from src.database.alchemy import entity
+from src.database.alchemy.core import ConnectionFactory
+from src.database.interfaces.query import Query
+from src.database.manager import TransactionManagerImpl
+
+
+LOGIN_PREFIX: Final[str] = "bench_"
+
+
+def timings(fn: Callable[[], Any], repeat: int = 1000, warmup: int = 10) -> list[float]:
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+
+async def atimings(
+    fn: Callable[[], Awaitable[Any]], repeat: int = 100, warmup: int = 3
+) -> list[float]:
+    for _ in range(warmup):
+        await fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+
+def p50(samples: Sequence[float]) -> float:
+    return statistics.median(samples)
+
+
+def p95(samples: Sequence[float]) -> float:
+    return statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+
+
+def us(value: float) -> str:
+    return f"{value * 1e6:.1f}"
+
+
+def ms(value: float) -> str:
+    return f"{value * 1e3:.2f}"
+
+
+@contextmanager
+def allocations() -> Iterator[list[int]]:
+    result = [0, 0]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        yield result
+    finally:
+        result[0], result[1] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+
+def table(title: str, headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    cells = [[str(c) for c in headers], *([str(c) for c in row] for row in rows)]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+
+    print(f"\n{title}")
+    for index, row in enumerate(cells):
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths, strict=True)))
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
+
+
+def connection_factory() -> ConnectionFactory:
+    return ConnectionFactory.from_url(DbConfig().url())
+
+
+def user_rows(count: int, start: int = 0) -> list[dict[str, Any]]:
+    logins = (f"{LOGIN_PREFIX}{i:08d}" for i in range(start, start + count))
+
+    return [{"login": login, "password": "x" * 60} for login in logins]
+
+
+async def read[T](factory: ConnectionFactory, query: Query[Any, T]) -> T:
+    manager = TransactionManagerImpl(conn_factory=factory)
+    async with await manager.with_transaction(read_only=True):
+        return await manager.send(query)
+
+
+async def write[T](factory: ConnectionFactory, query: Query[Any, T]) -> T:
+    manager = TransactionManagerImpl(conn_factory=factory)
+    async with await manager.with_transaction():
+        return await manager.send(query)
+
+
+async def seed_users(factory: ConnectionFactory, count: int, chunk: int = 5_000) -> None:
+    async with factory.engine.begin() as conn:
+        for start in range(0, count, chunk):
+            await conn.execute(sa.insert(entity.User), user_rows(min(chunk, count - start), start))
+
+
+async def drop_users(factory: ConnectionFactory) -> None:
+    async with factory.engine.begin() as conn:
+        await conn.execute(sa.delete(entity.User).where(entity.User.login.startswith(LOGIN_PREFIX)))
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import redis.asyncio as aioredis
+
+from benchmarks._tools import atimings, ms, p50, table
+from src.config.core import RedisConfig
+from src.services.cache.redis import RedisCache
+
+
+class CountingConnection(aioredis.Connection):
+    round_trips = 0
+
+    async def send_packed_command(
+        self, command: bytes | str | Iterable[bytes], check_health: bool = True
+    ) -> None:
+        CountingConnection.round_trips += 1
+        await super().send_packed_command(command, check_health)
+
+
+async def measure(fn: Callable[[], Awaitable[Any]], repeat: int) -> tuple[int, float]:
+    await fn()
+    CountingConnection.round_trips = 0
+    await fn()
+    round_trips = CountingConnection.round_trips
+
+    return round_trips, p50(await atimings(fn, repeat=repeat, warmup=1))
+
+
+async def main(sizes: list[int], repeat: int) -> None:
+    config = RedisConfig()
+    pool = aioredis.ConnectionPool(
+        host=config.host,
+        port=config.port,
+        password=config.password,
+        protocol=config.protocol,
+        connection_class=CountingConnection,
+    )
+    cache = RedisCache(aioredis.Redis(connection_pool=pool))
+    rows: list[tuple[Any, ...]] = []
+
+    for size in sizes:
+        keys = [f"bench:bulk:{i}" for i in range(size)]
+        values = dict.fromkeys(keys, "x" * 64)
+
+        async def get_each(keys: list[str] = keys) -> None:
+            for key in keys:
+                await cache.get(key)
+
+        async def set_each(values: dict[str, str] = values) -> None:
+            for key, value in values.items():
+                await cache.set(key, value, expire=60)
+
+        async def delete_each(keys: list[str] = keys) -> None:
+            for key in keys:
+                await cache.delete_many(key)
+
+        cases: list[tuple[str, Callable[[], Awaitable[Any]], Callable[[], Awaitable[Any]]]] = [
+            ("get", get_each, functools.partial(cache.get_many, *keys)),
+            ("set", set_each, functools.partial(cache.set_many, values, expire=60)),
+            ("delete", delete_each, functools.partial(cache.delete_many, *keys)),
+        ]
+        for name, single, bulk in cases:
+            single_trips, single_latency = await measure(single, repeat)
+            bulk_trips, bulk_latency = await measure(bulk, repeat)
+            rows.append(
+                (
+                    name,
+                    size,
+                    single_trips,
+                    ms(single_latency),
+                    bulk_trips,
+                    ms(bulk_latency),
+                    f"{single_latency / bulk_latency:.1f}x",
+                )
+            )
+
+        list_trips, list_latency = await measure(
+            functools.partial(cache.set_list, "bench:bulk:list", *keys, expire=60), repeat
+        )
+        rows.append(("set_list", size, "-", "-", list_trips, ms(list_latency), "-"))
+        await cache.delete_many("bench:bulk:list", *keys)
+
+    table(
+        "RedisCache: per-key loop vs bulk operation (p50)",
+        ("op", "keys", "loop trips", "loop ms", "bulk trips", "bulk ms", "speedup"),
+        rows,
+    )
+    await cache.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Round trips and latency of bulk cache calls")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes, args.repeat))
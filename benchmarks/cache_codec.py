@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import redis.asyncio as aioredis
+
+from benchmarks._tools import atimings, ms, p50, table, timings, us
+from src.api.v1 import dto
+from src.config.core import RedisConfig
+from src.services.cache import codec
+from src.services.cache.redis import RedisCache
+
+
+def page(size: int) -> str:
+    now = datetime.now(UTC)
+    users = [
+        dto.user.User(id=uuid.uuid4(), login=f"user_{i:06d}", created_at=now) for i in range(size)
+    ]
+
+    return dto.OffsetResult[dto.user.User](
+        items=users, limit=size, offset=0, total=size * 50
+    ).as_string()
+
+
+async def redis_latency(value: str, levels: list[int], repeat: int) -> list[tuple[Any, ...]]:
+    config = RedisConfig()
+    pool = aioredis.ConnectionPool(host=config.host, port=config.port, password=config.password)
+    client = aioredis.Redis(connection_pool=pool)
+    rows = []
+
+    for level in [0, *levels]:
+        cache = RedisCache(client, compress_threshold=1024 if level else 0, compress_level=level)
+        await cache.set("bench:codec", value, expire=60)
+        set_latency = p50(
+            await atimings(functools.partial(cache.set, "bench:codec", value, 60), repeat)
+        )
+        get_latency = p50(await atimings(functools.partial(cache.get, "bench:codec"), repeat))
+        rows.append((level or "raw", ms(set_latency), ms(get_latency)))
+
+    await client.delete("bench:codec")
+    await client.aclose()
+
+    return rows
+
+
+async def main(sizes: list[int], levels: list[int], repeat: int, with_redis: bool) -> None:
+    rows: list[tuple[Any, ...]] = []
+    for size in sizes:
+        value = page(size)
+        raw = len(value.encode())
+        for level in levels:
+            encoded = codec.encode(value, threshold=1024, level=level)
+            encode = p50(timings(functools.partial(codec.encode, value, 1024, level), repeat))
+            decode = p50(timings(functools.partial(codec.decode, encoded), repeat))
+            ratio = f"{raw / len(encoded):.2f}"
+            rows.append((size, level, raw, len(encoded), ratio, us(encode), us(decode)))
+
+    table(
+        "zlib codec on cached OffsetResult pages (p50)",
+        ("users", "level", "raw B", "stored B", "ratio", "encode us", "decode us"),
+        rows,
+    )
+
+    if with_redis:
+        table(
+            f"Redis set/get of a {max(sizes)}-user page (p50)",
+            ("level", "set ms", "get ms"),
+            await redis_latency(page(max(sizes)), levels, repeat),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compression ratio, CPU cost and latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--redis", action="store_true", help="also measure Redis latency")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes, args.levels, args.repeat, args.redis))
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import uuid
+from collections.abc import Callable
+from typing import Any, cast
+
+from litestar import Litestar, Request
+from litestar.config.response_cache import default_cache_key_builder
+from litestar.datastructures import State
+from litestar.types import HTTPScope
+
+from benchmarks._tools import p50, p95, table, timings, us
+from src.api.common.bus.middlewares.cache import CacheKeyBuilder, _route
+from src.api.common.interfaces.dto import DTO
+from src.api.v1.queries.user.get import GetManyOffsetUser, GetOneUser
+
+
+_app = Litestar()
+
+
+def scope(path: str, template: str, query: bytes) -> dict[str, Any]:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "path_template": template,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query,
+        "headers": [(b"host", b"example.com")],
+        "scheme": "http",
+        "server": ("example.com", 80),
+        "app": _app,
+        "state": {},
+        "path_params": {},
+    }
+
+
+def url_key(base: dict[str, Any]) -> str:
+    request: Request[None, None, State] = Request(cast(HTTPScope, dict(base)))
+
+    return f"{request.base_url}/{default_cache_key_builder(request)}"
+
+
+def dto_key(base: dict[str, Any], qce: DTO, builder: CacheKeyBuilder) -> str:
+    request: Request[None, None, State] = Request(cast(HTTPScope, dict(base)))
+
+    return builder("qc:v0.0", _route(request), qce)
+
+
+def main(repeat: int) -> None:
+    builder = CacheKeyBuilder()
+    user_id = uuid.uuid4()
+    cases: list[tuple[str, dict[str, Any], DTO]] = [
+        (
+            "get one",
+            scope(f"/api/v1/users/{user_id}", "/api/v1/users/{user_id:uuid}", b""),
+            GetOneUser(id=user_id),
+        ),
+        (
+            "offset page",
+            scope("/api/v1/users", "/api/v1/users", b"page=30&limit=50&order_by=DESC"),
+            GetManyOffsetUser(offset=1450, limit=50, order_by="DESC"),
+        ),
+    ]
+
+    rows: list[tuple[Any, ...]] = []
+    for name, base, qce in cases:
+        strategies: list[tuple[str, Callable[[], str]]] = [
+            ("url", functools.partial(url_key, base)),
+            ("dto", functools.partial(dto_key, base, qce, builder)),
+        ]
+        for strategy, build in strategies:
+            samples = timings(build, repeat)
+            rows.append((name, strategy, us(p50(samples)), us(p95(samples)), len(build())))
+
+    table(
+        "Cache key building per request (Request construction included)",
+        ("query", "builder", "p50 us", "p95 us", "key bytes"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="URL-based vs DTO-based cache key building")
+    parser.add_argument("--repeat", type=int, default=10_000)
+    args = parser.parse_args()
+
+    main(args.repeat)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
+from datetime import UTC, datetime
+from typing import Any
+
+from benchmarks._tools import allocations, p50, p95, table, timings, us
+from src.api.v1 import dto
+from src.database.alchemy import entity
+from src.database.alchemy.types import OffsetPaginationResult
+
+
+def users(count: int) -> list[entity.User]:
+    now = datetime.now(UTC)
+
+    return [
+        entity.User(
+            id=uuid.uuid4(),
+            created_at=now,
+            updated_at=now,
+            login=f"user_{i:06d}",
+            password="x" * 60,
+        )
+        for i in range(count)
+    ]
+
+
+def as_dict_each(items: Sequence[entity.User]) -> list[dto.user.User]:
+    return [dto.user.User.from_mapping(user.as_dict()) for user in items]
+
+
+def from_attributes_each(items: Sequence[entity.User]) -> list[dto.user.User]:
+    return [dto.user.User.from_attributes(user) for user in items]
+
+
+def asdict_page(
+    page: OffsetPaginationResult[entity.User],
+) -> dto.OffsetResult[dto.user.User]:
+    return dto.OffsetResult[dto.user.User].from_mapping(asdict(page))
+
+
+def from_attributes_page(
+    page: OffsetPaginationResult[entity.User],
+) -> dto.OffsetResult[dto.user.User]:
+    return dto.OffsetResult[dto.user.User](
+        items=dto.user.User.from_attributes_many(page.items),
+        limit=page.limit or 0,
+        offset=page.offset or 0,
+        total=page.total,
+    )
+
+
+def peak(fn: Callable[[], Any]) -> int:
+    with allocations() as memory:
+        fn()
+
+    return memory[1]
+
+
+def main(sizes: list[int], repeat: int) -> None:
+    rows: list[tuple[Any, ...]] = []
+    for size in sizes:
+        items = users(size)
+        page = OffsetPaginationResult(items=items, limit=size, offset=0, total=size * 50)
+        cases: list[tuple[str, Callable[[], Any]]] = [
+            ("as_dict + from_mapping", functools.partial(as_dict_each, items)),
+            ("from_attributes", functools.partial(from_attributes_each, items)),
+            ("asdict(page) + from_mapping", functools.partial(asdict_page, page)),
+            ("from_attributes_many", functools.partial(from_attributes_page, page)),
+        ]
+        for name, fn in cases:
+            samples = timings(fn, repeat)
+            rows.append((size, name, us(p50(samples)), us(p95(samples)), f"{peak(fn) / 1024:.1f}"))
+
+    table(
+        "Entity to DTO conversion",
+        ("users", "strategy", "p50 us", "p95 us", "peak KiB"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Entity to DTO conversion cost and memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 50, 200])
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    main(args.sizes, args.repeat)
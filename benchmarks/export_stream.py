@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import msgspec
+
+from benchmarks._tools import (
+    allocations,
+    connection_factory,
+    drop_users,
+    ms,
+    read,
+    seed_users,
+    table,
+)
+from src.api.v1 import dto
+from src.api.v1.endpoints.constants import MAX_EXPORT_BATCH_SIZE, MIN_EXPORT_BATCH_SIZE
+from src.database.alchemy import entity, queries
+from src.database.alchemy.core import ConnectionFactory
+from src.database.manager import TransactionManagerImpl
+
+
+_ndjson = msgspec.json.Encoder()
+
+
+async def streamed(factory: ConnectionFactory, batch_size: int) -> int:
+    manager = TransactionManagerImpl(conn_factory=factory)
+    query = queries.raw.StreamManyAs[entity.User, dto.user.User].with_(entity.User)
+    written = 0
+    async with await manager.with_transaction(read_only=True):
+        batches = await manager.send(query(dto.user.User, batch_size=batch_size))
+        async for batch in batches:
+            written += len(_ndjson.encode_lines(batch))
+
+    return written
+
+
+async def buffered(factory: ConnectionFactory) -> int:
+    query = queries.raw.RawGetManyByOffset[entity.User, dto.user.User].with_(entity.User)
+    result = await read(factory, query(dto.user.User))
+
+    return len(_ndjson.encode_lines(result.items))
+
+
+async def measure(fn: Callable[[], Awaitable[int]]) -> tuple[int, float, int]:
+    start = time.perf_counter()
+    written = await fn()
+    elapsed = time.perf_counter() - start
+
+    with allocations() as memory:
+        await fn()
+
+    return written, elapsed, memory[1]
+
+
+async def main(users: int, batch_sizes: list[int]) -> None:
+    factory = connection_factory()
+    await drop_users(factory)
+    await seed_users(factory, users)
+
+    rows: list[tuple[Any, ...]] = []
+    try:
+        cases: list[tuple[str, Callable[[], Awaitable[int]]]] = [
+            ("buffered", functools.partial(buffered, factory)),
+            *(
+                (f"stream_as({size})", functools.partial(streamed, factory, size))
+                for size in batch_sizes
+            ),
+        ]
+        for name, fn in cases:
+            written, elapsed, peak = await measure(fn)
+            rows.append(
+                (
+                    name,
+                    ms(elapsed),
+                    f"{users / elapsed:,.0f}",
+                    f"{written / elapsed / 2**20:.1f}",
+                    f"{peak / 2**20:.1f}",
+                )
+            )
+    finally:
+        await drop_users(factory)
+        await factory.engine.dispose()
+
+    table(
+        f"NDJSON export of {users} users",
+        ("path", "total ms", "rows/s", "MiB/s", "peak MiB"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export throughput and memory by batch size")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[MIN_EXPORT_BATCH_SIZE, MIN_EXPORT_BATCH_SIZE * 10, MAX_EXPORT_BATCH_SIZE],
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.batch_sizes))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from benchmarks._tools import connection_factory, drop_users, ms, p50, table, user_rows, write
+from src.api.v1.endpoints.constants import IMPORT_CHUNK_SIZE
+from src.database.alchemy import entity, queries
+from src.database.alchemy.core import ConnectionFactory
+
+
+async def batch_create(factory: ConnectionFactory, rows: Mapping[int, dict[str, Any]]) -> None:
+    await write(factory, queries.base.BatchCreate.with_(entity.User)(list(rows.values())))
+
+
+async def copy_create(factory: ConnectionFactory, rows: Mapping[int, dict[str, Any]]) -> None:
+    await write(factory, queries.raw.CopyCreate.with_(entity.User)(rows, ("login", "password")))
+
+
+async def measure(
+    factory: ConnectionFactory, name: str, size: int, chunk: int, repeat: int
+) -> list[float]:
+    insert = copy_create if name == "CopyCreate" else batch_create
+    chunks = [
+        dict(enumerate(user_rows(min(chunk, size - start), start), start + 1))
+        for start in range(0, size, chunk)
+    ]
+
+    samples = []
+    for _ in range(repeat):
+        await drop_users(factory)
+        start = time.perf_counter()
+        for rows in chunks:
+            await insert(factory, rows)
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+
+async def main(sizes: list[int], chunk: int, repeat: int) -> None:
+    factory = connection_factory()
+    rows: list[tuple[Any, ...]] = []
+
+    try:
+        for size in sizes:
+            for name in ("BatchCreate", "CopyCreate"):
+                elapsed = p50(await measure(factory, name, size, chunk, repeat))
+                rows.append((size, name, ms(elapsed), f"{size / elapsed:,.0f}"))
+    finally:
+        await drop_users(factory)
+        await factory.engine.dispose()
+
+    table(
+        f"User import in chunks of {chunk} rows (p50)",
+        ("rows", "query", "total ms", "rows/s"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import throughput of COPY vs multi-row INSERT")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--chunk", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes, args.chunk, args.repeat))
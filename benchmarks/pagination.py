@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+from typing import Any
+
+from benchmarks._tools import (
+    atimings,
+    connection_factory,
+    drop_users,
+    ms,
+    p50,
+    p95,
+    read,
+    seed_users,
+    table,
+)
+from src.database.alchemy import entity, queries
+from src.database.alchemy.core import ConnectionFactory
+from src.database.alchemy.types import CursorPaginationResult
+
+
+async def by_offset(factory: ConnectionFactory, offset: int, limit: int) -> int:
+    result = await read(
+        factory, queries.base.GetManyByOffset.with_(entity.User)(offset=offset, limit=limit)
+    )
+
+    return len(result.items)
+
+
+async def cursor_page(
+    factory: ConnectionFactory, cursor: str | None, limit: int
+) -> CursorPaginationResult[str, entity.User]:
+    return await read(
+        factory,
+        queries.base.GetManyByCursor.with_(entity.User)(
+            limit=limit, cursor=cursor, cursor_type="UUID"
+        ),
+    )
+
+
+async def by_cursor(factory: ConnectionFactory, cursor: str | None, limit: int) -> int:
+    return len((await cursor_page(factory, cursor, limit)).items)
+
+
+async def cursors(factory: ConnectionFactory, last: int, limit: int) -> list[str | None]:
+    found: list[str | None] = [None]
+    while len(found) < last:
+        found.append((await cursor_page(factory, found[-1], limit)).cursor)
+
+    return found
+
+
+async def main(pages: list[int], limit: int, repeat: int) -> None:
+    factory = connection_factory()
+    await drop_users(factory)
+    await seed_users(factory, max(pages) * limit)
+
+    rows: list[tuple[Any, ...]] = []
+    try:
+        tokens = await cursors(factory, max(pages), limit)
+        for page in pages:
+            offset = await atimings(
+                functools.partial(by_offset, factory, (page - 1) * limit, limit), repeat
+            )
+            cursor = await atimings(
+                functools.partial(by_cursor, factory, tokens[page - 1], limit), repeat
+            )
+            rows.append(
+                (
+                    page,
+                    ms(p50(offset)),
+                    ms(p95(offset)),
+                    ms(p50(cursor)),
+                    ms(p95(cursor)),
+                    f"{p50(offset) / p50(cursor):.1f}x",
+                )
+            )
+    finally:
+        await drop_users(factory)
+        await factory.engine.dispose()
+
+    table(
+        f"Offset vs keyset pagination, {limit} users per page",
+        ("page", "offset p50 ms", "offset p95 ms", "cursor p50 ms", "cursor p95 ms", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deep-page latency of offset vs cursor paging")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.pages, args.limit, args.repeat))
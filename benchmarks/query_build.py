@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.util import LRUCache
+
+from benchmarks._tools import p50, p95, table, timings, us
+from src.database.alchemy import entity
+from src.database.alchemy.queries import base
+from src.database.alchemy.queries import statements as st
+from src.database.alchemy.tools import select_with_relations
+
+
+_dialect = create_async_engine("postgresql+asyncpg://").dialect
+
+
+def type_per_call() -> type[Any]:
+    return type(base.GetOne.__name__, (base.GetOne,), {"_entity": entity.User})
+
+
+def memoised() -> type[Any]:
+    return base.GetOne.with_(entity.User)
+
+
+def old_get_one(login: str) -> sa.Select[Any]:
+    return select_with_relations(entity=entity.User).where(entity.User.login == login)
+
+
+def new_get_one(login: str) -> sa.Select[Any]:
+    return st.get_one(entity.User, (), ("login",), False, ())
+
+
+def old_offset(login: str) -> sa.Select[Any]:
+    return (
+        select_with_relations(entity=entity.User)
+        .limit(50)
+        .offset(1450)
+        .order_by(entity.User.id.asc())
+        .where(entity.User.login == login)
+    )
+
+
+def new_offset(login: str) -> sa.Select[Any]:
+    return st.get_many_by_offset(entity.User, (), ("login",), "asc", True, True, ())
+
+
+def compile_cached(build: Callable[[str], sa.Select[Any]], cache: LRUCache[Any, Any]) -> None:
+    stmt = build(f"user_{uuid.uuid4().hex[:8]}")
+    stmt._compile_w_cache(_dialect, compiled_cache=cache, column_keys=[])
+
+
+def main(repeat: int) -> None:
+    rows: list[tuple[Any, ...]] = []
+    for name, fn in (("type() per call", type_per_call), ("with_ memoised", memoised)):
+        samples = timings(fn, repeat)
+        rows.append(("with_", name, us(p50(samples)), us(p95(samples)), "-"))
+
+    cases: list[tuple[str, str, Callable[[str], sa.Select[Any]]]] = [
+        ("GetOne", "built per call", old_get_one),
+        ("GetOne", "prebuilt", new_get_one),
+        ("GetManyByOffset", "built per call", old_offset),
+        ("GetManyByOffset", "prebuilt", new_offset),
+    ]
+    for query, strategy, build in cases:
+        cache: LRUCache[Any, Any] = LRUCache(500)
+        measured = [
+            ("build", timings(functools.partial(build, "user_000001"), repeat)),
+            ("build + compile", timings(functools.partial(compile_cached, build, cache), repeat)),
+        ]
+        for step, samples in measured:
+            entries = len(cache) if step != "build" else "-"
+            rows.append((query, f"{strategy}: {step}", us(p50(samples)), us(p95(samples)), entries))
+
+    table(
+        "Query class and statement construction",
+        ("query", "strategy", "p50 us", "p95 us", "cache entries"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="with_ specialisation and statement build cost")
+    parser.add_argument("--repeat", type=int, default=5_000)
+    args = parser.parse_args()
+
+    main(args.repeat)
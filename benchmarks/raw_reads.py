@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from benchmarks._tools import (
+    LOGIN_PREFIX,
+    atimings,
+    connection_factory,
+    drop_users,
+    ms,
+    p50,
+    p95,
+    read,
+    seed_users,
+    table,
+)
+from src.api.v1 import dto
+from src.database.alchemy import entity, queries
+from src.database.alchemy.core import ConnectionFactory
+
+
+async def orm_one(factory: ConnectionFactory, login: str) -> int:
+    found = await read(factory, queries.base.GetOne.with_(entity.User)(login=login))
+    assert found is not None
+    dto.user.User.from_attributes(found)
+
+    return 1
+
+
+async def raw_one(factory: ConnectionFactory, login: str) -> int:
+    query = queries.raw.RawGetOne[entity.User, dto.user.User].with_(entity.User)
+    found = await read(factory, query(dto.user.User, login=login))
+    assert found is not None
+
+    return 1
+
+
+async def orm_page(factory: ConnectionFactory, limit: int) -> int:
+    result = await read(
+        factory, queries.base.GetManyByOffset.with_(entity.User)(offset=0, limit=limit)
+    )
+
+    return len(dto.user.User.from_attributes_many(result.items))
+
+
+async def raw_page(factory: ConnectionFactory, limit: int) -> int:
+    query = queries.raw.RawGetManyByOffset[entity.User, dto.user.User].with_(entity.User)
+    result = await read(factory, query(dto.user.User, offset=0, limit=limit))
+
+    return len(result.items)
+
+
+async def main(users: int, limits: list[int], repeat: int) -> None:
+    factory = connection_factory()
+    await drop_users(factory)
+    await seed_users(factory, users)
+
+    login = f"{LOGIN_PREFIX}{users // 2:08d}"
+    cases: list[tuple[str, str, Callable[[], Awaitable[int]]]] = [
+        ("get one", "orm", functools.partial(orm_one, factory, login)),
+        ("get one", "raw", functools.partial(raw_one, factory, login)),
+    ]
+    for limit in limits:
+        cases.append((f"page of {limit}", "orm", functools.partial(orm_page, factory, limit)))
+        cases.append((f"page of {limit}", "raw", functools.partial(raw_page, factory, limit)))
+
+    rows: list[tuple[Any, ...]] = []
+    try:
+        for name, path, fn in cases:
+            count = await fn()
+            samples = await atimings(fn, repeat)
+            rows.append(
+                (name, path, ms(p50(samples)), ms(p95(samples)), f"{count / p50(samples):,.0f}")
+            )
+    finally:
+        await drop_users(factory)
+        await factory.engine.dispose()
+
+    table(
+        f"ORM vs raw asyncpg reads into dto.user.User ({users} users)",
+        ("query", "path", "p50 ms", "p95 ms", "rows/s"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ORM vs raw read latency and throughput")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--limits", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.limits, args.repeat))
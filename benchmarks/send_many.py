@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks._tools import atimings, connection_factory, ms, p50, p95, table
+from src.database.alchemy.core import ConnectionFactory
+from src.database.interfaces.query import Query
+from src.database.manager import TransactionManagerImpl
+
+
+class Sleep(Query[AsyncSession, None]):
+    __slots__ = ("_seconds",)
+
+    def __init__(self, seconds: float) -> None:
+        self._seconds = seconds
+
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> None:
+        await conn.execute(sa.select(sa.func.pg_sleep(self._seconds)))
+
+
+async def sequential(factory: ConnectionFactory, fan_out: int, seconds: float) -> None:
+    manager = TransactionManagerImpl(conn_factory=factory)
+    async with await manager.with_transaction(read_only=True):
+        for _ in range(fan_out):
+            await manager.send(Sleep(seconds))
+
+
+async def concurrent(factory: ConnectionFactory, fan_out: int, seconds: float) -> None:
+    manager = TransactionManagerImpl(conn_factory=factory)
+    async with await manager.with_transaction(read_only=True):
+        await manager.send_many(*(Sleep(seconds) for _ in range(fan_out)))
+
+
+async def main(fan_outs: list[int], query_ms: float, repeat: int) -> None:
+    factory = connection_factory()
+    seconds = query_ms / 1e3
+    rows: list[tuple[Any, ...]] = []
+
+    try:
+        for fan_out in fan_outs:
+            one = await atimings(functools.partial(sequential, factory, fan_out, seconds), repeat)
+            many = await atimings(functools.partial(concurrent, factory, fan_out, seconds), repeat)
+            rows.append(
+                (
+                    fan_out,
+                    ms(p50(one)),
+                    ms(p95(one)),
+                    ms(p50(many)),
+                    ms(p95(many)),
+                    f"{p50(one) / p50(many):.1f}x",
+                )
+            )
+    finally:
+        await factory.engine.dispose()
+
+    table(
+        f"Independent {query_ms:g} ms reads: sequential send vs send_many",
+        ("fan-out", "send p50 ms", "send p95 ms", "many p50 ms", "many p95 ms", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latency of sequential vs concurrent reads")
+    parser.add_argument("--fan-outs", type=int, nargs="+", default=[2, 5, 10])
+    parser.add_argument("--query-ms", type=float, default=5.0, help="server time per query")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.fan_outs, args.query_ms, args.repeat))
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks._tools import allocations, atimings, connection_factory, p50, p95, table, us
+from src.database.alchemy.core import ConnectionFactory
+from src.database.interfaces.query import Query
+from src.database.manager import TransactionManagerImpl
+
+
+class SelectOne(Query[AsyncSession, int]):
+    __slots__ = ()
+
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> int:
+        return (await conn.execute(sa.select(sa.literal(1)))).scalar_one()
+
+
+def eager(factory: ConnectionFactory) -> TransactionManagerImpl:
+    sessionmaker = async_sessionmaker(factory.engine, expire_on_commit=False, autoflush=False)
+
+    return TransactionManagerImpl(conn=sessionmaker())
+
+
+def lazy(factory: ConnectionFactory) -> TransactionManagerImpl:
+    return TransactionManagerImpl(conn_factory=factory)
+
+
+async def request(
+    make: Callable[[ConnectionFactory], TransactionManagerImpl],
+    factory: ConnectionFactory,
+    miss: bool,
+) -> None:
+    async with make(factory) as manager:
+        if miss:
+            await manager.send(SelectOne())
+
+
+async def peak(fn: Callable[[], Awaitable[Any]]) -> int:
+    with allocations() as memory:
+        await fn()
+
+    return memory[1]
+
+
+async def main(repeat: int, with_db: bool) -> None:
+    factory = connection_factory()
+    rows: list[tuple[Any, ...]] = []
+
+    for outcome in ("hit", "miss") if with_db else ("hit",):
+        for name, make in (("per-call sessionmaker, eager", eager), ("lazy manager", lazy)):
+            fn = functools.partial(request, make, factory, outcome == "miss")
+            samples = await atimings(fn, repeat)
+            memory = await peak(fn)
+            rows.append((outcome, name, us(p50(samples)), us(p95(samples)), f"{memory / 1024:.1f}"))
+
+    await factory.engine.dispose()
+
+    table(
+        "Per-request manager cost on response cache hits and misses",
+        ("cache", "manager", "p50 us", "p95 us", "peak KiB"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Session setup cost per request")
+    parser.add_argument("--repeat", type=int, default=2_000)
+    parser.add_argument("--db", action="store_true", help="also measure misses against Postgres")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.repeat, args.db))
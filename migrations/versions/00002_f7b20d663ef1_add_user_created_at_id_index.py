@@ -0,0 +1,38 @@
+"""add_user_created_at_id_index
+
+Revision ID: 00002_f7b20d663ef1
+Revises: 00001_732b95cb714f
+Create Date: 2026-10-19 12:04:11.209381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '00002_f7b20d663ef1'
+down_revision: Union[str, None] = '00001_732b95cb714f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_user_created_at_id',
+            'user',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_user_created_at_id',
+            table_name='user',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
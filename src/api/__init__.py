@@ -8,12 +8,12 @@ from litestar.openapi.config import OpenAPIConfig
 from litestar.openapi.plugins import SwaggerRenderPlugin
 from litestar.stores.redis import RedisStore
 from litestar.stores.registry import StoreRegistry
-from redis.asyncio.client import Redis
 
 from src.api.common.exceptions import current_common_exc_handlers
 from src.api.common.middlewares import current_common_middlewares
 from src.api.common.tools import ClosableProxy, RouterState
 from src.config.core import Config
+from src.services.cache.pool import close_redis_pools, redis_client
 
 
 @asynccontextmanager
@@ -25,6 +25,8 @@ async def lifespan(app: Litestar) -> AsyncIterator[None]:
             if isinstance(value, ClosableProxy):
                 await value.close()
 
+        await close_redis_pools()
+
 
 def on_app_init(config: Config, *router_state: RouterState) -> Callable[[AppConfig], AppConfig]:
     def wrapped(app_config: AppConfig) -> AppConfig:
@@ -75,8 +77,8 @@ def init_app(config: Config, *router_state: RouterState) -> Litestar:
         on_app_init=[on_app_init(config, *router_state)],
         stores=StoreRegistry(
             default_factory=lambda _: RedisStore(
-                Redis(**config.redis.model_dump(), decode_responses=False),
-                handle_client_shutdown=True,
+                redis_client(config.redis, config.app.metrics),
+                handle_client_shutdown=False,
             )
         ),
     )
@@ -1,19 +1,79 @@
+import hashlib
+import time
 from dataclasses import dataclass, field
-from typing import Any, cast, override
+from functools import lru_cache
+from typing import Any, Final, cast, override
 
+import msgspec
 from litestar import Request
-from litestar.config.response_cache import default_cache_key_builder
 from litestar.datastructures import State
 
 from src.api.common.interfaces.dto import DTO
 from src.api.common.interfaces.middleware import CallNextHandlerMiddlewareType, HandlerMiddleware
-from src.services.interfaces.cache import StrCache
+from src.api.common.tools import msgspec_decoder, msgspec_encoder
+from src.common.exceptions import NotFoundError
+from src.services.cache import metrics
+from src.services.cache.hotkeys import HotKeyTracker
+from src.services.interfaces.cache import Guarded, StrCache
+
+
+DEFAULT_CACHE_NAMESPACE: Final[str] = "qc"
+NEGATIVE_MARKER: Final[str] = "\x15"
+SETTLING_SUFFIX: Final[str] = "settling"
+
+_encoder = msgspec.msgpack.Encoder()
+
+
+def _route(request: Request[None, None, State]) -> str:
+    return request.scope.get("path_template", request.url.path)
+
+
+def _labels(request: Request[None, None, State], qce: DTO) -> tuple[str, str]:
+    return _route(request), type(qce).__name__
+
+
+def _bypassed(cache: StrCache) -> bool:
+    return isinstance(cache, Guarded) and not cache.available
+
+
+def _settling_key(namespace: str) -> str:
+    return f"{namespace}:{SETTLING_SUFFIX}"
+
+
+def _lookup_result(value: str | None) -> str:
+    if not value:
+        return "miss"
+
+    return "negative" if value.startswith(NEGATIVE_MARKER) else "hit"
+
+
+@lru_cache(maxsize=1024)
+def _key_prefix(route: str, dto: type[object]) -> str:
+    return hashlib.blake2b(f"{route}|{dto.__qualname__}".encode(), digest_size=4).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheKeyBuilder:
+    digest_size: int = 16
+
+    def __call__(self, namespace: str, route: str, qce: DTO, **kw: Any) -> str:
+        payload = _encoder.encode((qce, kw) if kw else qce)
+        digest = hashlib.blake2b(payload, digest_size=self.digest_size).hexdigest()
+
+        return f"{namespace}:{_key_prefix(route, type(qce))}:{digest}"
 
 
 @dataclass(frozen=True, slots=True)
 class CacheMiddleware(HandlerMiddleware[Request[None, None, State] | None]):
     cache: StrCache
     cache_time: float = field(default=10)
+    namespace: str = field(default=DEFAULT_CACHE_NAMESPACE)
+    key_builder: CacheKeyBuilder = field(default_factory=CacheKeyBuilder)
+    negative_types: frozenset[type[DTO]] = field(default_factory=frozenset)
+    negative_cache_time: float = field(default=5)
+    with_metrics: bool = field(default=False)
+    hot_keys: HotKeyTracker | None = field(default=None)
+    settle: bool = field(default=False)
 
     @override
     async def __call__[Q: DTO, R: DTO | None](
@@ -27,21 +87,68 @@ class CacheMiddleware(HandlerMiddleware[Request[None, None, State] | None]):
         if not request:
             return await call_next(request, qce, **kw)
 
-        key = f"{request.base_url}/{default_cache_key_builder(request)}"
-        value = await self.cache.get(key)
+        route = _route(request)
+        if self.hot_keys is not None and self.hot_keys.sampled():
+            self.hot_keys.add(f"{route} {type(qce).__name__} {qce.as_string()}")
+
+        labels = _labels(request, qce) if self.with_metrics else None
+        if _bypassed(self.cache):
+            if labels:
+                metrics.CACHE_REQUESTS.labels(*labels, "bypass").inc()
+
+            return await call_next(request, qce, **kw)
+
+        key = self.key_builder(await self.cache.namespace(self.namespace), route, qce, **kw)
+        value = await self._lookup(key, labels)
         if value:
+            if value.startswith(NEGATIVE_MARKER):
+                raise NotFoundError(**msgspec_decoder(value[len(NEGATIVE_MARKER) :]))
+
             return cast(R, value)
 
-        result: R = await call_next(request, qce, **kw)
-        if isinstance(result, DTO):
-            await self.cache.set(key, result.as_string(), expire=self.cache_time)
+        try:
+            result: R = await call_next(request, qce, **kw)
+        except NotFoundError as e:
+            if type(qce) in self.negative_types and not await self._settling():
+                await self.cache.set(
+                    key,
+                    f"{NEGATIVE_MARKER}{msgspec_encoder(e.content)}",
+                    expire=self.negative_cache_time,
+                )
+            raise
+        if isinstance(result, DTO) and not await self._settling():
+            await self._store(key, result, labels)
 
         return result
 
+    async def _settling(self) -> bool:
+        return self.settle and await self.cache.exists(_settling_key(self.namespace))
+
+    async def _lookup(self, key: str, labels: tuple[str, str] | None) -> str | None:
+        start = time.perf_counter()
+        value = await self.cache.get(key)
+        if labels:
+            metrics.CACHE_LATENCY.labels("get").observe(time.perf_counter() - start)
+            metrics.CACHE_REQUESTS.labels(*labels, _lookup_result(value)).inc()
+
+        return value
+
+    async def _store(self, key: str, result: DTO, labels: tuple[str, str] | None) -> None:
+        encoded = result.as_string()
+
+        start = time.perf_counter()
+        await self.cache.set(key, encoded, expire=self.cache_time)
+        if labels:
+            metrics.CACHE_LATENCY.labels("set").observe(time.perf_counter() - start)
+            metrics.CACHE_VALUE_SIZE.labels(*labels).observe(len(encoded))
+
 
 @dataclass(frozen=True, slots=True)
 class CacheInvalidateMiddleware(HandlerMiddleware[Request[None, None, State] | None]):
     cache: StrCache
+    namespace: str = field(default=DEFAULT_CACHE_NAMESPACE)
+    with_metrics: bool = field(default=False)
+    settle_time: float = field(default=0)
 
     @override
     async def __call__[Q: DTO, R: DTO | None](
@@ -55,6 +162,14 @@ class CacheInvalidateMiddleware(HandlerMiddleware[Request[None, None, State] | N
         if not request:
             return await call_next(request, qce, **kw)
 
-        await self.cache.delete(f"{request.base_url}*")
+        result: R = await call_next(request, qce, **kw)
+
+        if self.settle_time:
+            await self.cache.set(_settling_key(self.namespace), "1", expire=self.settle_time)
 
-        return await call_next(request, qce, **kw)
+        start = time.perf_counter()
+        await self.cache.invalidate(self.namespace)
+        if self.with_metrics:
+            metrics.CACHE_LATENCY.labels("invalidate").observe(time.perf_counter() - start)
+
+        return result
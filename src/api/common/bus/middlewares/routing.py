@@ -0,0 +1,110 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Final, override
+
+from litestar import Request
+from litestar.datastructures import State
+
+from src.api.common.interfaces.dto import DTO
+from src.api.common.interfaces.middleware import CallNextHandlerMiddlewareType, HandlerMiddleware
+from src.database.alchemy.routing import prefer_primary
+from src.services.interfaces.cache import StrCache
+
+
+SESSION_HEADER: Final[str] = "x-session-id"
+RECENT_WRITES_PREFIX: Final[str] = "ryw"
+
+
+def _session_key(request: Request[None, None, State] | None) -> str | None:
+    return request.headers.get(SESSION_HEADER) or None if request else None
+
+
+class RecentWrites:
+    __slots__ = (
+        "_window",
+        "_capacity",
+        "_deadlines",
+        "_shared",
+    )
+
+    def __init__(
+        self, window: float, capacity: int = 65_536, shared: StrCache | None = None
+    ) -> None:
+        self._window = window
+        self._capacity = capacity
+        self._deadlines: OrderedDict[str, float] = OrderedDict()
+        self._shared = shared
+
+    async def mark(self, key: str) -> None:
+        self._remember(key)
+        if self._shared is not None:
+            await self._shared.set(f"{RECENT_WRITES_PREFIX}:{key}", "1", expire=self._window)
+
+    async def recent(self, key: str) -> bool:
+        if self._recent_locally(key):
+            return True
+        if self._shared is None or not await self._shared.exists(f"{RECENT_WRITES_PREFIX}:{key}"):
+            return False
+
+        # another worker took the write; remember it so later reads skip the shared lookup
+        self._remember(key)
+
+        return True
+
+    def _remember(self, key: str) -> None:
+        self._deadlines[key] = time.monotonic() + self._window
+        self._deadlines.move_to_end(key)
+        while len(self._deadlines) > self._capacity:
+            self._deadlines.popitem(last=False)
+
+    def _recent_locally(self, key: str) -> bool:
+        deadline = self._deadlines.get(key)
+        if deadline is None:
+            return False
+        if deadline < time.monotonic():
+            del self._deadlines[key]
+            return False
+
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class TrackWritesMiddleware(HandlerMiddleware[Request[None, None, State] | None]):
+    writes: RecentWrites
+
+    @override
+    async def __call__[Q: DTO, R: DTO | None](
+        self,
+        call_next: CallNextHandlerMiddlewareType,
+        request: Request[None, None, State] | None,
+        qce: Q,
+        /,
+        **kw: Any,
+    ) -> R:
+        result: R = await call_next(request, qce, **kw)
+        if key := _session_key(request):
+            await self.writes.mark(key)
+
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class ReadYourWritesMiddleware(HandlerMiddleware[Request[None, None, State] | None]):
+    writes: RecentWrites
+
+    @override
+    async def __call__[Q: DTO, R: DTO | None](
+        self,
+        call_next: CallNextHandlerMiddlewareType,
+        request: Request[None, None, State] | None,
+        qce: Q,
+        /,
+        **kw: Any,
+    ) -> R:
+        key = _session_key(request)
+        if not key or not await self.writes.recent(key):
+            return await call_next(request, qce, **kw)
+
+        with prefer_primary():
+            return await call_next(request, qce, **kw)
@@ -1,7 +1,8 @@
 import uuid
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Self, override
 
 import msgspec
@@ -25,6 +26,11 @@ def _convert_to[T](cls: type[T], value: Any, **kw: Any) -> T:
     )
 
 
+@lru_cache(maxsize=256)
+def _list_of(cls: type[Any]) -> Any:
+    return list.__class_getitem__(cls)
+
+
 def _convert_from(value: Any, **kw: Any) -> Any:
     return msgspec.to_builtins(
         value,
@@ -57,6 +63,17 @@ class BaseDTO(msgspec.Struct):
     def from_attributes(cls, value: Any) -> Self:
         return _convert_to(cls, value, strict=False, from_attributes=True)
 
+    @classmethod
+    def from_attributes_many(cls, values: Iterable[Any]) -> list[Self]:
+        result: list[Self] = _convert_to(
+            _list_of(cls),
+            values if isinstance(values, list | tuple) else list(values),
+            strict=False,
+            from_attributes=True,
+        )
+
+        return result
+
     @classmethod
     def from_bytes(cls, value: bytes) -> Self:
         return _convert_to(cls, msgpack_decoder(value, strict=False), strict=False)
@@ -103,6 +120,18 @@ class StrictBaseDTO(BaseDTO):
     def from_attributes(cls, value: Any) -> Self:
         return _convert_to(cls, value, strict=True, from_attributes=True)
 
+    @override
+    @classmethod
+    def from_attributes_many(cls, values: Iterable[Any]) -> list[Self]:
+        result: list[Self] = _convert_to(
+            _list_of(cls),
+            values if isinstance(values, list | tuple) else list(values),
+            strict=True,
+            from_attributes=True,
+        )
+
+        return result
+
     @override
     @classmethod
     def from_bytes(cls, value: bytes) -> Self:
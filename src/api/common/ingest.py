@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import csv
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from typing import Final, Literal
+
+import msgspec
+
+from src.api.common.dto import BaseDTO
+
+
+type IngestFormat = Literal["ndjson", "csv"]
+
+MAX_RECORD_SIZE: Final[int] = 1024 * 1024
+MAX_RECORD_LINES: Final[int] = 1_000
+
+_DECODE_ERRORS = (msgspec.ValidationError, msgspec.DecodeError, UnicodeDecodeError, ValueError)
+
+
+class _Incomplete(Exception):
+    pass
+
+
+class _Feed(Iterator[str]):
+    __slots__ = ("_lines",)
+
+    def __init__(self) -> None:
+        self._lines: deque[str] = deque()
+
+    def push(self, *lines: str) -> None:
+        self._lines.extend(lines)
+
+    def clear(self) -> None:
+        self._lines.clear()
+
+    def __next__(self) -> str:
+        if not self._lines:
+            raise _Incomplete
+
+        return self._lines.popleft()
+
+
+async def read_lines(stream: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for chunk in stream:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            yield bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+        del buffer[:start]
+
+    if buffer:
+        yield bytes(buffer).rstrip(b"\r")
+
+
+async def _ndjson_rows[T: BaseDTO](
+    stream: AsyncIterable[bytes], into: type[T]
+) -> AsyncIterator[T | None]:
+    decoder = msgspec.json.Decoder(into)
+    async for line in read_lines(stream):
+        if not line.strip():
+            continue
+
+        try:
+            yield decoder.decode(line)
+        except _DECODE_ERRORS:
+            yield None
+
+
+async def _csv_records(stream: AsyncIterable[bytes]) -> AsyncIterator[list[str] | None]:
+    feed = _Feed()
+    reader = csv.reader(feed)
+    pending: list[str] = []
+    size = 0
+
+    async for line in read_lines(stream):
+        if not pending and not line.strip():
+            continue
+
+        size += len(line)
+        record: list[str] | None
+        try:
+            pending.append(line.decode() + "\n")
+            # the reader starts over on every call and pulls continuation lines only while
+            # it is inside a quoted field, so replay the lines of the unfinished record
+            feed.push(*pending)
+            record = next(reader)
+        except _Incomplete:
+            if size <= MAX_RECORD_SIZE and len(pending) < MAX_RECORD_LINES:
+                continue
+            record = None
+        except (csv.Error, UnicodeDecodeError):
+            record = None
+
+        feed.clear()
+        pending.clear()
+        size = 0
+        yield record
+
+    if pending:
+        yield None
+
+
+async def _csv_rows[T: BaseDTO](
+    stream: AsyncIterable[bytes], into: type[T]
+) -> AsyncIterator[T | None]:
+    header: list[str] | None = None
+
+    async for record in _csv_records(stream):
+        if header is None:
+            if record is None:
+                raise csv.Error("CSV header cannot be parsed")
+            header = record
+            continue
+
+        value: T | None = None
+        if record is not None:
+            try:
+                value = into.from_mapping(dict(zip(header, record, strict=True)))
+            except _DECODE_ERRORS:
+                value = None
+
+        yield value
+
+
+async def read_rows[T: BaseDTO](
+    stream: AsyncIterable[bytes], into: type[T], format: IngestFormat
+) -> AsyncIterator[tuple[int, T | None]]:
+    rows = _csv_rows(stream, into) if format == "csv" else _ndjson_rows(stream, into)
+    row = 0
+
+    async for value in rows:
+        row += 1
+        yield row, value
+
+
+async def read_chunks[T: BaseDTO](
+    stream: AsyncIterable[bytes], into: type[T], format: IngestFormat, size: int
+) -> AsyncIterator[tuple[dict[int, T], list[int]]]:
+    rows: dict[int, T] = {}
+    invalid: list[int] = []
+
+    async for row, value in read_rows(stream, into, format):
+        if value is None:
+            invalid.append(row)
+        else:
+            rows[row] = value
+
+        if len(rows) >= size:
+            yield rows, invalid
+            rows, invalid = {}, []
+
+    if rows or invalid:
+        yield rows, invalid
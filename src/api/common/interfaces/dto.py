@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, Protocol, Self, runtime_checkable
 
 
@@ -21,6 +21,8 @@ class Deserializable(Protocol):
     def from_bytes(cls, value: bytes) -> Self: ...
     @classmethod
     def from_attributes(cls, value: Any) -> Self: ...
+    @classmethod
+    def from_attributes_many(cls, values: Iterable[Any]) -> list[Self]: ...
 
 
 @runtime_checkable
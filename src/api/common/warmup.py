@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
+from typing import Any, Final
+
+from src.api.common.interfaces.bus import QCBusType
+from src.api.common.interfaces.dto import DTO
+from src.api.common.tools import msgspec_decoder, msgspec_encoder
+from src.common.exceptions import AppException
+from src.services.cache.hotkeys import HotKeyTracker
+from src.services.interfaces.cache import StrCache
+
+
+log = logging.getLogger(__name__)
+
+type WarmUpStep = Callable[[], Awaitable[Any]]
+
+
+class WarmUp:
+    __slots__ = (
+        "_steps",
+        "_finalizers",
+        "_timeout",
+        "_ready",
+        "_task",
+    )
+
+    def __init__(
+        self,
+        *steps: WarmUpStep,
+        finalizers: Sequence[WarmUpStep] = (),
+        timeout: float | None = None,
+    ) -> None:
+        self._steps = steps
+        self._finalizers = finalizers
+        self._timeout = timeout
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def wait(self) -> None:
+        await self._ready.wait()
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+
+        if not self._steps:
+            self._ready.set()
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        for finalizer in self._finalizers:
+            try:
+                await finalizer()
+            except Exception as e:
+                log.warning(
+                    f"Warm-up finalizer {_name(finalizer)} failed: {type(e).__name__} -> {e}"
+                )
+
+    async def _run(self) -> None:
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self._timeout):
+                for step in self._steps:
+                    try:
+                        await step()
+                    except Exception as e:
+                        log.warning(f"Warm-up step {_name(step)} failed: {type(e).__name__} -> {e}")
+        except TimeoutError:
+            log.warning(f"Warm-up timed out after {self._timeout}s")
+        finally:
+            self._ready.set()
+
+        log.info(f"Warm-up finished in {time.perf_counter() - start:.3f}s")
+
+
+def _name(step: WarmUpStep) -> str:
+    func = getattr(step, "func", step)
+
+    return getattr(func, "__qualname__", None) or type(func).__name__
+
+
+HOT_KEYS_KEY: Final = "__hot_keys__"
+
+
+async def persist_hot_keys(
+    cache: StrCache, hot_keys: HotKeyTracker, limit: int, expire: float | None = None
+) -> None:
+    if keys := [key for key, _ in hot_keys.top(limit)]:
+        await cache.set(HOT_KEYS_KEY, msgspec_encoder(keys), expire=expire)
+
+
+async def preload_hot_keys(
+    cache: StrCache, query_bus: QCBusType, limit: int, *types: type[DTO]
+) -> None:
+    value = await cache.get(HOT_KEYS_KEY)
+    if not value:
+        return
+
+    registry = {t.__name__: t for t in types}
+    for key in msgspec_decoder(value)[:limit]:
+        _, name, payload = key.split(" ", 2)
+        if (qc := registry.get(name)) is None:
+            continue
+
+        with suppress(AppException):
+            await query_bus(None, qc.from_string(payload))
@@ -12,4 +12,4 @@ def init_v1_router(*sub_routers: Router, path: str = "/v1", config: Config) -> t
     setup_controllers(router)
     state = setup_v1_dependencies(router, config)
 
-    return tools.RouterState(router=router, state=state)
+    return tools.RouterState(router=router, state=state, on_startup=[state.warm_up.start])
@@ -20,6 +20,13 @@ class CommandBus(Protocol):
         /,
     ) -> AwaitableProxy[user.create.CreateUserHandler]: ...
     @overload
+    def send_unwrapped(
+        self,
+        request: Request[None, None, State],
+        qc: user.bulk.ImportUsers,
+        /,
+    ) -> AwaitableProxy[user.bulk.ImportUsersHandler]: ...
+    @overload
     def send_unwrapped(
         self,
         request: Request[None, None, State],
@@ -1,3 +1,4 @@
+from src.api.v1.commands.user import bulk as bulk
 from src.api.v1.commands.user import create as create
 from src.api.v1.commands.user import delete as delete
 from src.api.v1.commands.user import update as update
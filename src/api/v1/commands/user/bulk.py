@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Any, override
+
+from litestar import Request
+from litestar.datastructures import State
+
+from src.api.common.interfaces.handler import Handler
+from src.api.v1 import dto
+from src.api.v1.commands.user.create import CreateUser
+from src.services.gateway import ServiceGateway
+from src.services.internal.user.types import UserCreate
+
+
+class ImportUsers(dto.BaseDTO):
+    rows: dict[int, CreateUser]
+
+
+@dataclass(frozen=True, slots=True)
+class ImportUsersHandler(Handler[Request[None, None, State], ImportUsers, dto.user.ImportResult]):
+    gateway: ServiceGateway
+
+    @override
+    async def __call__(
+        self, request: Request[None, None, State], qc: ImportUsers, /, **kw: Any
+    ) -> dto.user.ImportResult:
+        async with await self.gateway.manager.with_transaction():
+            result = await self.gateway.user.import_many(
+                {
+                    row: UserCreate(login=user.login, password=user.password)
+                    for row, user in qc.rows.items()
+                }
+            )
+
+        return dto.user.ImportResult(
+            inserted=result.inserted,
+            rejected=[dto.user.RejectedRow(row=row, reason="conflict") for row in result.rejected],
+            rejected_total=len(result.rejected),
+        )
@@ -37,4 +37,4 @@ class CreateUserHandler(Handler[Request[None, None, State], CreateUser, dto.user
         async with await self.gateway.manager.with_transaction():
             result = await self.gateway.user.create(**qc.as_mapping())
 
-        return dto.user.User.from_mapping(result.as_dict())
+        return dto.user.User.from_attributes(result)
@@ -1,3 +1,5 @@
+import functools
+
 from litestar import Router
 from litestar.datastructures import State
 from litestar.di import Provide
@@ -5,45 +7,205 @@ from litestar.di import Provide
 from src.api.common import tools
 from src.api.common.bus import QCBus
 from src.api.common.bus.middlewares.cache import CacheInvalidateMiddleware, CacheMiddleware
+from src.api.common.bus.middlewares.routing import (
+    ReadYourWritesMiddleware,
+    RecentWrites,
+    TrackWritesMiddleware,
+)
+from src.api.common.interfaces.bus import QCBusType
+from src.api.common.interfaces.dto import DTO
+from src.api.common.interfaces.middleware import MiddlewareType
+from src.api.common.warmup import WarmUp, persist_hot_keys, preload_hot_keys
+from src.api.v1 import dto, queries
 from src.api.v1.commands import CommandBus
 from src.api.v1.queries import QueryBus
-from src.config.core import Config
+from src.config.core import CacheConfig, Config
+from src.database.alchemy import entity
 from src.database.alchemy.core import ConnectionFactory
+from src.database.alchemy.routing import (
+    RoutingConnectionFactory,
+    prefer_primary,
+    primary_preferred,
+)
+from src.database.alchemy.warmup import warm_up_pool
 from src.database.manager import ManagerFactory
-from src.services.cache.redis import RedisCache
+from src.services.cache.breaker import CircuitBreakerCache
+from src.services.cache.hotkeys import HotKeyTracker
+from src.services.cache.memory import MemoryCache
+from src.services.cache.redis import RedisBytesCache, RedisCache
 from src.services.gateway import ServiceGatewayImpl
+from src.services.interfaces.cache import BytesCache, Cache, StrCache
 
 
-def setup_v1_dependencies(router: Router, config: Config) -> State:
-    connection = ConnectionFactory.from_url(
-        config.db.url(),
-        pool_size=config.db.connection_pool_size,
-        max_overflow=config.db.connection_max_overflow,
-        pool_pre_ping=config.db.connection_pool_pre_ping,
-        json_serializer=tools.msgspec_encoder,
-        json_deserializer=tools.msgspec_decoder,
-        future=True,
+def _setup_caches(config: Config) -> tuple[StrCache, BytesCache]:
+    if config.cache.backend == "memory":
+        return (
+            MemoryCache[str].from_config(config.cache),
+            MemoryCache[bytes].from_config(config.cache),
+        )
+
+    cache = RedisCache.from_config(config.redis, config.cache, config.app.metrics)
+    entity_cache = RedisBytesCache.from_config(config.redis, config.cache, config.app.metrics)
+    if not config.cache.breaker:
+        return cache, entity_cache
+
+    return (
+        _with_breaker(cache, "cache", config.cache),
+        _with_breaker(entity_cache, "entity_cache", config.cache),
+    )
+
+
+def _with_breaker[V](
+    cache: Cache[str, V], name: str, config: CacheConfig
+) -> CircuitBreakerCache[V]:
+    return CircuitBreakerCache(
+        cache,
+        name=name,
+        timeout=config.breaker_timeout,
+        failure_threshold=config.breaker_failure_threshold,
+        recovery_time=config.breaker_recovery_time,
+        max_pending=config.breaker_max_pending,
+    )
+
+
+async def _preload_hot_keys_from_primary(
+    cache: StrCache, query_bus: QCBusType, limit: int, *types: type[DTO]
+) -> None:
+    # replica reads skip entity cache fills, so replay hot keys where they can fill it
+    with prefer_primary():
+        await preload_hot_keys(cache, query_bus, limit, *types)
+
+
+def _setup_warm_up(
+    config: Config,
+    routing: RoutingConnectionFactory,
+    cache: StrCache,
+    query_bus: QCBusType,
+    hot_keys: HotKeyTracker,
+) -> WarmUp:
+    if not config.app.warm_up:
+        return WarmUp()
+
+    steps = [
+        functools.partial(
+            warm_up_pool,
+            connection,
+            config.db.connection_pool_size,
+            entity.User,
+            dto.user.User,
+            estimate_threshold=config.db.count_estimate_threshold,
+        )
+        for connection in (routing.primary, *routing.replicas)
+    ]
+    finalizers = []
+    if config.cache.hot_keys_preload:
+        steps.append(
+            functools.partial(
+                _preload_hot_keys_from_primary,
+                cache,
+                query_bus,
+                config.cache.hot_keys_preload,
+                queries.user.get.GetOneUser,
+            )
+        )
+        finalizers.append(
+            functools.partial(
+                persist_hot_keys,
+                cache,
+                hot_keys,
+                config.cache.hot_keys_preload,
+                config.cache.hot_keys_persist_time,
+            )
+        )
+
+    return WarmUp(*steps, finalizers=finalizers, timeout=config.app.warm_up_timeout)
+
+
+def _setup_connection(config: Config) -> RoutingConnectionFactory:
+    options = {
+        "pool_size": config.db.connection_pool_size,
+        "max_overflow": config.db.connection_max_overflow,
+        "pool_pre_ping": config.db.connection_pool_pre_ping,
+        "json_serializer": tools.msgspec_encoder,
+        "json_deserializer": tools.msgspec_decoder,
+        "future": True,
+    }
+
+    return RoutingConnectionFactory(
+        ConnectionFactory.from_url(config.db.url(), **options),
+        *(ConnectionFactory.from_url(url, **options) for url in config.db.replica_urls),
+        recovery_time=config.db.replica_recovery_time,
     )
 
-    manager = ManagerFactory(connection)
-    cache = RedisCache.from_config(config.redis)
 
-    lazy_gw = tools.lazy_single(ServiceGatewayImpl, manager.make_transaction_manager)
+def _setup_consistency(
+    config: Config, cache: StrCache
+) -> tuple[list[MiddlewareType], list[MiddlewareType]]:
+    if not (config.db.replica_urls and config.db.read_your_writes_window):
+        return [], []
+
+    writes = RecentWrites(config.db.read_your_writes_window, shared=cache)
+
+    return [ReadYourWritesMiddleware(writes)], [TrackWritesMiddleware(writes)]
+
+
+def setup_v1_dependencies(router: Router, config: Config) -> State:
+    routing = _setup_connection(config)
+    connection = routing.primary
+
+    manager = ManagerFactory(routing.create_primary_connection)
+    read_manager = ManagerFactory(routing.create_replica_connection)
+    cache, entity_cache = _setup_caches(config)
+    hot_keys = HotKeyTracker(
+        capacity=config.cache.hot_keys_capacity, sample_rate=config.cache.hot_keys_sample_rate
+    )
+    read_middlewares, write_middlewares = _setup_consistency(config, cache)
+    settle_time = config.db.read_your_writes_window if config.db.replica_urls else 0
+
+    gateway_deps = {
+        "entity_cache": tools.singleton(entity_cache if config.cache.entity_cache_time else None),
+        "entity_cache_time": tools.singleton(config.cache.entity_cache_time),
+        "estimate_threshold": tools.singleton(config.db.count_estimate_threshold),
+    }
+    lazy_gw = tools.lazy(ServiceGatewayImpl, manager.make_transaction_manager, **gateway_deps)
+    lazy_read_gw = tools.lazy(
+        ServiceGatewayImpl,
+        read_manager.make_transaction_manager,
+        **gateway_deps,
+        read_through=primary_preferred if config.db.replica_urls else tools.singleton(True),
+    )
     query_bus = (
         QCBus.builder()
-        .dependencies(gateway=lazy_gw)
+        .dependencies(gateway=lazy_read_gw)
         .bus(QueryBus)
-        .middleware(CacheMiddleware(cache=cache))
+        .middleware(
+            CacheMiddleware(
+                cache=cache,
+                negative_types=frozenset({queries.user.get.GetOneUser}),
+                negative_cache_time=config.cache.negative_cache_time,
+                with_metrics=config.app.metrics,
+                hot_keys=hot_keys,
+                settle=bool(settle_time),
+            )
+        )
+        .middlewares(*read_middlewares)
         .build()
     )
     command_bus = (
         QCBus.builder()
         .dependencies(gateway=lazy_gw)
         .bus(CommandBus)
-        .middleware(CacheInvalidateMiddleware(cache=cache))
+        .middleware(
+            CacheInvalidateMiddleware(
+                cache=cache, with_metrics=config.app.metrics, settle_time=settle_time
+            )
+        )
+        .middlewares(*write_middlewares)
         .build()
     )
 
+    warm_up = _setup_warm_up(config, routing, cache, query_bus, hot_keys)
+
     router.dependencies["query_bus"] = Provide(
         tools.singleton(query_bus), use_cache=True, sync_to_thread=False
     )
@@ -53,10 +215,19 @@ def setup_v1_dependencies(router: Router, config: Config) -> State:
     router.dependencies["cache"] = Provide(
         tools.singleton(cache), use_cache=True, sync_to_thread=False
     )
+    router.dependencies["hot_keys"] = Provide(
+        tools.singleton(hot_keys), use_cache=True, sync_to_thread=False
+    )
+    router.dependencies["warm_up"] = Provide(
+        tools.singleton(warm_up), use_cache=True, sync_to_thread=False
+    )
 
     return State(
         {
+            "warm_up": tools.ClosableProxy(warm_up, warm_up.stop),
             "engine": tools.ClosableProxy(connection.engine, connection.engine.dispose),
+            "replicas": tools.ClosableProxy(routing, routing.dispose),
             "cache": tools.ClosableProxy(cache, cache.close),
+            "entity_cache": tools.ClosableProxy(entity_cache, entity_cache.close),
         }
     )
@@ -1,4 +1,5 @@
 from src.api.common.dto import BaseDTO as BaseDTO
+from src.api.v1.dto import cache as cache
 from src.api.v1.dto import healthcheck as healthcheck
 from src.api.v1.dto import user as user
 
@@ -8,6 +9,13 @@ class OffsetResult[T](BaseDTO):
     limit: int
     offset: int
     total: int
+    is_estimate: bool = False
+
+
+class CursorResult[T](BaseDTO):
+    items: list[T]
+    limit: int
+    cursor: str
 
 
 class Status(BaseDTO):
@@ -0,0 +1,10 @@
+from src.api.common import dto
+
+
+class HotKey(dto.BaseDTO):
+    key: str
+    hits: int
+
+
+class HotKeys(dto.BaseDTO):
+    items: list[HotKey]
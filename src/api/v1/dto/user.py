@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from typing import Literal
 
 from src.api.common import dto
 
@@ -8,3 +9,14 @@ class User(dto.BaseDTO):
     id: uuid.UUID
     login: str
     created_at: datetime
+
+
+class RejectedRow(dto.BaseDTO):
+    row: int
+    reason: Literal["invalid", "conflict"]
+
+
+class ImportResult(dto.BaseDTO):
+    inserted: int
+    rejected: list[RejectedRow]
+    rejected_total: int
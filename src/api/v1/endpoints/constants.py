@@ -3,3 +3,8 @@ from typing import Final
 
 MIN_PAGINATION_LIMIT: Final[int] = 10
 MAX_PAGINATION_LIMIT: Final[int] = 200
+IMPORT_CHUNK_SIZE: Final[int] = 5_000
+MAX_IMPORT_BODY_SIZE: Final[int] = 1024 * 1024 * 1024
+MAX_IMPORT_REJECTED_ROWS: Final[int] = 1_000
+MIN_EXPORT_BATCH_SIZE: Final[int] = 100
+MAX_EXPORT_BATCH_SIZE: Final[int] = 10_000
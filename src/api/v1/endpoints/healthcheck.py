@@ -1,8 +1,11 @@
 from litestar import MediaType, Request, get, status_codes
 from litestar.datastructures import State
 
+from src.api.common import docs
+from src.api.common.warmup import WarmUp
 from src.api.v1 import dto
 from src.api.v1.queries import QueryBus
+from src.common.exceptions import ServiceUnavailableError
 
 
 @get(
@@ -10,8 +13,12 @@ from src.api.v1.queries import QueryBus
     media_type=MediaType.JSON,
     tags=["healthcheck"],
     status_code=status_codes.HTTP_200_OK,
+    responses=docs.ServiceUnavailable().to_spec(),
 )
 async def healthcheck_endpoint(
-    query_bus: QueryBus, request: Request[None, None, State]
+    query_bus: QueryBus, warm_up: WarmUp, request: Request[None, None, State]
 ) -> dto.healthcheck.HealthCheck:
+    if not warm_up.ready:
+        raise ServiceUnavailableError("Warming up")
+
     return dto.healthcheck.HealthCheck(ok=True)
@@ -0,0 +1,7 @@
+from litestar import Router
+
+from src.api.v1.endpoints.private.cache import CacheController
+
+
+def setup_v1_private_controllers(app: Router) -> None:
+    app.register(CacheController)
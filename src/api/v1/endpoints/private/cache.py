@@ -0,0 +1,31 @@
+from typing import Annotated
+
+from litestar import Controller, MediaType, get, status_codes
+from litestar.params import Parameter
+
+from src.api.common import docs
+from src.api.v1 import dto
+from src.services.cache.hotkeys import HotKeyTracker
+
+
+class CacheController(Controller):
+    path = "/private/cache"
+    tags = ["private"]
+    include_in_schema = False
+
+    @get(
+        "/hot-keys",
+        media_type=MediaType.JSON,
+        status_code=status_codes.HTTP_200_OK,
+        responses=docs.InternalServer().to_spec(),
+    )
+    async def get_hot_keys_endpoint(
+        self,
+        hot_keys: HotKeyTracker,
+        limit: Annotated[
+            int | None, Parameter(default=None, required=False, ge=1, description="Keys limit")
+        ],
+    ) -> dto.cache.HotKeys:
+        return dto.cache.HotKeys(
+            items=[dto.cache.HotKey(key=key, hits=hits) for key, hits in hot_keys.top(limit)]
+        )
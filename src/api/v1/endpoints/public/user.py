@@ -4,11 +4,20 @@ from typing import Annotated
 from litestar import Controller, MediaType, Request, delete, get, patch, post, status_codes
 from litestar.datastructures import State
 from litestar.params import Body, Parameter
+from litestar.response import Stream
 
-from src.api.common import docs
+from src.api.common import docs, ingest
 from src.api.common.tools import page_to_offset
 from src.api.v1 import commands, dto, queries
-from src.api.v1.endpoints.constants import MAX_PAGINATION_LIMIT, MIN_PAGINATION_LIMIT
+from src.api.v1.endpoints.constants import (
+    IMPORT_CHUNK_SIZE,
+    MAX_EXPORT_BATCH_SIZE,
+    MAX_IMPORT_BODY_SIZE,
+    MAX_IMPORT_REJECTED_ROWS,
+    MAX_PAGINATION_LIMIT,
+    MIN_EXPORT_BATCH_SIZE,
+    MIN_PAGINATION_LIMIT,
+)
 from src.database.alchemy.types import OrderBy
 
 
@@ -34,6 +43,77 @@ class UserController(Controller):
     ) -> dto.user.User:
         return await command_bus(request, data)
 
+    @post(
+        "/import",
+        media_type=MediaType.JSON,
+        status_code=status_codes.HTTP_200_OK,
+        request_max_body_size=MAX_IMPORT_BODY_SIZE,
+        responses=docs.BadRequest().to_spec() | docs.InternalServer().to_spec(),
+        description=(
+            "Bulk import from an `NDJSON` or `text/csv` (with header) request body. "
+            f"Only the first {MAX_IMPORT_REJECTED_ROWS} rejected rows are listed"
+        ),
+    )
+    async def import_users_endpoint(
+        self,
+        command_bus: commands.CommandBus,
+        request: Request[None, None, State],
+    ) -> dto.user.ImportResult:
+        format: ingest.IngestFormat = "csv" if request.content_type[0] == "text/csv" else "ndjson"
+        inserted = rejected_total = 0
+        rejected: list[dto.user.RejectedRow] = []
+
+        async for rows, invalid in ingest.read_chunks(
+            request.stream(), commands.user.create.CreateUser, format, IMPORT_CHUNK_SIZE
+        ):
+            chunk = [dto.user.RejectedRow(row=row, reason="invalid") for row in invalid]
+            if rows:
+                result = await command_bus(request, commands.user.bulk.ImportUsers(rows=rows))
+                inserted += result.inserted
+                chunk.extend(result.rejected)
+
+            rejected_total += len(chunk)
+            if len(rejected) < MAX_IMPORT_REJECTED_ROWS:
+                chunk.sort(key=lambda r: r.row)
+                rejected.extend(chunk[: MAX_IMPORT_REJECTED_ROWS - len(rejected)])
+
+        return dto.user.ImportResult(
+            inserted=inserted, rejected=rejected, rejected_total=rejected_total
+        )
+
+    @get(
+        "/export",
+        media_type="application/x-ndjson",
+        status_code=status_codes.HTTP_200_OK,
+        responses=docs.InternalServer().to_spec(),
+        description="All users as `NDJSON`, read with a server-side cursor",
+    )
+    async def export_users_endpoint(
+        self,
+        order_by: Annotated[
+            OrderBy, Parameter(default="ASC", required=False, description="`sorting` strategy")
+        ],
+        batch_size: Annotated[
+            int,
+            Parameter(
+                default=MIN_EXPORT_BATCH_SIZE * 10,
+                le=MAX_EXPORT_BATCH_SIZE,
+                ge=MIN_EXPORT_BATCH_SIZE,
+                required=False,
+                description="Rows fetched per round trip",
+            ),
+        ],
+        query_bus: queries.QueryBus,
+        request: Request[None, None, State],
+    ) -> Stream:
+        return Stream(
+            await query_bus.send_unwrapped(
+                request,
+                queries.user.get.ExportUser(batch_size=batch_size, order_by=order_by),
+            ),
+            media_type="application/x-ndjson",
+        )
+
     @get(
         "/{user_id:uuid}",
         media_type=MediaType.JSON,
@@ -79,6 +159,39 @@ class UserController(Controller):
             ),
         )
 
+    @get(
+        "/cursor",
+        media_type=MediaType.JSON,
+        status_code=status_codes.HTTP_200_OK,
+        responses=docs.BadRequest().to_spec() | docs.InternalServer().to_spec(),
+    )
+    async def get_many_by_cursor_endpoint(
+        self,
+        order_by: Annotated[
+            OrderBy, Parameter(default="ASC", required=False, description="`sorting` strategy")
+        ],
+        limit: Annotated[
+            int,
+            Parameter(
+                default=MIN_PAGINATION_LIMIT,
+                le=MAX_PAGINATION_LIMIT,
+                ge=MIN_PAGINATION_LIMIT,
+                required=False,
+                description="Items limit",
+            ),
+        ],
+        query_bus: queries.QueryBus,
+        request: Request[None, None, State],
+        cursor: Annotated[
+            str | None,
+            Parameter(required=False, description="`cursor` returned by the previous page"),
+        ] = None,
+    ) -> dto.CursorResult[dto.user.User]:
+        return await query_bus(
+            request,
+            queries.user.get.GetManyCursorUser(limit=limit, cursor=cursor, order_by=order_by),
+        )
+
     @patch(
         "/{user_id:uuid}",
         media_type=MediaType.JSON,
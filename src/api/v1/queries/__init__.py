@@ -25,6 +25,20 @@ class QueryBus(Protocol):
         qc: user.get.GetManyOffsetUser,
         /,
     ) -> AwaitableProxy[user.get.GetManyOffsetUserHandler]: ...
+    @overload
+    def send_unwrapped(
+        self,
+        request: Request[None, None, State],
+        qc: user.get.GetManyCursorUser,
+        /,
+    ) -> AwaitableProxy[user.get.GetManyCursorUserHandler]: ...
+    @overload
+    def send_unwrapped(
+        self,
+        request: Request[None, None, State],
+        qc: user.get.ExportUser,
+        /,
+    ) -> AwaitableProxy[user.get.ExportUserHandler]: ...
 
     def send_unwrapped(
         self, request: Any, qc: Any, /, **kw: Any
@@ -1,7 +1,9 @@
 import uuid
-from dataclasses import asdict, dataclass
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any, override
 
+import msgspec
 from litestar import Request
 from litestar.datastructures import State
 
@@ -11,6 +13,9 @@ from src.database.alchemy.types import OrderBy
 from src.services.gateway import ServiceGateway
 
 
+_ndjson = msgspec.json.Encoder()
+
+
 class GetOneUser(dto.BaseDTO):
     id: uuid.UUID
 
@@ -23,10 +28,10 @@ class GetOneUserHandler(Handler[Request[None, None, State], GetOneUser, dto.user
     async def __call__(
         self, request: Request[None, None, State], qc: GetOneUser, /, **kw: Any
     ) -> dto.user.User:
-        async with self.gateway.manager:
+        async with await self.gateway.manager.with_transaction(read_only=True):
             result = await self.gateway.user.get_one(**qc.as_mapping())
 
-        return dto.user.User.from_mapping(result.as_dict())
+        return dto.user.User.from_attributes(result)
 
 
 class GetManyOffsetUser(dto.BaseDTO):
@@ -45,7 +50,61 @@ class GetManyOffsetUserHandler(
     async def __call__(
         self, request: Request[None, None, State], qc: GetManyOffsetUser, /, **kw: Any
     ) -> dto.OffsetResult[dto.user.User]:
-        async with self.gateway.manager:
-            result = await self.gateway.user.get_many_by_offset(**qc.as_mapping())
+        async with await self.gateway.manager.with_transaction(read_only=True):
+            result = await self.gateway.user.get_many_by_offset_as(dto.user.User, **qc.as_mapping())
+
+        return dto.OffsetResult[dto.user.User](
+            items=list(result.items),
+            limit=qc.limit,
+            offset=qc.offset,
+            total=result.total,
+            is_estimate=result.is_estimate,
+        )
+
+
+class GetManyCursorUser(dto.BaseDTO):
+    limit: int
+    cursor: str | None = None
+    order_by: OrderBy = "ASC"
+
+
+@dataclass(frozen=True, slots=True)
+class GetManyCursorUserHandler(
+    Handler[Request[None, None, State], GetManyCursorUser, dto.CursorResult[dto.user.User]]
+):
+    gateway: ServiceGateway
+
+    @override
+    async def __call__(
+        self, request: Request[None, None, State], qc: GetManyCursorUser, /, **kw: Any
+    ) -> dto.CursorResult[dto.user.User]:
+        async with await self.gateway.manager.with_transaction(read_only=True):
+            result = await self.gateway.user.get_many_by_cursor(**qc.as_mapping())
+
+        return dto.CursorResult[dto.user.User](
+            items=dto.user.User.from_attributes_many(result.items),
+            limit=qc.limit,
+            cursor=result.cursor or "",
+        )
+
+
+class ExportUser(dto.BaseDTO):
+    batch_size: int
+    order_by: OrderBy = "ASC"
+
+
+@dataclass(frozen=True, slots=True)
+class ExportUserHandler(Handler[Request[None, None, State], ExportUser, AsyncIterator[bytes]]):
+    gateway: ServiceGateway
+
+    @override
+    async def __call__(
+        self, request: Request[None, None, State], qc: ExportUser, /, **kw: Any
+    ) -> AsyncIterator[bytes]:
+        return self._export(qc)
 
-        return dto.OffsetResult[dto.user.User].from_mapping(asdict(result))
+    async def _export(self, qc: ExportUser) -> AsyncIterator[bytes]:
+        async with await self.gateway.manager.with_transaction(read_only=True):
+            batches = await self.gateway.user.stream_as(dto.user.User, **qc.as_mapping())
+            async for batch in batches:
+                yield _ndjson.encode_lines(batch)
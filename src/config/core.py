@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, Self
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +12,7 @@ if TYPE_CHECKING:
     import _typeshed
 
 type ServerType = Literal["granian", "uvicorn", "gunicorn"]
+type CacheBackend = Literal["redis", "memory"]
 
 
 def root_dir() -> Path:
@@ -44,6 +46,10 @@ class DbConfig(BaseSettings):
     connection_max_overflow: int = 90
     connection_pool_pre_ping: bool = True
     max_connections: int = 100
+    count_estimate_threshold: int = 0
+    replica_urls: list[str] = []
+    replica_recovery_time: float = 5.0
+    read_your_writes_window: float = 0
 
     def url(self) -> str:
         if self.driver.startswith("sqlite"):
@@ -84,6 +90,8 @@ class AppConfig(BaseSettings):
     version: str = "0.0.1"
     metrics: bool = True
     swagger: bool = True
+    warm_up: bool = True
+    warm_up_timeout: float = 30
 
 
 class RedisConfig(BaseSettings):
@@ -98,6 +106,39 @@ class RedisConfig(BaseSettings):
     host: str = "127.0.0.1"
     port: int = 6379
     password: str | None = None
+    max_connections: int = 64
+    socket_timeout: float | None = 2.0
+    socket_connect_timeout: float | None = 2.0
+    health_check_interval: int = 30
+    protocol: int = 2
+
+
+class CacheConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file="./.env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        env_prefix="CACHE_",
+        extra="ignore",
+    )
+
+    backend: CacheBackend = "redis"
+    memory_max_size: int = 64 * 1024 * 1024
+    memory_policy: Literal["lru", "lfu"] = "lru"
+    memory_sweep_interval: float = 1.0
+    compress_threshold: int = 1024
+    compress_level: int = 1
+    entity_cache_time: float = 60
+    negative_cache_time: float = 5
+    hot_keys_capacity: int = 32
+    hot_keys_sample_rate: float = 1.0
+    hot_keys_preload: int = 0
+    breaker: bool = True
+    breaker_timeout: float = 0.1
+    breaker_failure_threshold: int = 5
+    breaker_recovery_time: float = 5.0
+    breaker_max_pending: int = 10_000
+    hot_keys_persist_time: float = 24 * 60 * 60
 
 
 class Config(BaseSettings):
@@ -105,6 +146,15 @@ class Config(BaseSettings):
     db: DbConfig
     server: ServerConfig
     redis: RedisConfig
+    cache: CacheConfig
+
+    @model_validator(mode="after")
+    def _check_memory_cache_workers(self) -> Self:
+        # in-process caches can't see invalidations from other workers
+        if self.cache.backend == "memory" and self.server.workers != 1:
+            raise ValueError("CACHE_BACKEND=memory requires SERVER_WORKERS=1, use redis instead")
+
+        return self
 
 
 def load_config(
@@ -112,10 +162,12 @@ def load_config(
     app: AppConfig | None = None,
     server: ServerConfig | None = None,
     redis: RedisConfig | None = None,
+    cache: CacheConfig | None = None,
 ) -> Config:
     return Config(
         db=db or DbConfig(),
         app=app or AppConfig(),
         server=server or ServerConfig(),
         redis=redis or RedisConfig(),
+        cache=cache or CacheConfig(),
     )
@@ -12,10 +12,14 @@ def create_sa_engine(url: str, **options: Any) -> AsyncEngine:
 
 
 class ConnectionFactory:
-    __slots__ = ("_engine",)
+    __slots__ = (
+        "_engine",
+        "_sessionmaker",
+    )
 
     def __init__(self, engine: AsyncEngine) -> None:
         self._engine = engine
+        self._sessionmaker = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
 
     def __call__(self) -> AsyncConnection:
         return self.create_connection()
@@ -29,4 +33,4 @@ class ConnectionFactory:
         return self._engine
 
     def create_connection(self) -> AsyncConnection:
-        return async_sessionmaker(self.engine, expire_on_commit=False, autoflush=False)()
+        return self._sessionmaker()
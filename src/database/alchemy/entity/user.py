@@ -14,4 +14,5 @@ class User(mixins.WithUUIDMixin, mixins.WithTimeMixin, Entity):
     def __table_args__(cls) -> Any:
         return (
             sa.Index(f"idx_{cls.__tablename__}_login_lower", sa.func.lower(cls.login), unique=True),
+            sa.Index(f"idx_{cls.__tablename__}_created_at_id", "created_at", "id"),
         )
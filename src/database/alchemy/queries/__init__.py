@@ -1 +1,2 @@
 from src.database.alchemy.queries import base as base
+from src.database.alchemy.queries import raw as raw
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping, Sequence
-from typing import Any, Self, get_args, override
+from collections import deque
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Any, Self, cast, get_args, override
 
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import insert
@@ -11,8 +12,33 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.database._util import is_typevar
 from src.database.alchemy import types
 from src.database.alchemy.entity import Entity
-from src.database.alchemy.tools import cursor_decoder, cursor_encoder, select_with_relations
-from src.database.interfaces.query import Query
+from src.database.alchemy.queries import statements as st
+from src.database.alchemy.tools import cursor_decoder, cursor_encoder
+from src.database.interfaces.query import BatchableQuery, Query
+
+
+_specialised: dict[tuple[type[Any], type[Entity]], type[Any]] = {}
+
+
+def _batchable(values: Mapping[str, Any]) -> bool:
+    return st.is_literal(values.values()) and all(isinstance(v, Hashable) for v in values.values())
+
+
+def _unique_chunks[Q](queries: Sequence[Q], key: Any) -> list[list[Q]]:
+    chunks: list[list[Q]] = []
+    seen: list[set[Any]] = []
+    for query in queries:
+        value = key(query)
+        for chunk, keys in zip(chunks, seen, strict=True):
+            if value not in keys:
+                chunk.append(query)
+                keys.add(value)
+                break
+        else:
+            chunks.append([query])
+            seen.append({value})
+
+    return chunks
 
 
 class ExtendedQuery[E: Entity, R](Query[AsyncSession, R]):
@@ -48,18 +74,60 @@ class ExtendedQuery[E: Entity, R](Query[AsyncSession, R]):
 
     @classmethod
     def with_(cls, entity: type[E]) -> type[Self]:
-        return type(cls.__name__, (cls,), {"_entity": entity})
+        key = (cls, entity)
+        if (specialised := _specialised.get(key)) is None:
+            specialised = _specialised[key] = type(
+                cls.__name__,
+                (cls,),
+                {"__slots__": (), "__module__": cls.__module__, "_entity": entity},
+            )
 
+        return cast(type[Self], specialised)
 
-class Create[E: Entity](ExtendedQuery[E, E | None]):
+
+class Create[E: Entity](ExtendedQuery[E, E | None], BatchableQuery[AsyncSession, E | None]):
     __slots__ = ()
 
+    @override
+    def batch_key(self) -> Hashable | None:
+        if not self._kw or not _batchable(self._kw):
+            return None
+
+        return type(self), tuple(self._kw)
+
+    @override
+    @classmethod
+    async def send_batch(cls, conn: AsyncSession, queries: Sequence[Self], /) -> list[E | None]:
+        first, *_ = queries
+        keys = tuple(first._kw)
+        pending: dict[tuple[Any, ...], deque[int]] = {}
+        for index, query in enumerate(queries):
+            pending.setdefault(tuple(query._kw.values()), deque()).append(index)
+
+        result = await conn.execute(st.batch_create(first.entity), [q._kw for q in queries])
+        created: list[E | None] = [None] * len(queries)
+        for row in result.scalars().all():
+            if indexes := pending.get(tuple(getattr(row, k) for k in keys)):
+                created[indexes.popleft()] = row
+
+        return created
+
     @override
     async def __call__(self, conn: AsyncSession, /, **kw: Any) -> E | None:
-        result = await conn.execute(
-            insert(self.entity).on_conflict_do_nothing().values(**self._kw).returning(self.entity)
-        )
-        return result.scalars().first()
+        if st.is_literal(self._kw.values()):
+            stmt = st.create(self.entity, tuple(self._kw))
+            result = await conn.execute(stmt, st.bound(st.VALUES_PREFIX, self._kw))
+        else:
+            result = await conn.execute(
+                insert(self.entity)
+                .on_conflict_do_nothing()
+                .values(**self._kw)
+                .returning(self.entity)
+            )
+
+        created: E | None = result.scalars().first()
+
+        return created
 
 
 class BatchCreate[E: Entity](ExtendedQuery[E, Sequence[E]]):
@@ -71,16 +139,15 @@ class BatchCreate[E: Entity](ExtendedQuery[E, Sequence[E]]):
 
     @override
     async def __call__(self, conn: AsyncSession, /, **kw: Any) -> Sequence[E]:
-        result = await conn.execute(
-            insert(self.entity).on_conflict_do_nothing().returning(self.entity), self._data
-        )
+        result = await conn.execute(st.batch_create(self.entity), self._data)
+        created: Sequence[E] = result.scalars().all()
 
-        return result.scalars().all()
+        return created
 
 
 class GetOne[E: Entity](ExtendedQuery[E, E | None]):
     __slots__ = (
-        "_clauses",
+        "filters",
         "_loads",
         "_lock",
     )
@@ -88,33 +155,27 @@ class GetOne[E: Entity](ExtendedQuery[E, E | None]):
     def __init__(self, *_loads: str, lock_for_update: bool = False, **kw: Any) -> None:
         self._lock = lock_for_update
         self._loads = _loads
-        self._clauses: list[sa.ColumnExpressionArgument[bool]] = [
-            getattr(self.entity, k) == v for k, v in kw.items() if v is not None
-        ]
+        self.filters = st.filters(kw)
 
     @override
     async def __call__(self, conn: AsyncSession, /, **kw: Any) -> E | None:
-        stmt = select_with_relations(
-            *self._loads,
-            entity=self.entity,
-            _node=kw.pop("_node", None),
-            self_key=kw.pop("self_key", None),
-            **kw,
-        ).where(*self._clauses)
+        stmt = st.get_one(self.entity, self._loads, tuple(self.filters), self._lock, st.options(kw))
 
-        if self._lock:
-            stmt = stmt.with_for_update()
+        found: E | None = (
+            (await conn.scalars(stmt, st.bound(st.WHERE_PREFIX, self.filters))).unique().first()
+        )
 
-        return (await conn.scalars(stmt)).unique().first()
+        return found
 
 
 class GetManyByOffset[E: Entity](ExtendedQuery[E, types.OffsetPaginationResult[E]]):
     __slots__ = (
         "loads",
-        "clauses",
+        "filters",
         "limit",
         "offset",
         "order_by",
+        "estimate_threshold",
     )
 
     def __init__(
@@ -123,15 +184,15 @@ class GetManyByOffset[E: Entity](ExtendedQuery[E, types.OffsetPaginationResult[E
         order_by: types.OrderBy = "ASC",
         offset: int | None = None,
         limit: int | None = None,
+        estimate_threshold: int | None = None,
         **kw: Any,
     ) -> None:
         self.loads = loads
         self.order_by = order_by.lower()
         self.offset = offset
         self.limit = limit
-        self.clauses: list[sa.ColumnExpressionArgument[bool]] = [
-            getattr(self.entity, k) == v for k, v in kw.items() if v is not None
-        ]
+        self.estimate_threshold = estimate_threshold
+        self.filters = st.filters(kw)
 
     @override
     async def __call__(self, conn: AsyncSession, /, **kw: Any) -> types.OffsetPaginationResult[E]:
@@ -143,51 +204,120 @@ class GetManyByOffset[E: Entity](ExtendedQuery[E, types.OffsetPaginationResult[E
         *clauses: sa.ColumnExpressionArgument[bool],
         **kw: Any,
     ) -> types.OffsetPaginationResult[E]:
-        total = (await conn.execute(self._count_stmt(*clauses))).scalar() or 0
+        params = st.bound(st.WHERE_PREFIX, self.filters)
+
+        if self.estimate_threshold:
+            estimate = await self._estimate(conn, params, *clauses)
+            if estimate >= self.estimate_threshold:
+                return self._result(await self._items(conn, params, *clauses, **kw), estimate, True)
+
+        if self.loads:
+            total = await self._count(conn, params, *clauses)
+            if total <= 0:
+                return self._result([], total)
+
+            return self._result(await self._items(conn, params, *clauses, **kw), total)
+
+        stmt = st.get_many_by_offset_windowed(
+            self.entity,
+            tuple(self.filters),
+            self.order_by,
+            self.limit is not None,
+            self.offset is not None,
+            st.options(kw),
+        )
+        if clauses:
+            stmt = stmt.where(*clauses)
 
-        if total <= 0:
-            return types.OffsetPaginationResult[E](
-                items=[], limit=self.limit, offset=self.offset, total=total
-            )
+        rows = (await conn.execute(stmt, self._params(dict(params)))).all()
+        if rows:
+            return self._result([row[0] for row in rows], rows[0][1])
+
+        total = await self._count(conn, params, *clauses) if self.offset else 0
 
-        items = (await conn.scalars(self._items_stmt(*clauses, **kw))).unique().all()
+        return self._result([], total)
 
+    async def _items(
+        self,
+        conn: AsyncSession,
+        params: dict[str, Any],
+        *clauses: sa.ColumnExpressionArgument[bool],
+        **kw: Any,
+    ) -> Sequence[E]:
+        items: Sequence[E] = (
+            (await conn.scalars(self._items_stmt(*clauses, **kw), self._params(dict(params))))
+            .unique()
+            .all()
+        )
+
+        return items
+
+    async def _count(
+        self,
+        conn: AsyncSession,
+        params: dict[str, Any],
+        *clauses: sa.ColumnExpressionArgument[bool],
+    ) -> int:
+        return (await conn.execute(self._count_stmt(*clauses), params)).scalar() or 0
+
+    async def _estimate(
+        self,
+        conn: AsyncSession,
+        params: dict[str, Any],
+        *clauses: sa.ColumnExpressionArgument[bool],
+    ) -> int:
+        stmt = (
+            st.Explain(st.ids(self.entity, tuple(self.filters)).where(*clauses))
+            if clauses
+            else st.estimate(self.entity, tuple(self.filters))
+        )
+
+        return st.plan_rows((await conn.execute(stmt, params)).scalar())
+
+    def _result(
+        self, items: Sequence[E], total: int, is_estimate: bool = False
+    ) -> types.OffsetPaginationResult[E]:
         return types.OffsetPaginationResult[E](
             items=items,
             limit=self.limit,
             offset=self.offset,
             total=total,
+            is_estimate=is_estimate,
         )
 
+    def _params(self, params: dict[str, Any]) -> dict[str, Any]:
+        if self.limit is not None:
+            params[st.LIMIT_PARAM] = self.limit
+        if self.offset is not None:
+            params[st.OFFSET_PARAM] = self.offset
+
+        return params
+
     def _items_stmt(
         self, *clauses: sa.ColumnExpressionArgument[bool], **kw: Any
     ) -> sa.Select[tuple[E]]:
-        return (
-            select_with_relations(
-                *self.loads,
-                entity=self.entity,
-                _node=kw.pop("_node", None),
-                self_key=kw.pop("self_key", None),
-                **kw,
-            )
-            .limit(self.limit)
-            .offset(self.offset)
-            .order_by(getattr(self.entity.id, self.order_by)())
-            .where(*(self.clauses + list(clauses)))
+        stmt = st.get_many_by_offset(
+            self.entity,
+            self.loads,
+            tuple(self.filters),
+            self.order_by,
+            self.limit is not None,
+            self.offset is not None,
+            st.options(kw),
         )
 
-    def _count_stmt(self, *clauses: sa.ColumnExpressionArgument[bool]) -> sa.Select[tuple[int]]:
-        return (
-            sa.select(sa.func.count())
-            .select_from(self.entity)
-            .where(*(self.clauses + list(clauses)))
-        )
+        return stmt.where(*clauses) if clauses else stmt
+
+    def _count_stmt(self, *clauses: sa.ColumnExpressionArgument[bool]) -> sa.Select[int]:
+        stmt = st.count(self.entity, tuple(self.filters))
+
+        return stmt.where(*clauses) if clauses else stmt
 
 
 class GetManyByCursor[E: Entity](ExtendedQuery[E, types.CursorPaginationResult[str, E]]):
     __slots__ = (
         "loads",
-        "clauses",
+        "filters",
         "limit",
         "order_by",
         "cursor",
@@ -214,9 +344,7 @@ class GetManyByCursor[E: Entity](ExtendedQuery[E, types.CursorPaginationResult[s
         self.encoder = encoder
         self.decoder = decoder
         self.cursor_type = cursor_type.lower()
-        self.clauses: list[sa.ColumnExpressionArgument[bool]] = [
-            getattr(self.entity, k) == v for k, v in kw.items() if v is not None
-        ]
+        self.filters = st.filters(kw)
 
     @override
     async def __call__(
@@ -234,30 +362,12 @@ class GetManyByCursor[E: Entity](ExtendedQuery[E, types.CursorPaginationResult[s
             "To use UUID pagination you should have `created_at` field"
         )
 
-        entity_created_at = self.entity.created_at  # type: ignore
-
-        stmt = (
-            select_with_relations(
-                *self.loads,
-                entity=self.entity,
-                _node=kw.pop("_node", None),
-                self_key=kw.pop("self_key", None),
-                **kw,
-            )
-            .limit(self.limit)
-            .order_by(
-                getattr(entity_created_at, self.order_by)(),
-                getattr(self.entity.id, self.order_by)(),
-            )
-        )
+        params = st.bound(st.WHERE_PREFIX, self.filters)
         if self.cursor:
             created_at, id = cursor_decoder(self.cursor, self.decoder, "UUID")
-            if self.order_by == "asc":
-                stmt = stmt.where(sa.tuple_(entity_created_at, self.entity.id) > (created_at, id))
-            else:
-                stmt = stmt.where(sa.tuple_(entity_created_at, self.entity.id) < (created_at, id))
+            params |= st.bound(st.CURSOR_PREFIX, {"created_at": created_at, "id": id})
 
-        result = (await conn.scalars(stmt.where(*(self.clauses + list(clauses))))).unique().all()
+        result = await self._fetch(conn, params, *clauses, **kw)
 
         if result:
             last = result[-1]
@@ -284,27 +394,12 @@ class GetManyByCursor[E: Entity](ExtendedQuery[E, types.CursorPaginationResult[s
     async def _paginate_integer(
         self, conn: AsyncSession, *clauses: sa.ColumnExpressionArgument[bool], **kw: Any
     ) -> types.CursorPaginationResult[str, E]:
-        stmt = (
-            select_with_relations(
-                *self.loads,
-                entity=self.entity,
-                _node=kw.pop("_node", None),
-                self_key=kw.pop("self_key", None),
-                **kw,
-            )
-            .limit(self.limit)
-            .order_by(
-                getattr(self.entity.id, self.order_by)(),
-            )
-        )
+        params = st.bound(st.WHERE_PREFIX, self.filters)
         if self.cursor:
             decoded = cursor_decoder(self.cursor, self.decoder, "INTEGER")
-            if self.order_by == "asc":
-                stmt = stmt.where(self.entity.id > decoded)
-            else:
-                stmt = stmt.where(self.entity.id < decoded)
+            params |= st.bound(st.CURSOR_PREFIX, {"id": decoded})
 
-        result = (await conn.scalars(stmt.where(*(self.clauses + list(clauses))))).unique().all()
+        result = await self._fetch(conn, params, *clauses, **kw)
 
         if result:
             last = result[-1]
@@ -325,62 +420,190 @@ class GetManyByCursor[E: Entity](ExtendedQuery[E, types.CursorPaginationResult[s
             cursor="",
         )
 
+    async def _fetch(
+        self,
+        conn: AsyncSession,
+        params: dict[str, Any],
+        *clauses: sa.ColumnExpressionArgument[bool],
+        **kw: Any,
+    ) -> Sequence[E]:
+        stmt = st.get_many_by_cursor(
+            self.entity,
+            self.loads,
+            tuple(self.filters),
+            self.order_by,
+            self.cursor_type,
+            bool(self.cursor),
+            st.options(kw),
+        )
+        if clauses:
+            stmt = stmt.where(*clauses)
+
+        params[st.LIMIT_PARAM] = self.limit
+        items: Sequence[E] = (await conn.scalars(stmt, params)).unique().all()
+
+        return items
+
 
-class Update[E: Entity](ExtendedQuery[E, Sequence[E]]):
-    __slots__ = ("clauses",)
+class Update[E: Entity](ExtendedQuery[E, Sequence[E]], BatchableQuery[AsyncSession, Sequence[E]]):
+    __slots__ = ("filters",)
 
     def __init__(self, data: Any, **filters: Any) -> None:
         assert data, "At least one field to update must be set"
         super().__init__(**data)
-        self.clauses: list[sa.ColumnExpressionArgument[bool]] = [
-            getattr(self.entity, k) == v for k, v in filters.items() if v is not None
-        ]
+        self.filters = st.filters(filters)
 
     def filter(self, **kw: Any) -> Update[E]:
-        self.clauses += [getattr(self.entity, k) == v for k, v in kw.items() if v is not None]
+        self.filters |= st.filters(kw)
 
         return self
 
     @override
     async def __call__(self, conn: AsyncSession, /, **kw: Any) -> Sequence[E]:
-        result = await conn.scalars(
-            sa.update(self.entity).where(*self.clauses).values(**self._kw).returning(self.entity)
-        )
+        params = st.bound(st.WHERE_PREFIX, self.filters)
+        if st.is_literal(self._kw.values()):
+            stmt = st.update(self.entity, tuple(self._kw), tuple(self.filters))
+            params |= st.bound(st.VALUES_PREFIX, self._kw)
+        else:
+            stmt = (
+                sa.update(self.entity)
+                .where(*st.where(self.entity, tuple(self.filters)))
+                .values(**self._kw)
+                .returning(self.entity)
+            )
+
+        result = await conn.scalars(stmt, params)
 
         return result.unique().all()
 
+    @override
+    def batch_key(self) -> Hashable | None:
+        if set(self.filters) != {"id"} or "id" in self._kw or not _batchable(self._kw):
+            return None
+
+        return type(self), tuple(self._kw)
+
+    @override
+    @classmethod
+    async def send_batch(cls, conn: AsyncSession, queries: Sequence[Self], /) -> list[Sequence[E]]:
+        first, *_ = queries
+        columns = ("id", *first._kw)
+        results: list[Sequence[E]] = [[] for _ in queries]
+
+        for chunk in _unique_chunks(range(len(queries)), lambda i: queries[i].filters["id"]):
+            rows = [(queries[i].filters["id"], *queries[i]._kw.values()) for i in chunk]
+            result = await conn.scalars(st.batch_update(first.entity, "id", columns, rows))
+            updated = {row.id: row for row in result.unique().all()}
+            for i in chunk:
+                if (row := updated.get(queries[i].filters["id"])) is not None:
+                    results[i] = [row]
+
+        return results
+
 
-class Delete[E: Entity](ExtendedQuery[E, Sequence[E]]):
-    __slots__ = ("clauses",)
+class Delete[E: Entity](ExtendedQuery[E, Sequence[E]], BatchableQuery[AsyncSession, Sequence[E]]):
+    __slots__ = ("filters",)
 
     def __init__(self, **kw: Any) -> None:
         assert kw, "At least one identifier must be provided"
-        self.clauses: list[sa.ColumnExpressionArgument[bool]] = [
-            getattr(self.entity, k) == v for k, v in kw.items() if v is not None
-        ]
+        self.filters = st.filters(kw)
+
+    @override
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> Sequence[E]:
+        result = await conn.execute(
+            st.delete(self.entity, tuple(self.filters)),
+            st.bound(st.WHERE_PREFIX, self.filters),
+        )
+        deleted: Sequence[E] = result.scalars().unique().all()
+
+        return deleted
+
+    @override
+    def batch_key(self) -> Hashable | None:
+        if set(self.filters) != {"id"} or not _batchable(self.filters):
+            return None
+
+        return (type(self),)
+
+    @override
+    @classmethod
+    async def send_batch(cls, conn: AsyncSession, queries: Sequence[Self], /) -> list[Sequence[E]]:
+        first, *_ = queries
+        ids = list(dict.fromkeys(q.filters["id"] for q in queries))
+        result = await conn.execute(st.batch_delete(first.entity, "id"), {st.KEYS_PARAM: ids})
+        deleted = {row.id: row for row in result.scalars().unique().all()}
+
+        return [[row] if (row := deleted.pop(q.filters["id"], None)) else [] for q in queries]
+
+
+class BatchUpdate[E: Entity](ExtendedQuery[E, Sequence[E]]):
+    __slots__ = (
+        "_data",
+        "_key",
+    )
+
+    def __init__(self, data: Sequence[Mapping[str, Any]], key: str = "id") -> None:
+        assert data, "data to update should not be empty"
+        assert all(key in row for row in data), f"Every row must contain `{key}`"
+        self._data = data
+        self._key = key
+
+    @override
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> Sequence[E]:
+        updated: list[E] = []
+        for columns, rows in self._groups().items():
+            result = await conn.scalars(st.batch_update(self.entity, self._key, columns, rows))
+            updated.extend(result.unique().all())
+
+        return updated
+
+    def _groups(self) -> dict[tuple[str, ...], list[tuple[Any, ...]]]:
+        merged: dict[Any, dict[str, Any]] = {}
+        for row in self._data:
+            merged.setdefault(row[self._key], {}).update(row)
+
+        groups: dict[tuple[str, ...], list[tuple[Any, ...]]] = {}
+        for row in merged.values():
+            columns = (self._key, *sorted(name for name in row if name != self._key))
+            if len(columns) > 1:
+                groups.setdefault(columns, []).append(tuple(row[name] for name in columns))
+
+        return groups
+
+
+class BatchDelete[E: Entity](ExtendedQuery[E, Sequence[E]]):
+    __slots__ = (
+        "_keys",
+        "_key",
+    )
+
+    def __init__(self, keys: Sequence[Any], key: str = "id") -> None:
+        assert keys, "At least one identifier must be provided"
+        self._keys = keys
+        self._key = key
 
     @override
     async def __call__(self, conn: AsyncSession, /, **kw: Any) -> Sequence[E]:
         result = await conn.execute(
-            sa.delete(self.entity).where(*self.clauses).returning(self.entity)
+            st.batch_delete(self.entity, self._key), {st.KEYS_PARAM: list(self._keys)}
         )
+        deleted: Sequence[E] = result.scalars().unique().all()
 
-        return result.scalars().unique().all()
+        return deleted
 
 
 class Exists[E: Entity](ExtendedQuery[E, bool]):
-    __slots__ = ("clauses",)
+    __slots__ = ("filters",)
 
     def __init__(self, **kw: Any) -> None:
         assert kw, "At least one identifier must be provided"
-        self.clauses: list[sa.ColumnExpressionArgument[bool]] = [
-            getattr(self.entity, k) == v for k, v in kw.items() if v is not None
-        ]
+        self.filters = st.filters(kw)
 
     @override
     async def __call__(self, conn: AsyncSession, /, **kw: Any) -> bool:
         is_exist = await conn.execute(
-            sa.exists(sa.select(self.entity.id).where(*self.clauses)).select()
+            st.exists(self.entity, tuple(self.filters)),
+            st.bound(st.WHERE_PREFIX, self.filters),
         )
 
         return bool(is_exist.scalar())
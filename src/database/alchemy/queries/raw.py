@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Final, cast, override
+
+import msgspec
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.sql.compiler import SQLCompiler
+
+from src.database.alchemy import types
+from src.database.alchemy.entity import Entity
+from src.database.alchemy.queries import statements as st
+from src.database.alchemy.queries.base import ExtendedQuery
+
+
+_dialect = asyncpg_dialect()  # type: ignore[no-untyped-call]
+
+ROW_COLUMN: Final[str] = "__row__"
+STARTED_KEY: Final[str] = "raw_transaction"
+
+
+@lru_cache(maxsize=1024)
+def compile_raw(stmt: sa.ClauseElement) -> tuple[str, tuple[str, ...]]:
+    compiled = cast(SQLCompiler, stmt.compile(dialect=_dialect))
+
+    return str(compiled), tuple(compiled.positiontup or ())
+
+
+@lru_cache(maxsize=256)
+def columns[E: Entity](entity: type[E], into: type[msgspec.Struct]) -> tuple[str, ...]:
+    table_columns = entity.__table__.c
+
+    return tuple(f.name for f in msgspec.structs.fields(into) if f.name in table_columns)
+
+
+@lru_cache(maxsize=1024)
+def select_columns[E: Entity](
+    entity: type[E], names: tuple[str, ...], keys: tuple[str, ...]
+) -> sa.Select[Any]:
+    table_columns = entity.__table__.c
+
+    return sa.select(*(table_columns[name] for name in names)).where(*st.where(entity, keys))
+
+
+@lru_cache(maxsize=1024)
+def select_columns_by_offset[E: Entity](
+    entity: type[E],
+    names: tuple[str, ...],
+    keys: tuple[str, ...],
+    order_by: str,
+    limited: bool,
+    offset: bool,
+    windowed: bool,
+) -> sa.Select[Any]:
+    stmt = select_columns(entity, names, keys).order_by(getattr(entity.__table__.c.id, order_by)())
+    if windowed:
+        stmt = stmt.add_columns(st.windowed_total())
+    if limited:
+        stmt = stmt.limit(sa.bindparam(st.LIMIT_PARAM, type_=sa.Integer))
+    if offset:
+        stmt = stmt.offset(sa.bindparam(st.OFFSET_PARAM, type_=sa.Integer))
+
+    return stmt
+
+
+@lru_cache(maxsize=256)
+def copy_statements[E: Entity](
+    entity: type[E],
+) -> tuple[str, sa.TextClause, sa.TextClause, sa.TextClause]:
+    quote = _dialect.identifier_preparer.quote
+    table: str = entity.__tablename__
+    staging = f"_copy_{table}"
+    names = ", ".join(quote(column.name) for column in entity.__table__.c)
+
+    create = sa.text(
+        f"CREATE TEMP TABLE IF NOT EXISTS {quote(staging)} "
+        f"(LIKE {quote(table)} INCLUDING DEFAULTS, {quote(ROW_COLUMN)} bigint) ON COMMIT DROP"
+    )
+    truncate = sa.text(f"TRUNCATE {quote(staging)}")
+    merge = sa.text(
+        f"WITH inserted AS ("
+        f"INSERT INTO {quote(table)} ({names}) "
+        f"SELECT {names} FROM {quote(staging)} ORDER BY {quote(ROW_COLUMN)} "
+        f"ON CONFLICT DO NOTHING RETURNING {quote('id')}) "
+        f"SELECT s.{quote(ROW_COLUMN)} FROM {quote(staging)} AS s "
+        f"LEFT JOIN inserted AS i ON i.{quote('id')} = s.{quote('id')} "
+        f"WHERE i.{quote('id')} IS NULL ORDER BY s.{quote(ROW_COLUMN)}"
+    )
+
+    return staging, create, truncate, merge
+
+
+@lru_cache(maxsize=256)
+def list_of(into: type[msgspec.Struct]) -> Any:
+    return list.__class_getitem__(into)
+
+
+async def driver_connection(conn: AsyncSession) -> Any:
+    connection = await conn.connection()
+    transaction = connection.sync_connection.get_transaction()  # type: ignore[union-attr]
+    if conn.info.get(STARTED_KEY) is not transaction:
+        # asyncpg's adapter sends BEGIN with its first statement, which driver calls skip
+        await connection.exec_driver_sql("SELECT 1")
+        conn.info[STARTED_KEY] = transaction
+    raw = await connection.get_raw_connection()
+
+    return raw.driver_connection
+
+
+class RawQuery[E: Entity, R](ExtendedQuery[E, R]):
+    __slots__ = ()
+
+    async def _fetch(
+        self, conn: AsyncSession, stmt: sa.ClauseElement, params: Mapping[str, Any]
+    ) -> Sequence[Any]:
+        sql, names = compile_raw(stmt)
+        driver = await driver_connection(conn)
+        records: Sequence[Any] = await driver.fetch(sql, *(params[name] for name in names))
+
+        return records
+
+
+class RawGetOne[E: Entity, T: msgspec.Struct](RawQuery[E, T | None]):
+    __slots__ = (
+        "filters",
+        "_into",
+    )
+
+    def __init__(self, into: type[T], **kw: Any) -> None:
+        self._into = into
+        self.filters = st.filters(kw)
+
+    @override
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> T | None:
+        stmt = select_columns(self.entity, columns(self.entity, self._into), tuple(self.filters))
+        records = await self._fetch(conn, stmt, st.bound(st.WHERE_PREFIX, self.filters))
+
+        return msgspec.convert(dict(records[0]), self._into) if records else None
+
+
+class RawGetManyByOffset[E: Entity, T: msgspec.Struct](
+    RawQuery[E, types.OffsetPaginationResult[T]]
+):
+    __slots__ = (
+        "filters",
+        "limit",
+        "offset",
+        "order_by",
+        "estimate_threshold",
+        "_into",
+    )
+
+    def __init__(
+        self,
+        into: type[T],
+        order_by: types.OrderBy = "ASC",
+        offset: int | None = None,
+        limit: int | None = None,
+        estimate_threshold: int | None = None,
+        **kw: Any,
+    ) -> None:
+        self._into = into
+        self.order_by = order_by.lower()
+        self.offset = offset
+        self.limit = limit
+        self.estimate_threshold = estimate_threshold
+        self.filters = st.filters(kw)
+
+    @override
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> types.OffsetPaginationResult[T]:
+        params = st.bound(st.WHERE_PREFIX, self.filters)
+        keys = tuple(self.filters)
+
+        if self.estimate_threshold:
+            (plan,) = await self._fetch(conn, st.estimate(self.entity, keys), params)
+            estimate = st.plan_rows(plan[0])
+            if estimate >= self.estimate_threshold:
+                records = await self._page(conn, params, windowed=False)
+                return self._result(records, estimate, True)
+
+        records = await self._page(conn, params, windowed=True)
+        if records:
+            return self._result(records, records[0][st.TOTAL_LABEL])
+
+        total = 0
+        if self.offset:
+            (count,) = await self._fetch(conn, st.count(self.entity, keys), params)
+            total = count[0]
+
+        return self._result(records, total)
+
+    async def _page(
+        self, conn: AsyncSession, params: dict[str, Any], windowed: bool
+    ) -> Sequence[Any]:
+        stmt = select_columns_by_offset(
+            self.entity,
+            columns(self.entity, self._into),
+            tuple(self.filters),
+            self.order_by,
+            self.limit is not None,
+            self.offset is not None,
+            windowed,
+        )
+
+        return await self._fetch(
+            conn, stmt, params | {st.LIMIT_PARAM: self.limit, st.OFFSET_PARAM: self.offset}
+        )
+
+    def _result(
+        self, records: Sequence[Any], total: int, is_estimate: bool = False
+    ) -> types.OffsetPaginationResult[T]:
+        return types.OffsetPaginationResult[T](
+            items=msgspec.convert([dict(record) for record in records], list_of(self._into)),
+            limit=self.limit,
+            offset=self.offset,
+            total=total,
+            is_estimate=is_estimate,
+        )
+
+
+class CopyCreate[E: Entity](RawQuery[E, types.CopyResult]):
+    __slots__ = (
+        "_rows",
+        "_columns",
+    )
+
+    def __init__(self, rows: Mapping[int, Mapping[str, Any]], columns: Sequence[str]) -> None:
+        assert columns, "At least one column to copy must be set"
+        self._rows = rows
+        self._columns = tuple(columns)
+
+    @override
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> types.CopyResult:
+        if not self._rows:
+            return types.CopyResult(inserted=0, rejected=[])
+
+        staging, create, truncate, merge = copy_statements(self.entity)
+        await conn.execute(create)
+        await conn.execute(truncate)
+
+        driver = await driver_connection(conn)
+        await driver.copy_records_to_table(
+            staging,
+            records=[
+                (row, *(values[column] for column in self._columns))
+                for row, values in self._rows.items()
+            ],
+            columns=(ROW_COLUMN, *self._columns),
+        )
+
+        rejected: Sequence[int] = (await conn.execute(merge)).scalars().all()
+
+        return types.CopyResult(inserted=len(self._rows) - len(rejected), rejected=rejected)
+
+
+class StreamManyAs[E: Entity, T: msgspec.Struct](ExtendedQuery[E, AsyncIterator[list[T]]]):
+    __slots__ = (
+        "filters",
+        "order_by",
+        "batch_size",
+        "_into",
+    )
+
+    def __init__(
+        self,
+        into: type[T],
+        order_by: types.OrderBy = "ASC",
+        batch_size: int = 1000,
+        **kw: Any,
+    ) -> None:
+        assert batch_size > 0, "Batch size must be positive"
+        self._into = into
+        self.order_by = order_by.lower()
+        self.batch_size = batch_size
+        self.filters = st.filters(kw)
+
+    @override
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> AsyncIterator[list[T]]:
+        stmt = select_columns_by_offset(
+            self.entity,
+            columns(self.entity, self._into),
+            tuple(self.filters),
+            self.order_by,
+            False,
+            False,
+            False,
+        ).execution_options(yield_per=self.batch_size)
+        result = await conn.stream(stmt, st.bound(st.WHERE_PREFIX, self.filters))
+
+        return self._partitions(result)
+
+    async def _partitions(self, result: AsyncResult[Any]) -> AsyncIterator[list[T]]:
+        into = list_of(self._into)
+        try:
+            async for partition in result.partitions():
+                batch: list[T] = msgspec.convert(partition, into, from_attributes=True)
+                yield batch
+        finally:
+            await result.close()
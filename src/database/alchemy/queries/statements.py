@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Any, Final
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.dml import ReturningDelete, ReturningInsert, ReturningUpdate
+from sqlalchemy.sql.expression import Executable
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from src.database.alchemy.entity import Entity
+from src.database.alchemy.tools import select_with_relations
+
+
+WHERE_PREFIX: Final[str] = "w_"
+VALUES_PREFIX: Final[str] = "v_"
+CURSOR_PREFIX: Final[str] = "c_"
+KEYS_PARAM: Final[str] = "keys"
+LIMIT_PARAM: Final[str] = "limit"
+OFFSET_PARAM: Final[str] = "offset"
+TOTAL_LABEL: Final[str] = "__total__"
+
+type Options = tuple[tuple[str, Any], ...]
+
+
+def filters(kw: Mapping[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in kw.items() if v is not None}
+
+
+def options(kw: Mapping[str, Any]) -> Options:
+    return tuple(sorted(kw.items()))
+
+
+def bound(prefix: str, values: Mapping[str, Any]) -> dict[str, Any]:
+    return {f"{prefix}{k}": v for k, v in values.items()}
+
+
+def is_literal(values: Iterable[Any]) -> bool:
+    return not any(isinstance(v, sa.ClauseElement) for v in values)
+
+
+class Explain(Executable, sa.ClauseElement):
+    __visit_name__ = "explain"
+    inherit_cache = True
+    _traverse_internals = [("statement", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, statement: sa.ClauseElement) -> None:
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+def plan_rows(plan: Any) -> int:
+    if isinstance(plan, str | bytes):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+@lru_cache(maxsize=1024)
+def where[E: Entity](entity: type[E], keys: tuple[str, ...]) -> tuple[sa.ColumnElement[bool], ...]:
+    return tuple(getattr(entity, k) == sa.bindparam(f"{WHERE_PREFIX}{k}") for k in keys)
+
+
+@lru_cache(maxsize=1024)
+def get_one[E: Entity](
+    entity: type[E], loads: tuple[str, ...], keys: tuple[str, ...], lock: bool, opts: Options
+) -> sa.Select[tuple[E]]:
+    stmt = select_with_relations(*loads, entity=entity, **dict(opts)).where(*where(entity, keys))
+
+    return stmt.with_for_update() if lock else stmt
+
+
+@lru_cache(maxsize=1024)
+def count[E: Entity](entity: type[E], keys: tuple[str, ...]) -> sa.Select[int]:
+    return sa.select(sa.func.count()).select_from(entity).where(*where(entity, keys))
+
+
+@lru_cache(maxsize=1024)
+def ids[E: Entity](entity: type[E], keys: tuple[str, ...]) -> sa.Select[tuple[Any]]:
+    return sa.select(entity.id).where(*where(entity, keys))
+
+
+@lru_cache(maxsize=1024)
+def estimate[E: Entity](entity: type[E], keys: tuple[str, ...]) -> Explain:
+    return Explain(ids(entity, keys))
+
+
+@lru_cache(maxsize=1024)
+def get_many_by_offset[E: Entity](
+    entity: type[E],
+    loads: tuple[str, ...],
+    keys: tuple[str, ...],
+    order_by: str,
+    limited: bool,
+    offset: bool,
+    opts: Options,
+) -> sa.Select[tuple[E]]:
+    stmt = (
+        select_with_relations(*loads, entity=entity, **dict(opts))
+        .order_by(getattr(entity.id, order_by)())
+        .where(*where(entity, keys))
+    )
+    if limited:
+        stmt = stmt.limit(sa.bindparam(LIMIT_PARAM, type_=sa.Integer))
+    if offset:
+        stmt = stmt.offset(sa.bindparam(OFFSET_PARAM, type_=sa.Integer))
+
+    return stmt
+
+
+@lru_cache(maxsize=1024)
+def get_many_by_offset_windowed[E: Entity](
+    entity: type[E],
+    keys: tuple[str, ...],
+    order_by: str,
+    limited: bool,
+    offset: bool,
+    opts: Options,
+) -> sa.Select[tuple[E, int]]:
+    return get_many_by_offset(entity, (), keys, order_by, limited, offset, opts).add_columns(
+        windowed_total()
+    )
+
+
+def windowed_total() -> sa.Label[int]:
+    return sa.func.count().over().label(TOTAL_LABEL)
+
+
+@lru_cache(maxsize=1024)
+def get_many_by_cursor[E: Entity](
+    entity: type[E],
+    loads: tuple[str, ...],
+    keys: tuple[str, ...],
+    order_by: str,
+    cursor_type: str,
+    with_cursor: bool,
+    opts: Options,
+) -> sa.Select[tuple[E]]:
+    columns: tuple[Any, ...] = (
+        (entity.created_at, entity.id)  # type: ignore[attr-defined]
+        if cursor_type == "uuid"
+        else (entity.id,)
+    )
+    stmt = (
+        select_with_relations(*loads, entity=entity, **dict(opts))
+        .limit(sa.bindparam(LIMIT_PARAM, type_=sa.Integer))
+        .order_by(*(getattr(column, order_by)() for column in columns))
+        .where(*where(entity, keys))
+    )
+    if not with_cursor:
+        return stmt
+
+    bound_columns = sa.tuple_(*columns)
+    bound_values = sa.tuple_(
+        *(sa.bindparam(f"{CURSOR_PREFIX}{column.key}", type_=column.type) for column in columns)
+    )
+
+    return stmt.where(
+        bound_columns > bound_values if order_by == "asc" else bound_columns < bound_values
+    )
+
+
+@lru_cache(maxsize=1024)
+def create[E: Entity](entity: type[E], keys: tuple[str, ...]) -> ReturningInsert[E]:
+    return (
+        insert(entity)
+        .on_conflict_do_nothing()
+        .values({k: sa.bindparam(f"{VALUES_PREFIX}{k}") for k in keys})
+        .returning(entity)
+    )
+
+
+@lru_cache(maxsize=1024)
+def batch_create[E: Entity](entity: type[E]) -> ReturningInsert[E]:
+    return insert(entity).on_conflict_do_nothing().returning(entity)
+
+
+@lru_cache(maxsize=1024)
+def update[E: Entity](
+    entity: type[E], values: tuple[str, ...], keys: tuple[str, ...]
+) -> ReturningUpdate[E]:
+    return (
+        sa.update(entity)
+        .where(*where(entity, keys))
+        .values({k: sa.bindparam(f"{VALUES_PREFIX}{k}") for k in values})
+        .returning(entity)
+    )
+
+
+@lru_cache(maxsize=1024)
+def delete[E: Entity](entity: type[E], keys: tuple[str, ...]) -> ReturningDelete[E]:
+    return sa.delete(entity).where(*where(entity, keys)).returning(entity)
+
+
+def batch_update[E: Entity](
+    entity: type[E], key: str, columns: tuple[str, ...], rows: list[tuple[Any, ...]]
+) -> ReturningUpdate[E]:
+    table_columns = entity.__table__.c
+    values = sa.values(
+        *(sa.column(name, table_columns[name].type) for name in columns), name="batch"
+    ).data(rows)
+
+    return (
+        sa.update(entity)
+        .where(getattr(entity, key) == values.c[key])
+        .values({name: values.c[name] for name in columns if name != key})
+        .returning(entity)
+    )
+
+
+@lru_cache(maxsize=1024)
+def batch_delete[E: Entity](entity: type[E], key: str) -> ReturningDelete[E]:
+    column = entity.__table__.c[key]
+
+    return (
+        sa.delete(entity)
+        .where(column == sa.any_(sa.bindparam(KEYS_PARAM, type_=ARRAY(column.type))))
+        .returning(entity)
+    )
+
+
+@lru_cache(maxsize=1024)
+def exists[E: Entity](entity: type[E], keys: tuple[str, ...]) -> sa.Select[bool]:
+    return sa.exists(sa.select(entity.id).where(*where(entity, keys))).select()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.pool import QueuePool
+
+from src.database.alchemy.core import ConnectionFactory
+from src.database.interfaces.connection import AsyncConnection
+
+
+log = logging.getLogger(__name__)
+
+_prefer_primary: ContextVar[bool] = ContextVar("prefer_primary", default=False)
+
+
+def primary_preferred() -> bool:
+    return _prefer_primary.get()
+
+
+@contextmanager
+def prefer_primary() -> Iterator[None]:
+    token = _prefer_primary.set(True)
+    try:
+        yield
+    finally:
+        _prefer_primary.reset(token)
+
+
+def _in_flight(factory: ConnectionFactory) -> int:
+    pool = factory.engine.pool
+
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+class RoutingConnectionFactory:
+    __slots__ = (
+        "_primary",
+        "_replicas",
+        "_failed_at",
+        "_recovery_time",
+        "_turn",
+    )
+
+    def __init__(
+        self,
+        primary: ConnectionFactory,
+        *replicas: ConnectionFactory,
+        recovery_time: float = 5.0,
+    ) -> None:
+        self._primary = primary
+        self._replicas = replicas
+        self._failed_at = [float("-inf")] * len(replicas)
+        self._recovery_time = recovery_time
+        self._turn = itertools.count()
+
+        for index, replica in enumerate(replicas):
+            event.listen(replica.engine.sync_engine, "handle_error", partial(self._on_error, index))
+
+    @property
+    def primary(self) -> ConnectionFactory:
+        return self._primary
+
+    @property
+    def replicas(self) -> tuple[ConnectionFactory, ...]:
+        return self._replicas
+
+    def create_primary_connection(self) -> AsyncConnection:
+        return self._primary.create_connection()
+
+    def create_replica_connection(self) -> AsyncConnection:
+        if primary_preferred() or (replica := self._choose()) is None:
+            return self._primary.create_connection()
+
+        return replica.create_connection()
+
+    async def dispose(self) -> None:
+        await asyncio.gather(*(replica.engine.dispose() for replica in self._replicas))
+
+    def _choose(self) -> ConnectionFactory | None:
+        if not self._replicas:
+            return None
+
+        now = time.monotonic()
+        size = len(self._replicas)
+        start = next(self._turn) % size
+        healthy = (
+            index
+            for index in ((start + shift) % size for shift in range(size))
+            if now - self._failed_at[index] >= self._recovery_time
+        )
+        best = min(healthy, key=lambda index: _in_flight(self._replicas[index]), default=None)
+
+        return None if best is None else self._replicas[best]
+
+    def _on_error(self, index: int, context: ExceptionContext) -> None:
+        if not (context.is_disconnect or context.connection is None):
+            return
+
+        if time.monotonic() - self._failed_at[index] >= self._recovery_time:
+            log.warning(f"Replica #{index} is unavailable, skipping it for {self._recovery_time}s")
+        self._failed_at[index] = time.monotonic()
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from sqlalchemy.orm.strategy_options import _AbstractLoad
 
 DEFAULT_RELATIONSHIP_LOAD_LIMIT: Final[int] = 20
+CURSOR_DECODE_ERRORS: Final = (ValueError, TypeError)
 
 
 def _bfs_search[E: Entity](
@@ -196,7 +197,7 @@ def cursor_encoder(
 ) -> str:
     if type.lower() == "uuid" and isinstance(value, tuple):
         created_at, guid = value
-        encoded = base64.urlsafe_b64encode(encoder([created_at.timestamp(), guid.hex]).encode())
+        encoded = base64.urlsafe_b64encode(encoder([created_at.isoformat(), guid.hex]).encode())
     else:
         encoded = base64.urlsafe_b64encode(encoder(value).encode())
 
@@ -215,6 +216,8 @@ def cursor_decoder(
     if type.lower() == "uuid":
         decoded = decoder(base64.urlsafe_b64decode(value).decode())
         created_at, guid = decoded
+        if isinstance(created_at, str):
+            return datetime.fromisoformat(created_at), uuid.UUID(guid)
 
         return datetime.fromtimestamp(created_at, UTC), uuid.UUID(guid)
 
@@ -9,6 +9,7 @@ class OffsetPaginationResult[T]:
     limit: int | None
     offset: int | None
     total: int
+    is_estimate: bool = False
 
 
 @dataclass(frozen=True)
@@ -18,6 +19,12 @@ class CursorPaginationResult[C, T]:
     cursor: C | None
 
 
+@dataclass(frozen=True)
+class CopyResult:
+    inserted: int
+    rejected: Sequence[int]
+
+
 OrderBy = Literal["ASC", "DESC"]
 JsonLoads = Callable[..., Any]
 JsonDumps = Callable[..., str]
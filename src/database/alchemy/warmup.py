@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, cast
+
+import msgspec
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.alchemy.entity import Entity
+from src.database.alchemy.queries import base, raw
+from src.database.interfaces.connection import AsyncConnection
+from src.database.interfaces.query import Query
+
+
+def _sentinel_id(entity: type[Entity]) -> Any:
+    if entity.__table__.c.id.type.python_type is uuid.UUID:
+        return uuid.UUID(int=0)
+
+    return 0
+
+
+def priming_queries(
+    entity: type[Entity],
+    *into: type[msgspec.Struct],
+    estimate_threshold: int | None = None,
+) -> Iterator[Query[AsyncSession, Any]]:
+    id = _sentinel_id(entity)
+
+    yield base.GetOne.with_(entity)(id=id)
+    yield base.Exists.with_(entity)(id=id)
+    for struct in into:
+        for order_by in ("ASC", "DESC"):
+            yield raw.RawGetManyByOffset[Entity, Any].with_(entity)(
+                struct,
+                offset=0,
+                limit=1,
+                order_by=order_by,
+                estimate_threshold=estimate_threshold,
+            )
+
+
+async def prime_connection(
+    session: AsyncConnection, queries: Iterable[Query[AsyncSession, Any]]
+) -> None:
+    try:
+        for query in queries:
+            await query(cast(AsyncSession, session))
+    finally:
+        await session.rollback()
+
+
+async def warm_up_pool(
+    session_factory: Callable[[], AsyncConnection],
+    size: int,
+    entity: type[Entity],
+    *into: type[msgspec.Struct],
+    estimate_threshold: int | None = None,
+) -> None:
+    queries = list(priming_queries(entity, *into, estimate_threshold=estimate_threshold))
+
+    async def _open() -> None:
+        async with session_factory() as session:
+            await prime_connection(session, queries)
+
+    await asyncio.gather(*(_open() for _ in range(size)))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from types import TracebackType
 from typing import Any, Protocol, runtime_checkable
 
@@ -9,10 +11,17 @@ from src.database.interfaces.query import Query
 
 @runtime_checkable
 class TransactionManager(Protocol):
-    conn: AsyncConnection
+    @property
+    def conn(self) -> AsyncConnection: ...
 
     async def send[C: AsyncConnection, T](self, query: Query[C, T], /, **kw: Any) -> T: ...
     async def __call__[C: AsyncConnection, T](self, query: Query[C, T], /, **kw: Any) -> T: ...
+    async def send_many[C: AsyncConnection, T](
+        self, *queries: Query[C, T], concurrency: int | None = None, **kw: Any
+    ) -> list[T]: ...
+    def defer[C: AsyncConnection, T](self, query: Query[C, T], /) -> asyncio.Future[T]: ...
+    def on_commit(self, callback: Callable[[], Awaitable[Any]], /) -> None: ...
+    async def flush(self) -> None: ...
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -23,6 +32,10 @@ class TransactionManager(Protocol):
     async def commit(self) -> None: ...
     async def rollback(self) -> None: ...
     async def with_transaction(
-        self, isolation_level: IsolationLevel | None = None, nested: bool = False
+        self,
+        isolation_level: IsolationLevel | None = None,
+        nested: bool = False,
+        read_only: bool = False,
+        deferrable: bool = False,
     ) -> TransactionManager: ...
     async def close_transaction(self) -> None: ...
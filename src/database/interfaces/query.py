@@ -1,5 +1,6 @@
 import abc
-from typing import Any, Protocol, runtime_checkable
+from collections.abc import Hashable, Sequence
+from typing import Any, Protocol, Self, runtime_checkable
 
 from src.database.interfaces.connection import AsyncConnection
 
@@ -15,3 +16,14 @@ class Query[C: AsyncConnection, T](abc.ABC):
     @abc.abstractmethod
     async def __call__(self, conn: C, /, **kw: Any) -> T:
         raise NotImplementedError
+
+
+class BatchableQuery[C: AsyncConnection, T](Query[C, T]):
+    __slots__ = ()
+
+    def batch_key(self) -> Hashable | None:
+        return None
+
+    @classmethod
+    async def send_batch(cls, conn: C, queries: Sequence[Self], /) -> list[T]:
+        return [await query(conn) for query in queries]
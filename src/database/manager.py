@@ -1,30 +1,167 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Callable
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from types import TracebackType
 from typing import Any, cast
 
 from src.database.interfaces.connection import AsyncConnection, IsolationLevel
 from src.database.interfaces.manager import TransactionManager
-from src.database.interfaces.query import Query
+from src.database.interfaces.query import BatchableQuery, Query
+
+
+def _transaction_options(
+    isolation_level: IsolationLevel | None, read_only: bool, deferrable: bool
+) -> dict[str, Any]:
+    options: dict[str, Any] = {}
+    if isolation_level:
+        options["isolation_level"] = isolation_level.upper()
+    if read_only:
+        options["postgresql_readonly"] = True
+    if deferrable:
+        options["postgresql_deferrable"] = True
+
+    return options
 
 
 class TransactionManagerImpl:
     __slots__ = (
-        "conn",
+        "_conn",
+        "_conn_factory",
         "_is_tx_opened",
+        "_options",
+        "_deferred",
+        "_on_commit",
+        "_detached_reads",
     )
 
-    def __init__(self, conn: AsyncConnection) -> None:
-        self.conn = conn
+    def __init__(
+        self,
+        conn: AsyncConnection | None = None,
+        conn_factory: Callable[[], AsyncConnection] | None = None,
+    ) -> None:
+        assert conn is not None or conn_factory is not None, "Connection or factory must be set"
+        self._conn = conn
+        self._conn_factory = conn_factory
         self._is_tx_opened = False
+        self._options: dict[str, Any] = {}
+        self._deferred: list[tuple[Query[Any, Any], asyncio.Future[Any]]] = []
+        self._on_commit: list[Callable[[], Awaitable[Any]]] = []
+        self._detached_reads = False
+
+    @property
+    def conn(self) -> AsyncConnection:
+        if self._conn is None:
+            assert self._conn_factory is not None
+            self._conn = self._conn_factory()
+
+        return self._conn
+
+    async def _procure(self) -> AsyncConnection:
+        conn = self.conn
+        if self._options:
+            options, self._options = self._options, {}
+            await conn.connection(execution_options=options)
+
+        return conn
 
     async def send[C: AsyncConnection, T](self, query: Query[C, T], /, **kw: Any) -> T:
-        return await query(cast(C, self.conn), **kw)
+        if self._deferred:
+            await self.flush()
+
+        return await query(cast(C, await self._procure()), **kw)
 
     __call__ = send
 
+    async def send_many[C: AsyncConnection, T](
+        self, *queries: Query[C, T], concurrency: int | None = None, **kw: Any
+    ) -> list[T]:
+        if self._deferred:
+            await self.flush()
+
+        if len(queries) < 2 or not self._detachable():
+            return [await self.send(query, **kw) for query in queries]
+
+        semaphore = asyncio.Semaphore(concurrency or len(queries))
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(self._send_detached(semaphore, q, **kw)) for q in queries
+                ]
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from None
+
+        return [task.result() for task in tasks]
+
+    def defer[C: AsyncConnection, T](self, query: Query[C, T], /) -> asyncio.Future[T]:
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._deferred.append((query, future))
+
+        return future
+
+    def on_commit(self, callback: Callable[[], Awaitable[Any]], /) -> None:
+        self._on_commit.append(callback)
+
+    async def flush(self) -> None:
+        deferred, self._deferred = self._deferred, []
+        if not deferred:
+            return
+
+        groups: dict[Hashable, list[tuple[Query[Any, Any], asyncio.Future[Any]]]] = {}
+        for query, future in deferred:
+            key = query.batch_key() if isinstance(query, BatchableQuery) else None
+            groups.setdefault(object() if key is None else key, []).append((query, future))
+
+        try:
+            conn = await self._procure()
+            for group in groups.values():
+                first, _ = group[0]
+                if len(group) > 1 and isinstance(first, BatchableQuery):
+                    batch = cast(list[BatchableQuery[Any, Any]], [query for query, _ in group])
+                    results = await type(first).send_batch(conn, batch)
+                else:
+                    results = [await first(conn)]
+
+                for (_, future), result in zip(group, results, strict=True):
+                    future.set_result(result)
+        except BaseException as e:
+            self._discard_deferred(deferred, e)
+            raise
+
+    def _discard_deferred(
+        self,
+        deferred: list[tuple[Query[Any, Any], asyncio.Future[Any]]] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        if deferred is None:
+            deferred, self._deferred = self._deferred, []
+
+        for _, future in deferred:
+            if future.done():
+                continue
+            if error is None or isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+    def _detachable(self) -> bool:
+        if self._conn_factory is None:
+            return False
+        if self._is_tx_opened:
+            return self._detached_reads
+
+        return self._conn is None or not self._conn.in_transaction()
+
+    async def _send_detached[C: AsyncConnection, T](
+        self, semaphore: asyncio.Semaphore, query: Query[C, T], /, **kw: Any
+    ) -> T:
+        assert self._conn_factory is not None
+        async with semaphore, self._conn_factory() as conn:
+            await conn.begin()
+            await conn.connection(execution_options=_transaction_options(None, True, False))
+            return await query(cast(C, conn), **kw)
+
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -40,39 +177,63 @@ class TransactionManagerImpl:
         await self.close_transaction()
 
     async def __aenter__(self) -> TransactionManagerImpl:
-        await self.conn.__aenter__()
+        if self._conn is not None:
+            await self._conn.__aenter__()
         return self
 
     async def commit(self) -> None:
-        await self.conn.commit()
+        if self._deferred:
+            await self.flush()
+        if self._conn is not None:
+            await self._conn.commit()
+
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            await callback()
 
     async def rollback(self) -> None:
-        await self.conn.rollback()
+        self._discard_deferred()
+        self._on_commit = []
+        if self._conn is not None:
+            await self._conn.rollback()
 
     async def with_transaction(
-        self, isolation_level: IsolationLevel | None = None, nested: bool = False
+        self,
+        isolation_level: IsolationLevel | None = None,
+        nested: bool = False,
+        read_only: bool = False,
+        deferrable: bool = False,
     ) -> TransactionManagerImpl:
         assert self.conn.is_active, "Cannot start transaction on closed connection"
 
-        try:
-            if not self.conn.in_transaction() and not nested:
-                await self.conn.begin()
-            elif nested and self.conn.in_transaction():
-                await self.conn.begin_nested()
-            else:
-                raise AssertionError("You cannot start nested transaction with isolation level")
-            self._is_tx_opened = True
-        finally:
-            if isolation_level:
-                driver = await self.conn.connection()
-                await driver.exec_driver_sql(
-                    f"SET TRANSACTION ISOLATION LEVEL {isolation_level.upper()}"
-                )
+        if not self.conn.in_transaction() and not nested:
+            await self.conn.begin()
+            self._options = _transaction_options(isolation_level, read_only, deferrable)
+            # every read committed statement takes a fresh snapshot anyway, so reads
+            # on separate read-only sessions see nothing the shared one would not
+            self._detached_reads = read_only and isolation_level in (None, "READ COMMITTED")
+        elif nested and self.conn.in_transaction():
+            assert not (isolation_level or read_only or deferrable), (
+                "Nested transactions inherit the characteristics of the outer one"
+            )
+            await self.conn.begin_nested()
+        else:
+            raise AssertionError("You cannot start nested transaction with isolation level")
+        self._is_tx_opened = True
 
         return self
 
     async def close_transaction(self) -> None:
-        await self.conn.__aexit__(None, None, None)
+        self._discard_deferred()
+        self._on_commit = []
+        self._is_tx_opened = False
+        self._detached_reads = False
+        self._options = {}
+        if self._conn_factory is None:
+            await self.conn.__aexit__(None, None, None)
+        elif self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.__aexit__(None, None, None)
 
 
 class ManagerFactory:
@@ -96,9 +257,9 @@ class ManagerFactory:
         return self.make_transaction_manager()
 
     def make_transaction_manager(self) -> TransactionManager:
-        return TransactionManagerImpl(conn=self._conn_factory())
+        return TransactionManagerImpl(conn_factory=self._conn_factory)
 
     @asynccontextmanager
     async def make_manager_context(self) -> AsyncIterator[TransactionManager]:
-        async with TransactionManagerImpl(conn=self._conn_factory()) as manager:
+        async with TransactionManagerImpl(conn_factory=self._conn_factory) as manager:
             yield manager
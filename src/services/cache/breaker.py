@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from datetime import timedelta
+from typing import Any, Final, Literal
+
+from src.services.cache import metrics
+from src.services.interfaces.cache import Cache
+
+
+log = logging.getLogger(__name__)
+
+type BreakerState = Literal["closed", "half_open", "open"]
+
+_STATE_VALUES: Final[dict[BreakerState, int]] = {"closed": 0, "half_open": 1, "open": 2}
+
+
+class _Unavailable(Exception): ...
+
+
+def _prefix_pattern(key: str) -> str:
+    prefix, sep, _ = key.rpartition(":")
+
+    return f"{prefix}:*" if sep else key
+
+
+class CircuitBreakerCache[V]:
+    __slots__ = (
+        "_cache",
+        "_name",
+        "_timeout",
+        "_failure_threshold",
+        "_recovery_time",
+        "_max_pending",
+        "_state",
+        "_failures",
+        "_opened_at",
+        "_probing",
+        "_pending_names",
+        "_pending_keys",
+        "_pending_patterns",
+        "_pending_clear",
+    )
+
+    def __init__(
+        self,
+        cache: Cache[str, V],
+        name: str = "cache",
+        timeout: float = 0.1,
+        failure_threshold: int = 5,
+        recovery_time: float = 5.0,
+        max_pending: int = 10_000,
+    ) -> None:
+        assert failure_threshold > 0, "Failure threshold must be positive"
+
+        self._cache = cache
+        self._name = name
+        self._timeout = timeout
+        self._failure_threshold = failure_threshold
+        self._recovery_time = recovery_time
+        self._max_pending = max_pending
+        self._state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._pending_names: set[str] = set()
+        self._pending_keys: set[str] = set()
+        self._pending_patterns: set[str] = set()
+        self._pending_clear = False
+
+        metrics.CACHE_BREAKER_STATE.labels(name).set(_STATE_VALUES["closed"])
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        if self._state == "closed":
+            return True
+        if self._state == "open":
+            return time.monotonic() - self._opened_at >= self._recovery_time
+
+        return not self._probing
+
+    async def get(self, key: str) -> V | None:
+        try:
+            return await self._run(self._cache.get, key)
+        except _Unavailable:
+            return None
+
+    async def get_many(self, *keys: str) -> list[V | None]:
+        try:
+            return await self._run(self._cache.get_many, *keys)
+        except _Unavailable:
+            return [None] * len(keys)
+
+    async def set(
+        self, key: str, value: Any, expire: float | timedelta | None = None, **kw: Any
+    ) -> None:
+        try:
+            await self._run(self._cache.set, key, value, expire, **kw)
+        except _Unavailable:
+            self._defer_keys(key)
+
+    async def set_many(
+        self, values: Mapping[str, Any], expire: float | timedelta | None = None, **kw: Any
+    ) -> None:
+        try:
+            await self._run(self._cache.set_many, values, expire, **kw)
+        except _Unavailable:
+            self._defer_keys(*values)
+
+    async def exists(self, key: str) -> bool:
+        try:
+            return await self._run(self._cache.exists, key)
+        except _Unavailable:
+            return False
+
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self._run(self._cache.delete, *keys)
+        except _Unavailable:
+            self._pending_patterns.update(keys)
+
+    async def delete_many(self, *keys: str) -> None:
+        try:
+            await self._run(self._cache.delete_many, *keys)
+        except _Unavailable:
+            self._defer_keys(*keys)
+
+    async def set_list(
+        self, key: str, *values: Any, expire: float | timedelta | None = None, **kw: Any
+    ) -> None:
+        try:
+            await self._run(self._cache.set_list, key, *values, expire=expire, **kw)
+        except _Unavailable:
+            self._defer_keys(key)
+
+    async def get_list(self, key: str, **kw: Any) -> list[V]:
+        try:
+            return await self._run(self._cache.get_list, key, **kw)
+        except _Unavailable:
+            return []
+
+    async def discard(self, key: str, value: Any, **kw: Any) -> None:
+        try:
+            await self._run(self._cache.discard, key, value, **kw)
+        except _Unavailable:
+            self._defer_keys(key)
+
+    async def namespace(self, name: str) -> str:
+        try:
+            return await self._run(self._cache.namespace, name)
+        except _Unavailable:
+            return f"{name}:bypass"
+
+    async def invalidate(self, *names: str) -> None:
+        try:
+            await self._run(self._cache.invalidate, *names)
+        except _Unavailable:
+            self._pending_names.update(names)
+
+    async def clear(self) -> None:
+        try:
+            await self._run(self._cache.clear)
+        except _Unavailable:
+            self._defer_clear()
+
+    async def keys(self, match: str | None = None, count: int | None = None) -> AsyncIterator[str]:
+        if self._state != "closed":
+            return
+
+        try:
+            async for key in self._cache.keys(match, count):
+                yield key
+        except Exception:
+            self._on_failure()
+
+    async def close(self) -> None:
+        await self._cache.close()
+
+    async def _run[T](self, fn: Callable[..., Awaitable[T]], *args: Any, **kw: Any) -> T:
+        if not self._acquire():
+            raise _Unavailable
+
+        try:
+            try:
+                if self._has_pending():
+                    async with asyncio.timeout(self._timeout * 10):
+                        await self._replay()
+
+                async with asyncio.timeout(self._timeout):
+                    result = await fn(*args, **kw)
+            except Exception as e:
+                self._on_failure()
+                raise _Unavailable from e
+
+            self._failures = 0
+            self._transition("closed")
+        finally:
+            if self._state == "half_open":
+                self._probing = False
+
+        return result
+
+    def _acquire(self) -> bool:
+        if self._state == "closed":
+            return True
+
+        if self._state == "open":
+            if time.monotonic() - self._opened_at < self._recovery_time:
+                return False
+            self._transition("half_open")
+
+        if self._probing:
+            return False
+
+        self._probing = True
+        return True
+
+    def _on_failure(self) -> None:
+        self._failures += 1
+        if self._state == "half_open" or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+            self._transition("open")
+
+    def _has_pending(self) -> bool:
+        return bool(
+            self._pending_clear
+            or self._pending_names
+            or self._pending_keys
+            or self._pending_patterns
+        )
+
+    async def _replay(self) -> None:
+        if self._pending_clear:
+            await self._cache.clear()
+            self._pending_clear = False
+            self._pending_names.clear()
+
+        if self._pending_names:
+            names = tuple(self._pending_names)
+            await self._cache.invalidate(*names)
+            self._pending_names.difference_update(names)
+
+        if self._pending_keys:
+            keys = tuple(self._pending_keys)
+            await self._cache.delete_many(*keys)
+            self._pending_keys.difference_update(keys)
+
+        if self._pending_patterns:
+            patterns = tuple(self._pending_patterns)
+            await self._cache.delete(*patterns)
+            self._pending_patterns.difference_update(patterns)
+
+    def _defer_keys(self, *keys: str) -> None:
+        if self._pending_clear:
+            self._pending_patterns.update(_prefix_pattern(key) for key in keys)
+            return
+
+        self._pending_keys.update(keys)
+        if len(self._pending_keys) > self._max_pending:
+            self._defer_clear()
+
+    def _defer_clear(self) -> None:
+        # clear() only bumps namespaces, so plain keys fall back to prefix patterns
+        self._pending_clear = True
+        self._pending_patterns.update(_prefix_pattern(key) for key in self._pending_keys)
+        self._pending_keys.clear()
+
+    def _transition(self, state: BreakerState) -> None:
+        if state == self._state:
+            return
+
+        log.warning(f"Cache `{self._name}` circuit {self._state} -> {state}")
+        self._state = state
+        self._probing = False
+        metrics.CACHE_BREAKER_STATE.labels(self._name).set(_STATE_VALUES[state])
+        metrics.CACHE_BREAKER_TRANSITIONS.labels(self._name, state).inc()
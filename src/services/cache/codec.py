@@ -0,0 +1,28 @@
+import zlib
+from typing import Final
+
+
+RAW: Final[bytes] = b"\x00"
+ZLIB: Final[bytes] = b"\x01"
+
+
+def encode(value: str | bytes, threshold: int = 0, level: int = 1) -> bytes:
+    data = value.encode() if isinstance(value, str) else value
+
+    if threshold > 0 and len(data) > threshold:
+        compressed = zlib.compress(data, level)
+        if len(compressed) < len(data):
+            return ZLIB + compressed
+
+    return RAW + data
+
+
+def decode(value: bytes) -> bytes:
+    header = value[:1]
+
+    if header == ZLIB:
+        return zlib.decompress(value[1:])
+    if header == RAW:
+        return value[1:]
+
+    return value
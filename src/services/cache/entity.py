@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import cache
+from typing import Any
+
+import msgspec
+from sqlalchemy import inspect
+
+from src.database.alchemy.entity import Entity
+from src.services.interfaces.cache import BytesCache, Guarded
+
+
+type _Codec = tuple[tuple[str, ...], msgspec.msgpack.Encoder, msgspec.msgpack.Decoder[Any]]
+
+
+@cache
+def _codec(entity: type[Entity]) -> _Codec:
+    fields = tuple(
+        (attr.key, attr.columns[0].type.python_type) for attr in inspect(entity).column_attrs
+    )
+    row = msgspec.defstruct(f"{entity.__name__}Row", fields, array_like=True)
+
+    return (
+        tuple(name for name, _ in fields),
+        msgspec.msgpack.Encoder(uuid_format="bytes"),
+        msgspec.msgpack.Decoder(row),
+    )
+
+
+class EntityCache[E: Entity]:
+    __slots__ = (
+        "_cache",
+        "_entity",
+        "_prefix",
+        "_expire",
+    )
+
+    def __init__(
+        self, cache: BytesCache, entity: type[E], expire: float | timedelta | None = None
+    ) -> None:
+        self._cache = cache
+        self._entity = entity
+        self._prefix = f"entity:{entity.__tablename__}"
+        self._expire = expire
+
+    def key(self, id: Any) -> str:
+        return f"{self._prefix}:{id}"
+
+    async def get(self, id: Any) -> tuple[E | None, str | None]:
+        if isinstance(self._cache, Guarded) and not self._cache.available:
+            return None, None
+
+        key = await self._cache.namespace(self.key(id))
+        value = await self._cache.get(key)
+
+        return None if value is None else self._loads(value), key
+
+    async def fill(self, key: str, value: E) -> None:
+        await self._cache.set(key, self._dumps(value), expire=self._expire)
+
+    async def evict(self, *ids: Any) -> None:
+        await self._cache.invalidate(*(self.key(id) for id in ids))
+
+    def _dumps(self, value: E) -> bytes:
+        fields, encoder, _ = _codec(self._entity)
+
+        return encoder.encode([getattr(value, name) for name in fields])
+
+    def _loads(self, value: bytes) -> E:
+        fields, _, decoder = _codec(self._entity)
+        row = decoder.decode(value)
+
+        return self._entity(**{name: getattr(row, name) for name in fields})
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import random
+from array import array
+from typing import Final
+
+
+_MASK: Final[int] = (1 << 64) - 1
+
+
+class HotKeyTracker:
+    __slots__ = (
+        "_width",
+        "_depth",
+        "_rows",
+        "_salts",
+        "_top",
+        "_capacity",
+        "_window",
+        "_seen",
+        "_sample_rate",
+    )
+
+    def __init__(
+        self,
+        width: int = 2048,
+        depth: int = 4,
+        capacity: int = 32,
+        window: int = 100_000,
+        sample_rate: float = 1.0,
+    ) -> None:
+        assert width > 0 and depth > 0 and capacity > 0, "Sketch dimensions must be positive"
+        assert 0 < sample_rate <= 1, "Sample rate must be in (0, 1]"
+
+        self._width = width
+        self._depth = depth
+        self._rows = [array("L", [0]) * width for _ in range(depth)]
+        self._salts = [random.getrandbits(64) | 1 for _ in range(depth)]
+        self._top: dict[str, int] = {}
+        self._capacity = capacity
+        self._window = window
+        self._seen = 0
+        self._sample_rate = sample_rate
+
+    def sampled(self) -> bool:
+        return self._sample_rate >= 1 or random.random() < self._sample_rate
+
+    def add(self, key: str) -> None:
+        estimate = -1
+        for row, idx in zip(self._rows, self._indexes(key), strict=True):
+            row[idx] += 1
+            if estimate < 0 or row[idx] < estimate:
+                estimate = row[idx]
+
+        if key in self._top or len(self._top) < self._capacity:
+            self._top[key] = estimate
+        else:
+            floor = min(self._top, key=self._top.__getitem__)
+            if estimate > self._top[floor]:
+                del self._top[floor]
+                self._top[key] = estimate
+
+        self._seen += 1
+        if self._seen >= self._window:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        return min(row[idx] for row, idx in zip(self._rows, self._indexes(key), strict=True))
+
+    def top(self, n: int | None = None) -> list[tuple[str, int]]:
+        items = sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+
+        return items[:n] if n is not None else items
+
+    def reset(self) -> None:
+        for row in self._rows:
+            for idx in range(self._width):
+                row[idx] = 0
+        self._top.clear()
+        self._seen = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        h = hash(key) & _MASK
+
+        return [(((h * salt) & _MASK) >> 32) % self._width for salt in self._salts]
+
+    def _age(self) -> None:
+        for row in self._rows:
+            for idx in range(self._width):
+                row[idx] >>= 1
+        self._top = {k: v >> 1 for k, v in self._top.items() if v > 1}
+        self._seen = 0
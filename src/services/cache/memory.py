@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import heapq
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import AsyncIterator, Mapping
+from contextlib import suppress
+from datetime import timedelta
+from fnmatch import fnmatchcase
+from typing import Any, Literal, Self, override
+
+from src.config.core import CacheConfig
+
+
+type EvictionPolicy = Literal["lru", "lfu"]
+
+
+def _as_seconds(expire: float | timedelta | None) -> float | None:
+    if isinstance(expire, timedelta):
+        return expire.total_seconds()
+
+    return expire
+
+
+def _sizeof(value: Any) -> int:
+    if isinstance(value, str | bytes):
+        return len(value)
+    if isinstance(value, list):
+        return sum(_sizeof(v) for v in value)
+
+    return sys.getsizeof(value)
+
+
+class _Policy(abc.ABC):
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def add(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def touch(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def victim(self) -> str:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class _LRUPolicy(_Policy):
+    __slots__ = ("_order",)
+
+    def __init__(self) -> None:
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    @override
+    def add(self, key: str) -> None:
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    @override
+    def touch(self, key: str) -> None:
+        self._order.move_to_end(key)
+
+    @override
+    def remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    @override
+    def victim(self) -> str:
+        return next(iter(self._order))
+
+    @override
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class _LFUPolicy(_Policy):
+    __slots__ = (
+        "_freq",
+        "_buckets",
+        "_min",
+    )
+
+    def __init__(self) -> None:
+        self._freq: dict[str, int] = {}
+        self._buckets: defaultdict[int, OrderedDict[str, None]] = defaultdict(OrderedDict)
+        self._min = 0
+
+    @override
+    def add(self, key: str) -> None:
+        if key in self._freq:
+            self.touch(key)
+            return
+
+        self._freq[key] = 1
+        self._buckets[1][key] = None
+        self._min = 1
+
+    @override
+    def touch(self, key: str) -> None:
+        freq = self._freq[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min == freq:
+                self._min = freq + 1
+
+        self._freq[key] = freq + 1
+        self._buckets[freq + 1][key] = None
+
+    @override
+    def remove(self, key: str) -> None:
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min == freq:
+                self._min = min(self._buckets, default=0)
+
+    @override
+    def victim(self) -> str:
+        return next(iter(self._buckets[self._min]))
+
+    @override
+    def clear(self) -> None:
+        self._freq.clear()
+        self._buckets.clear()
+        self._min = 0
+
+
+class _Entry:
+    __slots__ = (
+        "value",
+        "expires_at",
+        "size",
+    )
+
+    def __init__(self, value: Any, expires_at: float | None, size: int) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class MemoryCache[V]:
+    __slots__ = (
+        "_data",
+        "_policy",
+        "_max_size",
+        "_size",
+        "_deadlines",
+        "_generations",
+        "_epoch",
+        "_sweep_interval",
+        "_sweeper",
+    )
+
+    def __init__(
+        self,
+        max_size: int = 64 * 1024 * 1024,
+        policy: EvictionPolicy = "lru",
+        sweep_interval: float = 1.0,
+    ) -> None:
+        assert max_size > 0, "Cache size must be positive"
+
+        self._data: dict[str, _Entry] = {}
+        self._policy: _Policy = _LFUPolicy() if policy == "lfu" else _LRUPolicy()
+        self._max_size = max_size
+        self._size = 0
+        self._deadlines: list[tuple[float, str]] = []
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._sweep_interval = sweep_interval
+        self._sweeper: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_config(cls, config: CacheConfig) -> Self:
+        return cls(
+            max_size=config.memory_max_size,
+            policy=config.memory_policy,
+            sweep_interval=config.memory_sweep_interval,
+        )
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def get(self, key: str) -> V | None:
+        entry = self._lookup(key)
+        if entry is None or isinstance(entry.value, list):
+            return None
+
+        value: V = entry.value
+        return value
+
+    async def get_many(self, *keys: str) -> list[V | None]:
+        return [await self.get(key) for key in keys]
+
+    async def set(
+        self, key: str, value: Any, expire: float | timedelta | None = None, **kw: Any
+    ) -> None:
+        self._store(key, value, _as_seconds(expire))
+
+    async def set_many(
+        self, values: Mapping[str, Any], expire: float | timedelta | None = None, **kw: Any
+    ) -> None:
+        ttl = _as_seconds(expire)
+        for key, value in values.items():
+            self._store(key, value, ttl)
+
+    async def exists(self, key: str) -> bool:
+        return self._lookup(key) is not None
+
+    async def delete(self, *keys: str) -> None:
+        for pattern in keys:
+            for key in [k for k in self._data if fnmatchcase(k, pattern)]:
+                self._remove(key)
+
+    async def delete_many(self, *keys: str) -> None:
+        for key in keys:
+            self._remove(key)
+
+    async def set_list(
+        self, key: str, *values: Any, expire: float | timedelta | None = None, **kw: Any
+    ) -> None:
+        entry = self._lookup(key)
+        current: list[Any] = entry.value if entry and isinstance(entry.value, list) else []
+        ttl = _as_seconds(expire)
+
+        self._store(
+            key,
+            [*reversed(values), *current],
+            ttl if ttl is not None or entry is None else self._remaining(entry),
+        )
+
+    async def get_list(self, key: str, **kw: Any) -> list[V]:
+        entry = self._lookup(key)
+        if entry is None or not isinstance(entry.value, list):
+            return []
+
+        start, end = kw.pop("start", 0), kw.pop("end", -1)
+        values: list[V] = entry.value
+
+        return values[start:] if end == -1 else values[start : end + 1]
+
+    async def discard(self, key: str, value: Any, **kw: Any) -> None:
+        entry = self._lookup(key)
+        if entry is None or not isinstance(entry.value, list):
+            return
+
+        count = kw.pop("count", 0)
+        values = entry.value if count >= 0 else entry.value[::-1]
+        kept, removed = [], 0
+        for v in values:
+            if v == value and (count == 0 or removed < abs(count)):
+                removed += 1
+                continue
+            kept.append(v)
+
+        self._store(key, kept if count >= 0 else kept[::-1], self._remaining(entry))
+
+    async def namespace(self, name: str) -> str:
+        return f"{name}:v{self._epoch}.{self._generations.get(name, 0)}"
+
+    async def invalidate(self, *names: str) -> None:
+        for name in names:
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    async def clear(self) -> None:
+        self._data.clear()
+        self._policy.clear()
+        self._deadlines.clear()
+        self._size = 0
+        self._epoch += 1
+
+    async def keys(self, match: str | None = None, count: int | None = None) -> AsyncIterator[str]:
+        now = time.monotonic()
+        for key, entry in list(self._data.items()):
+            if entry.expires_at is not None and entry.expires_at <= now:
+                continue
+            if match is None or fnmatchcase(key, match):
+                yield key
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+
+        await self.clear()
+
+    def _lookup(self, key: str) -> _Entry | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+
+        self._policy.touch(key)
+        return entry
+
+    def _store(self, key: str, value: Any, ttl: float | None) -> None:
+        size = len(key) + _sizeof(value)
+        if size > self._max_size:
+            self._remove(key)
+            return
+
+        if ttl is not None and ttl <= 0:
+            self._remove(key)
+            return
+
+        self._remove(key)
+        while self._size + size > self._max_size and self._data:
+            self._remove(self._policy.victim())
+
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = _Entry(value, expires_at, size)
+        self._policy.add(key)
+        self._size += size
+
+        if expires_at is not None:
+            heapq.heappush(self._deadlines, (expires_at, key))
+            self._ensure_sweeper()
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+
+        self._policy.remove(key)
+        self._size -= entry.size
+
+    @staticmethod
+    def _remaining(entry: _Entry) -> float | None:
+        if entry.expires_at is None:
+            return None
+
+        return max(entry.expires_at - time.monotonic(), 0)
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweeper is not None or self._sweep_interval <= 0:
+            return
+
+        with suppress(RuntimeError):
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep())
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, key = heapq.heappop(self._deadlines)
+            entry = self._data.get(key)
+            if entry is not None and entry.expires_at == deadline:
+                self._remove(key)
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            self._expire()
@@ -0,0 +1,64 @@
+from collections.abc import Iterator
+from typing import Any, Final
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+
+CACHE_REQUESTS: Final[Counter] = Counter(
+    "cache_requests_total",
+    "Cache lookups by route, DTO type and result (hit/miss/negative/bypass)",
+    ("route", "dto", "result"),
+)
+CACHE_LATENCY: Final[Histogram] = Histogram(
+    "cache_operation_duration_seconds",
+    "Latency of cache backend calls",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+CACHE_VALUE_SIZE: Final[Histogram] = Histogram(
+    "cache_value_size_bytes",
+    "Size of values stored in the cache by route and DTO type",
+    ("route", "dto"),
+    buckets=(64, 256, 1024, 4096, 16384, 65536, 262144, 1048576),
+)
+
+CACHE_BREAKER_STATE: Final[Gauge] = Gauge(
+    "cache_breaker_state",
+    "Circuit breaker state of a cache backend (0 closed, 1 half-open, 2 open)",
+    ("cache",),
+)
+CACHE_BREAKER_TRANSITIONS: Final[Counter] = Counter(
+    "cache_breaker_transitions_total",
+    "Circuit breaker transitions of a cache backend by target state",
+    ("cache", "state"),
+)
+
+
+class _RedisPoolCollector(Collector):
+    def __init__(self, pools: dict[str, Any]) -> None:
+        self._pools = pools
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        connections = GaugeMetricFamily(
+            "redis_pool_connections",
+            "Connections of the shared Redis pool by state (in_use/idle)",
+            labels=("pool", "state"),
+        )
+        limit = GaugeMetricFamily(
+            "redis_pool_max_connections",
+            "Configured connection limit of the shared Redis pool",
+            labels=("pool",),
+        )
+        for name, pool in self._pools.items():
+            connections.add_metric((name, "in_use"), len(pool._in_use_connections))
+            connections.add_metric((name, "idle"), len(pool._available_connections))
+            limit.add_metric((name,), pool.max_connections)
+
+        yield connections
+        yield limit
+
+
+REDIS_POOLS: Final[dict[str, Any]] = {}
+REGISTRY.register(_RedisPoolCollector(REDIS_POOLS))
@@ -0,0 +1,45 @@
+import asyncio
+
+import redis.asyncio as aioredis
+
+from src.config.core import RedisConfig
+from src.services.cache import metrics
+
+
+_pools: dict[str, aioredis.ConnectionPool] = {}
+
+
+def redis_pool(config: RedisConfig, with_metrics: bool = False) -> aioredis.ConnectionPool:
+    key = config.model_dump_json()
+    if (pool := _pools.get(key)) is not None:
+        return pool
+
+    pool = aioredis.ConnectionPool(
+        host=config.host,
+        port=config.port,
+        password=config.password,
+        max_connections=config.max_connections,
+        socket_timeout=config.socket_timeout,
+        socket_connect_timeout=config.socket_connect_timeout,
+        health_check_interval=config.health_check_interval,
+        protocol=config.protocol,
+        decode_responses=False,
+    )
+    _pools[key] = pool
+
+    if with_metrics:
+        metrics.REDIS_POOLS[f"{config.host}:{config.port}"] = pool
+
+    return pool
+
+
+def redis_client(config: RedisConfig, with_metrics: bool = False) -> aioredis.Redis:  # type: ignore[type-arg]
+    return aioredis.Redis(connection_pool=redis_pool(config, with_metrics))
+
+
+async def close_redis_pools() -> None:
+    pools = list(_pools.values())
+    _pools.clear()
+    metrics.REDIS_POOLS.clear()
+
+    await asyncio.gather(*(pool.aclose() for pool in pools))
@@ -1,55 +1,123 @@
+import abc
+from collections.abc import AsyncIterator, Mapping
 from datetime import timedelta
-from typing import Any
+from typing import Any, Final, Self, override
 
 import redis.asyncio as aioredis
 
-from src.config.core import RedisConfig
-from src.services.interfaces.cache import StrCache
+from src.config.core import CacheConfig, RedisConfig
+from src.services.cache import codec
+from src.services.cache.pool import redis_client
 
 
-class RedisCache:
-    __slots__ = ("_redis",)
+GENERATION_KEY: Final[str] = "__gen__"
 
-    def __init__(self, redis: aioredis.Redis) -> None:  # type: ignore[type-arg]
+
+def _as_timedelta(expire: float | timedelta | None) -> timedelta | None:
+    if expire is None or isinstance(expire, timedelta):
+        return expire
+
+    return timedelta(seconds=expire)
+
+
+class BaseRedisCache[V](abc.ABC):
+    __slots__ = (
+        "_redis",
+        "_compress_threshold",
+        "_compress_level",
+    )
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,  # type: ignore[type-arg]
+        compress_threshold: int = 0,
+        compress_level: int = 1,
+    ) -> None:
         self._redis = redis
+        self._compress_threshold = compress_threshold
+        self._compress_level = compress_level
 
     @classmethod
-    def from_config(cls, config: RedisConfig) -> StrCache:
-        return cls(aioredis.Redis(**config.model_dump(), decode_responses=True))
+    def from_config(
+        cls, config: RedisConfig, cache: CacheConfig | None = None, with_metrics: bool = False
+    ) -> Self:
+        cache = cache or CacheConfig()
+
+        return cls(
+            redis_client(config, with_metrics),
+            compress_threshold=cache.compress_threshold,
+            compress_level=cache.compress_level,
+        )
+
+    def _dump(self, value: Any) -> bytes:
+        return codec.encode(
+            value if isinstance(value, str | bytes) else str(value),
+            self._compress_threshold,
+            self._compress_level,
+        )
+
+    @abc.abstractmethod
+    def _load(self, value: bytes | str) -> V:
+        raise NotImplementedError
 
     async def get(
         self,
         key: str,
-    ) -> str | None:
-        return await self._redis.get(key)
+    ) -> V | None:
+        value = await self._redis.get(key)
+
+        return None if value is None else self._load(value)
+
+    async def get_many(self, *keys: str) -> list[V | None]:
+        if not keys:
+            return []
+
+        return [None if v is None else self._load(v) for v in await self._redis.mget(keys)]
 
     async def set(
         self, key: str, value: Any, expire: float | timedelta | None = None, **kw: Any
     ) -> None:
-        await self._redis.set(key, value, ex=expire, **kw)
+        await self._redis.set(key, self._dump(value), px=_as_timedelta(expire), **kw)
+
+    async def set_many(
+        self, values: Mapping[str, Any], expire: float | timedelta | None = None, **kw: Any
+    ) -> None:
+        if not values:
+            return
+
+        ttl = _as_timedelta(expire)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, self._dump(value), px=ttl, **kw)
+
+            await pipe.execute()
 
     async def delete(self, *keys: str) -> None:
         found_keys = [found for key in keys async for found in self._redis.scan_iter(key)]
         if found_keys:
-            await self._redis.delete(*found_keys)
+            await self._redis.unlink(*found_keys)
+
+    async def delete_many(self, *keys: str) -> None:
+        if keys:
+            await self._redis.unlink(*keys)
 
     async def set_list(
         self, key: str, *values: Any, expire: float | timedelta | None = None, **kw: Any
     ) -> None:
-        await self._redis.lpush(key, *(v for v in values))
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.lpush(key, *(self._dump(v) for v in values))
+            if ttl := _as_timedelta(expire):
+                pipe.pexpire(key, ttl, **kw)
 
-        if expire:
-            await self._redis.expire(
-                key, expire if isinstance(expire, timedelta) else timedelta(seconds=expire), **kw
-            )
+            await pipe.execute()
 
     async def get_list(
         self,
         key: str,
         **kw: Any,
-    ) -> list[str]:
+    ) -> list[V]:
         start, end = kw.pop("start", 0), kw.pop("end", -1)
-        return await self._redis.lrange(key, start, end)
+        return [self._load(v) for v in await self._redis.lrange(key, start, end)]
 
     async def discard(
         self,
@@ -58,16 +126,51 @@ class RedisCache:
         **kw: Any,
     ) -> None:
         count = kw.pop("count", 0)
-        await self._redis.lrem(key, count, value)
+        await self._redis.lrem(key, count, self._dump(value))  # type: ignore[arg-type]
+
+    async def namespace(self, name: str) -> str:
+        epoch, generation = await self._redis.mget(GENERATION_KEY, f"{GENERATION_KEY}:{name}")
+
+        return f"{name}:v{int(epoch or 0)}.{int(generation or 0)}"
+
+    async def invalidate(self, *names: str) -> None:
+        if not names:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.incr(f"{GENERATION_KEY}:{name}")
+
+            await pipe.execute()
 
     async def clear(self) -> None:
-        await self._redis.flushall(asynchronous=True)
+        await self._redis.incr(GENERATION_KEY)
 
     async def exists(self, key: str) -> bool:
-        return bool(await self._redis.keys(key))
+        return bool(await self._redis.exists(key))
 
-    async def keys(self) -> list[str]:
-        return await self._redis.keys("*")
+    async def keys(self, match: str | None = None, count: int | None = None) -> AsyncIterator[str]:
+        async for key in self._redis.scan_iter(match=match, count=count):
+            yield key.decode() if isinstance(key, bytes) else key
 
     async def close(self) -> None:
-        await self._redis.aclose(close_connection_pool=True)  # type: ignore
+        await self._redis.aclose()
+
+
+class RedisCache(BaseRedisCache[str]):
+    __slots__ = ()
+
+    @override
+    def _load(self, value: bytes | str) -> str:
+        if isinstance(value, str):
+            return value
+
+        return codec.decode(value).decode()
+
+
+class RedisBytesCache(BaseRedisCache[bytes]):
+    __slots__ = ()
+
+    @override
+    def _load(self, value: bytes | str) -> bytes:
+        return codec.decode(value.encode() if isinstance(value, str) else value)
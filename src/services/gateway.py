@@ -4,6 +4,7 @@ from collections.abc import Callable
 from typing import Protocol, TypedDict, cast, runtime_checkable
 
 from src.database.interfaces.manager import TransactionManager
+from src.services.interfaces.cache import BytesCache
 from src.services.internal.user.core import UserService, UserServiceImpl
 
 
@@ -23,11 +24,26 @@ class ServiceGatewayImpl:
     __slots__ = (
         "_manager",
         "_cache",
+        "_entity_cache",
+        "_entity_cache_time",
+        "_estimate_threshold",
+        "_read_through",
     )
 
-    def __init__(self, manager: TransactionManager) -> None:
+    def __init__(
+        self,
+        manager: TransactionManager,
+        entity_cache: BytesCache | None = None,
+        entity_cache_time: float | None = None,
+        estimate_threshold: int | None = None,
+        read_through: bool = True,
+    ) -> None:
         self._manager = manager
         self._cache: _ServiceCache = {}
+        self._entity_cache = entity_cache
+        self._entity_cache_time = entity_cache_time
+        self._estimate_threshold = estimate_threshold
+        self._read_through = read_through
 
     @property
     def manager(self) -> TransactionManager:
@@ -39,7 +55,13 @@ class ServiceGatewayImpl:
 
     def _get_or_create[S](self, key: str, factory: Callable[..., S]) -> S:
         if not (service := self._cache.get(key)):
-            service = factory(self._manager)
+            service = factory(
+                self._manager,
+                self._entity_cache,
+                self._entity_cache_time,
+                self._estimate_threshold,
+                self._read_through,
+            )
 
             self._cache[key] = service  # type: ignore[literal-required]
 
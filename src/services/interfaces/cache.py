@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator, Mapping
 from datetime import timedelta
 from typing import Any, Protocol, runtime_checkable
 
@@ -5,11 +6,18 @@ from typing import Any, Protocol, runtime_checkable
 @runtime_checkable
 class Cache[K, V](Protocol):
     async def get(self, key: K) -> V | None: ...
+    async def get_many(self, *keys: K) -> list[V | None]: ...
     async def set(
         self, key: K, value: Any, expire: float | timedelta | None = None, **kw: Any
     ) -> None: ...
+    async def set_many(
+        self, values: Mapping[K, Any], expire: float | timedelta | None = None, **kw: Any
+    ) -> None: ...
     async def exists(self, key: K) -> bool: ...
     async def delete(self, *keys: K) -> None: ...
+    async def delete_many(self, *keys: K) -> None: ...
+    async def namespace(self, name: K) -> K: ...
+    async def invalidate(self, *names: K) -> None: ...
     async def clear(self) -> None: ...
     async def close(self) -> None: ...
     async def set_list(
@@ -17,8 +25,18 @@ class Cache[K, V](Protocol):
     ) -> None: ...
     async def get_list(self, key: K) -> list[V]: ...
     async def discard(self, key: K, value: Any, **kw: Any) -> None: ...
-    async def keys(self) -> list[K]: ...
+    def keys(self, match: K | None = None, count: int | None = None) -> AsyncIterator[K]: ...
 
 
 @runtime_checkable
 class StrCache(Cache[str, str], Protocol): ...
+
+
+@runtime_checkable
+class BytesCache(Cache[str, bytes], Protocol): ...
+
+
+@runtime_checkable
+class Guarded(Protocol):
+    @property
+    def available(self) -> bool: ...
@@ -1,41 +1,106 @@
+import functools
+import json
 import uuid
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import Protocol, Unpack, runtime_checkable
 
+import msgspec
+
 from src.common import exceptions as exc
 from src.database.alchemy import entity, queries
-from src.database.alchemy.types import OffsetPaginationResult, OrderBy
+from src.database.alchemy.tools import CURSOR_DECODE_ERRORS, cursor_decoder
+from src.database.alchemy.types import (
+    CopyResult,
+    CursorPaginationResult,
+    OffsetPaginationResult,
+    OrderBy,
+)
 from src.database.interfaces.manager import TransactionManager
 from src.services import tools
-from src.services.internal.user.types import UserCreate, UserUpdate
+from src.services.cache.entity import EntityCache
+from src.services.interfaces.cache import BytesCache
+from src.services.internal.user.types import UserBatchUpdate, UserCreate, UserUpdate
 
 
 @runtime_checkable
 class UserService(Protocol):
     async def create(self, **data: Unpack[UserCreate]) -> entity.User: ...
+    async def import_many(self, rows: Mapping[int, UserCreate]) -> CopyResult: ...
     async def update(self, id: uuid.UUID, **data: Unpack[UserUpdate]) -> entity.User: ...
     async def delete(self, id: uuid.UUID) -> bool: ...
+    async def update_many(
+        self, rows: Sequence[UserBatchUpdate], chunk_size: int | None = None
+    ) -> Sequence[entity.User]: ...
+    async def delete_many(
+        self, ids: Sequence[uuid.UUID], chunk_size: int | None = None
+    ) -> Sequence[uuid.UUID]: ...
     async def get_one(self, id: uuid.UUID) -> entity.User: ...
     async def get_many_by_offset(
         self,
         offset: int,
         limit: int,
         order_by: OrderBy = "ASC",
+        exact: bool = False,
     ) -> OffsetPaginationResult[entity.User]: ...
+    async def get_many_by_offset_as[T: msgspec.Struct](
+        self,
+        into: type[T],
+        offset: int,
+        limit: int,
+        order_by: OrderBy = "ASC",
+        exact: bool = False,
+    ) -> OffsetPaginationResult[T]: ...
+    async def get_many_by_cursor(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: OrderBy = "ASC",
+    ) -> CursorPaginationResult[str, entity.User]: ...
+    async def stream_as[T: msgspec.Struct](
+        self,
+        into: type[T],
+        batch_size: int,
+        order_by: OrderBy = "ASC",
+    ) -> AsyncIterator[list[T]]: ...
     async def exists(self, id: uuid.UUID) -> None: ...
 
 
 class UserServiceImpl:
-    __slots__ = ("_manager",)
+    __slots__ = (
+        "_manager",
+        "_cache",
+        "_estimate_threshold",
+        "_read_through",
+    )
 
-    def __init__(self, manager: TransactionManager) -> None:
+    def __init__(
+        self,
+        manager: TransactionManager,
+        cache: BytesCache | None = None,
+        cache_time: float | None = None,
+        estimate_threshold: int | None = None,
+        read_through: bool = True,
+    ) -> None:
         self._manager = manager
+        self._estimate_threshold = estimate_threshold or None
+        self._read_through = read_through
+        self._cache = EntityCache(cache, entity.User, cache_time) if cache else None
 
     async def get_one(self, id: uuid.UUID) -> entity.User:
+        key = None
+        if self._cache:
+            cached, key = await self._cache.get(id)
+            if cached:
+                return cached
+
         result = await self._manager.send(queries.base.GetOne.with_(entity.User)(id=id))
 
         if not result:
             raise exc.NotFoundError("No such user")
 
+        if self._cache and key and self._read_through:
+            await self._cache.fill(key, result)
+
         return result
 
     async def get_many_by_offset(
@@ -43,10 +108,68 @@ class UserServiceImpl:
         offset: int,
         limit: int,
         order_by: OrderBy = "ASC",
+        exact: bool = False,
     ) -> OffsetPaginationResult[entity.User]:
         result = await self._manager.send(
             queries.base.GetManyByOffset.with_(entity.User)(
-                offset=offset, limit=limit, order_by=order_by
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                estimate_threshold=None if exact else self._estimate_threshold,
+            )
+        )
+
+        return result
+
+    async def get_many_by_offset_as[T: msgspec.Struct](
+        self,
+        into: type[T],
+        offset: int,
+        limit: int,
+        order_by: OrderBy = "ASC",
+        exact: bool = False,
+    ) -> OffsetPaginationResult[T]:
+        result = await self._manager.send(
+            queries.raw.RawGetManyByOffset[entity.User, T].with_(entity.User)(
+                into,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                estimate_threshold=None if exact else self._estimate_threshold,
+            )
+        )
+
+        return result
+
+    async def get_many_by_cursor(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: OrderBy = "ASC",
+    ) -> CursorPaginationResult[str, entity.User]:
+        if cursor:
+            try:
+                cursor_decoder(cursor, json.loads, "UUID")
+            except CURSOR_DECODE_ERRORS:
+                raise exc.BadRequestError("Invalid cursor") from None
+
+        result = await self._manager.send(
+            queries.base.GetManyByCursor.with_(entity.User)(
+                limit=limit, cursor=cursor, order_by=order_by, cursor_type="UUID"
+            )
+        )
+
+        return result
+
+    async def stream_as[T: msgspec.Struct](
+        self,
+        into: type[T],
+        batch_size: int,
+        order_by: OrderBy = "ASC",
+    ) -> AsyncIterator[list[T]]:
+        result = await self._manager.send(
+            queries.raw.StreamManyAs[entity.User, T].with_(entity.User)(
+                into, order_by=order_by, batch_size=batch_size
             )
         )
 
@@ -61,15 +184,26 @@ class UserServiceImpl:
 
         return result
 
+    @tools.on_error(
+        base_message="Users cannot be imported: {reason}", should_raise=exc.BadRequestError
+    )
+    async def import_many(self, rows: Mapping[int, UserCreate]) -> CopyResult:
+        result = await self._manager.send(
+            queries.raw.CopyCreate.with_(entity.User)(rows, tuple(UserCreate.__annotations__))
+        )
+
+        return result
+
     @tools.on_error("login", should_raise=exc.ConflictError)
     async def update(self, id: uuid.UUID, **data: Unpack[UserUpdate]) -> entity.User:
-        await self.exists(id)
         result = await self._manager.send(
             queries.base.Update.with_(entity.User)(data).filter(id=id)
         )
 
         if not result:
-            raise exc.ConflictError("User were not updated", id=id)
+            raise exc.NotFoundError("No such user")
+
+        self._evict_on_commit(id)
 
         return result[0]
 
@@ -77,13 +211,53 @@ class UserServiceImpl:
         base_message="User cannot be deleted: {reason}", should_raise=exc.BadRequestError
     )
     async def delete(self, id: uuid.UUID) -> bool:
-        await self.exists(id)
         result = await self._manager.send(queries.base.Delete.with_(entity.User)(id=id))
 
-        return bool(result)
+        if not result:
+            raise exc.NotFoundError("No such user")
+
+        self._evict_on_commit(id)
+
+        return True
+
+    @tools.on_error("login", should_raise=exc.ConflictError)
+    async def update_many(
+        self, rows: Sequence[UserBatchUpdate], chunk_size: int | None = None
+    ) -> Sequence[entity.User]:
+        updated: list[entity.User] = []
+        for chunk in tools.chunked(rows, chunk_size):
+            result = await self._manager.send(queries.base.BatchUpdate.with_(entity.User)(chunk))
+            updated.extend(result)
+
+            self._evict_on_commit(*(user.id for user in result))
+            if chunk_size:
+                await self._manager.commit()
+
+        return updated
+
+    @tools.on_error(
+        base_message="Users cannot be deleted: {reason}", should_raise=exc.BadRequestError
+    )
+    async def delete_many(
+        self, ids: Sequence[uuid.UUID], chunk_size: int | None = None
+    ) -> Sequence[uuid.UUID]:
+        deleted: list[uuid.UUID] = []
+        for chunk in tools.chunked(ids, chunk_size):
+            result = await self._manager.send(queries.base.BatchDelete.with_(entity.User)(chunk))
+            deleted.extend(user.id for user in result)
+
+            self._evict_on_commit(*(user.id for user in result))
+            if chunk_size:
+                await self._manager.commit()
+
+        return deleted
 
     async def exists(self, id: uuid.UUID) -> None:
         result = await self._manager.send(queries.base.Exists.with_(entity.User)(id=id))
 
         if not result:
             raise exc.NotFoundError("No such user")
+
+    def _evict_on_commit(self, *ids: uuid.UUID) -> None:
+        if self._cache and ids:
+            self._manager.on_commit(functools.partial(self._cache.evict, *ids))
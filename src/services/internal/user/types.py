@@ -1,3 +1,4 @@
+import uuid
 from typing import TypedDict
 
 
@@ -9,3 +10,7 @@ class UserCreate(TypedDict):
 class UserUpdate(TypedDict, total=False):
     login: str
     password: str
+
+
+class UserBatchUpdate(UserUpdate):
+    id: uuid.UUID
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterator, Sequence
 from functools import wraps
 from typing import Any, NoReturn
 
@@ -24,6 +24,16 @@ def _raise_error(
     raise error
 
 
+def chunked[T](values: Sequence[T], size: int | None = None) -> Iterator[Sequence[T]]:
+    if not size or size >= len(values):
+        if values:
+            yield values
+        return
+
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
 def on_error[**P, R](
     *uniques: str,
     should_raise: type[AppException] | AppException = AppException,
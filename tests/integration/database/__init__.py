@@ -0,0 +1 @@
+from tests.integration.conftest import *  # noqa
@@ -0,0 +1,82 @@
+import uuid
+
+from src.database.alchemy import entity, queries
+from src.database.alchemy.core import ConnectionFactory
+from src.database.manager import TransactionManagerImpl
+from src.services.internal.user.core import UserServiceImpl
+from tests.integration.conftest import *  # noqa
+
+
+async def test_update_many_with_mixed_and_duplicate_rows(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+    service = UserServiceImpl(manager)
+
+    async with await manager.with_transaction():
+        first = await service.create(login="first", password="password")
+        second = await service.create(login="second", password="password")
+
+        updated = await service.update_many(
+            [
+                {"id": first.id, "login": "first_1"},
+                {"id": second.id, "password": "changed"},
+                {"id": first.id, "password": "changed"},
+                {"id": first.id, "login": "first_2"},
+            ]
+        )
+
+    assert {user.id for user in updated} == {first.id, second.id}
+
+    async with manager:
+        users = await manager.send(queries.base.GetManyByOffset.with_(entity.User)(order_by="ASC"))
+
+    by_id = {user.id: user for user in users.items}
+    assert by_id[first.id].login == "first_2" and by_id[first.id].password == "changed"
+    assert by_id[second.id].login == "second" and by_id[second.id].password == "changed"
+
+
+async def test_deferred_creates_match_rows_by_value(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+    create = queries.base.Create.with_(entity.User)
+
+    async with await manager.with_transaction():
+        first = manager.defer(create(login="first", password="password"))
+        duplicate = manager.defer(create(login="first", password="other"))
+        second = manager.defer(create(login="second", password="password"))
+        await manager.flush()
+
+    first_user, second_user = await first, await second
+    assert first_user is not None and second_user is not None
+    assert first_user.login == "first" and first_user.password == "password"
+    assert second_user.login == "second"
+    assert await duplicate is None
+
+
+async def test_deferred_updates_and_deletes_by_id(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    async with await manager.with_transaction():
+        first, second, third = [
+            await manager.send(
+                queries.base.Create.with_(entity.User)(login=login, password="password")
+            )
+            for login in ("first", "second", "third")
+        ]
+        assert first and second and third
+
+        update = queries.base.Update.with_(entity.User)
+        delete = queries.base.Delete.with_(entity.User)
+        renamed = manager.defer(update({"login": "first_1"}, id=first.id))
+        renamed_again = manager.defer(update({"login": "first_2"}, id=first.id))
+        removed = manager.defer(delete(id=second.id))
+        removed_twice = manager.defer(delete(id=second.id))
+        missing = manager.defer(delete(id=uuid.uuid4()))
+
+    assert [user.login for user in await renamed] == ["first_1"]
+    assert [user.login for user in await renamed_again] == ["first_2"]
+    assert [user.id for user in await removed] == [second.id]
+    assert await removed_twice == [] and await missing == []
+
+    async with manager:
+        users = await manager.send(queries.base.GetManyByOffset.with_(entity.User)())
+
+    assert {user.login for user in users.items} == {"first_2", "third"}
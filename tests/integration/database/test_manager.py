@@ -0,0 +1,107 @@
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.alchemy.core import ConnectionFactory
+from src.database.interfaces.query import Query
+from src.database.manager import TransactionManagerImpl
+from tests.integration.conftest import *  # noqa
+
+
+class Show(Query[AsyncSession, str]):
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> str:
+        value: str = (await conn.execute(sa.text(f"SHOW {self._name}"))).scalar_one()
+
+        return value
+
+
+async def test_transaction_options_wait_for_first_query(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    async with await manager.with_transaction(isolation_level="SERIALIZABLE", read_only=True):
+        assert connection.engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+
+        assert await manager.send(Show("transaction_read_only")) == "on"
+        assert await manager.send(Show("transaction_isolation")) == "serializable"
+        assert connection.engine.pool.checkedout() == 1  # type: ignore[attr-defined]
+
+    assert connection.engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+
+
+async def test_unused_transaction_never_checks_out(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    async with await manager.with_transaction(read_only=True):
+        pass
+
+    assert connection.engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+
+    async with await manager.with_transaction():
+        assert await manager.send(Show("transaction_read_only")) == "off"
+
+
+class BackendPid(Query[AsyncSession, int]):
+    __slots__ = ()
+
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> int:
+        pid: int = (
+            await conn.execute(sa.text("SELECT pg_backend_pid() FROM pg_sleep(0.1)"))
+        ).scalar_one()
+
+        return pid
+
+
+class Write(Query[AsyncSession, None]):
+    __slots__ = ()
+
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> None:
+        await conn.execute(sa.text("CREATE TEMP TABLE send_many_write (id int)"))
+
+
+async def test_send_many_runs_detached_reads_concurrently(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    pids = await manager.send_many(BackendPid(), BackendPid(), BackendPid())
+    settings = await manager.send_many(Show("transaction_read_only"), Show("transaction_read_only"))
+
+    assert len(set(pids)) == 3
+    assert settings == ["on", "on"]
+    assert connection.engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+
+
+async def test_send_many_rejects_detached_writes(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    with pytest.raises(sa.exc.DBAPIError, match="read-only transaction"):
+        await manager.send_many(Write(), BackendPid())
+
+
+async def test_send_many_in_transaction_shares_connection(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    async with await manager.with_transaction():
+        pids = await manager.send_many(BackendPid(), BackendPid())
+
+    assert len(set(pids)) == 1
+
+
+async def test_send_many_in_read_only_transaction_runs_detached(
+    connection: ConnectionFactory,
+) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    async with await manager.with_transaction(read_only=True):
+        pids = await manager.send_many(BackendPid(), BackendPid())
+
+    async with await manager.with_transaction(isolation_level="REPEATABLE READ", read_only=True):
+        snapshot = await manager.send_many(BackendPid(), BackendPid())
+
+    assert len(set(pids)) == 2
+    assert len(set(snapshot)) == 1
@@ -0,0 +1,72 @@
+import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.alchemy import entity, queries
+from src.database.alchemy.core import ConnectionFactory
+from src.database.interfaces.query import Query
+from src.database.manager import TransactionManagerImpl
+from tests.integration.conftest import *  # noqa
+
+
+_SNAPSHOT = sa.select(sa.func.current_setting("transaction_read_only"), sa.func.now())
+
+
+class RawSnapshot(queries.raw.RawQuery[entity.User, tuple[str, datetime.datetime]]):
+    __slots__ = ()
+
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> tuple[str, datetime.datetime]:
+        (record,) = await self._fetch(conn, _SNAPSHOT, {})
+
+        return record[0], record[1]
+
+
+class Snapshot(Query[AsyncSession, tuple[str, datetime.datetime]]):
+    __slots__ = ()
+
+    async def __call__(self, conn: AsyncSession, /, **kw: Any) -> tuple[str, datetime.datetime]:
+        read_only, now = (await conn.execute(_SNAPSHOT)).one()
+
+        return read_only, now
+
+
+async def test_raw_query_joins_manager_transaction(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    async with await manager.with_transaction(read_only=True):
+        read_only, first = await manager.send(RawSnapshot())
+
+        assert manager.conn.in_transaction()
+
+        _, second = await manager.send(RawSnapshot())
+        _, orm = await manager.send(Snapshot())
+
+    assert read_only == "on"
+    # now() is frozen at BEGIN, so equal values mean a single transaction
+    assert first == second == orm
+
+
+async def test_raw_query_before_orm_query(connection: ConnectionFactory) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    async with await manager.with_transaction():
+        _, orm = await manager.send(Snapshot())
+        read_only, raw = await manager.send(RawSnapshot())
+
+    assert read_only == "off" and orm == raw
+
+
+async def test_raw_query_starts_a_new_transaction_after_commit(
+    connection: ConnectionFactory,
+) -> None:
+    manager = TransactionManagerImpl(conn_factory=connection)
+
+    async with await manager.with_transaction():
+        _, first = await manager.send(RawSnapshot())
+        await manager.commit()
+        _, second = await manager.send(RawSnapshot())
+        _, orm = await manager.send(Snapshot())
+
+    assert first < second == orm
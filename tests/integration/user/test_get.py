@@ -1,3 +1,4 @@
+import json
 import uuid
 
 from litestar import Litestar
@@ -65,6 +66,7 @@ async def test_get_many_by_offset_user_success(
     data = response.json()
 
     assert response.status_code == 200 and data["total"] == 10 and len(data["items"]) == 10
+    assert data["is_estimate"] is False
 
     response = await client.get(
         f"{app_config.app.root_path}/v1/users", params={"page": 2, "limit": 10}
@@ -73,3 +75,62 @@ async def test_get_many_by_offset_user_success(
     data = response.json()
 
     assert response.status_code == 200 and data["total"] == 10 and len(data["items"]) == 0
+
+
+async def test_get_many_by_cursor_user_success(
+    client: AsyncTestClient[Litestar], app_config: Config
+) -> None:
+    for i in range(25):
+        user = CreateUser(login=f"test_{i}", password="test_test")
+
+        response = await client.post(f"{app_config.app.root_path}/v1/users", json=user.as_mapping())
+
+        assert response.status_code == 201
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"limit": 10}
+
+    while True:
+        response = await client.get(f"{app_config.app.root_path}/v1/users/cursor", params=params)
+
+        assert response.status_code == 200
+
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+
+        if not data["cursor"]:
+            break
+
+        params["cursor"] = data["cursor"]
+
+    assert len(seen) == 25 and len(set(seen)) == 25
+
+
+async def test_get_many_by_cursor_user_failed(
+    client: AsyncTestClient[Litestar], app_config: Config
+) -> None:
+    response = await client.get(
+        f"{app_config.app.root_path}/v1/users/cursor", params={"cursor": "invalid"}
+    )
+
+    assert response.status_code == 400
+
+
+async def test_export_users_success(client: AsyncTestClient[Litestar], app_config: Config) -> None:
+    for i in range(150):
+        user = CreateUser(login=f"test_{i}", password="test_test")
+
+        response = await client.post(f"{app_config.app.root_path}/v1/users", json=user.as_mapping())
+
+        assert response.status_code == 201
+
+    response = await client.get(
+        f"{app_config.app.root_path}/v1/users/export", params={"batch_size": 100}
+    )
+
+    assert response.status_code == 200
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert len(lines) == 150 and len({line["id"] for line in lines}) == 150
+    assert all(line.get("password") is None for line in lines)
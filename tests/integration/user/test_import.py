@@ -0,0 +1,56 @@
+from tests.integration.conftest import *  # noqa
+
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+from src.api.v1.commands.user.create import CreateUser
+from src.config.core import Config
+
+
+async def test_user_import_ndjson_success(
+    client: AsyncTestClient[Litestar], app_config: Config
+) -> None:
+    existing = CreateUser(login="test_0", password="test_test")
+
+    response = await client.post(f"{app_config.app.root_path}/v1/users", json=existing.as_mapping())
+
+    assert response.status_code == 201
+
+    lines = [CreateUser(login=f"test_{i}", password="test_test").as_string() for i in range(5)]
+    lines.insert(2, '{"login": "broken"}')
+
+    response = await client.post(
+        f"{app_config.app.root_path}/v1/users/import",
+        content="\n".join(lines).encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+
+    data = response.json()
+
+    assert data["inserted"] == 4
+    assert data["rejected"] == [
+        {"row": 1, "reason": "conflict"},
+        {"row": 3, "reason": "invalid"},
+    ]
+    assert data["rejected_total"] == 2
+
+
+async def test_user_import_csv_success(
+    client: AsyncTestClient[Litestar], app_config: Config
+) -> None:
+    content = "login,password\ntest_a,test_test\ntest_b,test_test\nTEST_A,test_test\n"
+
+    response = await client.post(
+        f"{app_config.app.root_path}/v1/users/import",
+        content=content.encode(),
+        headers={"Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+
+    data = response.json()
+
+    assert data["inserted"] == 2
+    assert data["rejected"] == [{"row": 3, "reason": "conflict"}]
+    assert data["rejected_total"] == 1
@@ -1,5 +1,7 @@
 from tests.integration.conftest import *  # noqa
 
+import uuid
+
 from litestar import Litestar
 from litestar.testing import AsyncTestClient
 from src.api.v1.commands.user.update import UpdateUser
@@ -66,3 +68,15 @@ async def test_user_update_same_login_failed(
     )
 
     assert response.status_code == 409 or not response.json()["status"]
+
+
+async def test_user_update_not_found_failed(
+    client: AsyncTestClient[Litestar], app_config: Config
+) -> None:
+    update = UpdateUser(login="new_test")
+
+    response = await client.patch(
+        f"{app_config.app.root_path}/v1/users/{uuid.uuid4()}", json=update.as_mapping()
+    )
+
+    assert response.status_code == 404
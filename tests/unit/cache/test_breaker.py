@@ -0,0 +1,125 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.services.cache.breaker import CircuitBreakerCache
+from src.services.cache.memory import MemoryCache
+from tests.unit.conftest import *  # noqa
+
+
+class FlakyCache:
+    def __init__(self, cache: MemoryCache[str]) -> None:
+        self.cache = cache
+        self.down = False
+        self.calls: list[str] = []
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        fn = getattr(self.cache, name)
+
+        async def call(*args: Any, **kw: Any) -> Any:
+            if self.down:
+                raise ConnectionError(name)
+            self.calls.append(name)
+
+            return await fn(*args, **kw)
+
+        return call
+
+
+def _breaker(max_pending: int = 10) -> tuple[FlakyCache, CircuitBreakerCache[str]]:
+    flaky = FlakyCache(MemoryCache[str]())
+    breaker = CircuitBreakerCache[str](
+        flaky,  # type: ignore[arg-type]
+        failure_threshold=2,
+        recovery_time=0.05,
+        max_pending=max_pending,
+    )
+
+    return flaky, breaker
+
+
+# read properties through calls so mypy doesn't keep narrowed values across awaits
+def _state(breaker: CircuitBreakerCache[str]) -> str:
+    return breaker.state
+
+
+def _available(breaker: CircuitBreakerCache[str]) -> bool:
+    return breaker.available
+
+
+async def test_breaker_opens_probes_and_closes() -> None:
+    flaky, breaker = _breaker()
+    flaky.down = True
+
+    assert await breaker.get("key") is None
+    assert _state(breaker) == "closed"
+    assert await breaker.get("key") is None
+    assert _state(breaker) == "open" and not _available(breaker)
+
+    flaky.calls.clear()
+    assert await breaker.get("key") is None and flaky.calls == []
+
+    await asyncio.sleep(0.06)
+    assert _available(breaker)
+    assert await breaker.get("key") is None
+    assert _state(breaker) == "open"
+
+    await asyncio.sleep(0.06)
+    flaky.down = False
+    await breaker.set("key", "value")
+
+    assert _state(breaker) == "closed" and await breaker.get("key") == "value"
+
+
+async def test_breaker_half_open_allows_a_single_probe() -> None:
+    flaky, breaker = _breaker()
+    flaky.down = True
+    await breaker.get("key")
+    await breaker.get("key")
+    await asyncio.sleep(0.06)
+
+    assert breaker._acquire()
+    assert _state(breaker) == "half_open" and not _available(breaker)
+    assert not breaker._acquire()
+
+
+async def test_breaker_replays_missed_evictions() -> None:
+    flaky, breaker = _breaker()
+    await breaker.set_many({"entity:user:1": "one", "entity:user:2": "two"})
+    namespace = await breaker.namespace("qc")
+
+    flaky.down = True
+    await breaker.get("entity:user:1")
+    await breaker.get("entity:user:1")
+    await breaker.delete_many("entity:user:1")
+    await breaker.invalidate("qc")
+
+    await asyncio.sleep(0.06)
+    flaky.down = False
+
+    assert await breaker.get("entity:user:1") is None
+    assert await breaker.get("entity:user:2") == "two"
+    assert await breaker.namespace("qc") != namespace
+
+
+async def test_breaker_overflow_removes_plain_keys_by_prefix() -> None:
+    flaky, breaker = _breaker(max_pending=1)
+    await breaker.set_many({"entity:user:1": "one", "entity:user:2": "two"})
+    namespace = await breaker.namespace("qc")
+
+    flaky.down = True
+    await breaker.get("entity:user:1")
+    await breaker.get("entity:user:1")
+    await breaker.delete_many("entity:user:1")
+    await breaker.delete_many("entity:user:2")
+    await breaker.delete_many("entity:user:3")
+
+    assert breaker._pending_patterns == {"entity:user:*"}
+
+    await asyncio.sleep(0.06)
+    flaky.down = False
+    flaky.calls.clear()
+
+    assert await breaker.get_many("entity:user:1", "entity:user:2") == [None, None]
+    assert await breaker.namespace("qc") != namespace
+    assert flaky.calls[:2] == ["clear", "delete"]
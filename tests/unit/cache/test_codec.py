@@ -0,0 +1,32 @@
+import os
+
+from src.services.cache import codec
+
+
+def test_codec_round_trip_small_values_stay_raw() -> None:
+    encoded = codec.encode("small", threshold=1024)
+
+    assert encoded == codec.RAW + b"small"
+    assert codec.decode(encoded) == b"small"
+
+
+def test_codec_round_trip_compresses_large_values() -> None:
+    value = b"x" * 4096
+    encoded = codec.encode(value, threshold=1024)
+
+    assert encoded.startswith(codec.ZLIB) and len(encoded) < len(value)
+    assert codec.decode(encoded) == value
+
+
+def test_codec_keeps_incompressible_values_raw() -> None:
+    value = os.urandom(4096)
+    encoded = codec.encode(value, threshold=1024)
+
+    assert encoded == codec.RAW + value
+    assert codec.decode(encoded) == value
+
+
+def test_codec_disabled_threshold_and_legacy_values() -> None:
+    assert codec.encode("x" * 4096) == codec.RAW + b"x" * 4096
+    assert codec.decode(b"legacy") == b"legacy"
+    assert codec.decode(codec.encode("")) == b""
@@ -0,0 +1,53 @@
+from src.services.cache.hotkeys import HotKeyTracker
+
+
+def test_hot_keys_keep_the_most_frequent_keys() -> None:
+    tracker = HotKeyTracker(capacity=2)
+
+    for key, hits in (("a", 5), ("b", 3), ("c", 1)):
+        for _ in range(hits):
+            tracker.add(key)
+
+    assert tracker.top() == [("a", 5), ("b", 3)]
+    assert tracker.top(1) == [("a", 5)]
+    assert tracker.estimate("c") >= 1
+
+
+def test_hot_keys_replace_the_coldest_key() -> None:
+    tracker = HotKeyTracker(capacity=2)
+    for key in ("a", "a", "b"):
+        tracker.add(key)
+
+    for _ in range(3):
+        tracker.add("c")
+
+    assert dict(tracker.top()) == {"a": 2, "c": 3}
+
+
+def test_hot_keys_age_after_window() -> None:
+    tracker = HotKeyTracker(capacity=4, window=8)
+    for _ in range(6):
+        tracker.add("a")
+    tracker.add("b")
+    tracker.add("c")
+
+    assert tracker.top() == [("a", 3)]
+    assert tracker.estimate("a") == 3
+
+
+def test_hot_keys_sampling() -> None:
+    full, partial = HotKeyTracker(), HotKeyTracker(sample_rate=0.1)
+
+    assert all(full.sampled() for _ in range(100))
+
+    sampled = sum(partial.sampled() for _ in range(10_000))
+
+    assert 500 < sampled < 1500
+
+
+def test_hot_keys_reset() -> None:
+    tracker = HotKeyTracker()
+    tracker.add("a")
+    tracker.reset()
+
+    assert tracker.top() == [] and tracker.estimate("a") == 0
@@ -0,0 +1,120 @@
+import asyncio
+
+from src.services.cache.memory import MemoryCache, _LFUPolicy
+from tests.unit.conftest import *  # noqa
+
+
+async def test_lru_evicts_least_recent_under_byte_budget() -> None:
+    cache = MemoryCache[str](max_size=10, policy="lru")
+    await cache.set("a", "1234")
+    await cache.set("b", "1234")
+
+    assert cache.size == 10
+
+    await cache.get("a")
+    await cache.set("c", "1234")
+
+    assert await cache.get_many("a", "b", "c") == ["1234", None, "1234"]
+    assert cache.size == 10
+
+
+async def test_values_larger_than_budget_are_not_stored() -> None:
+    cache = MemoryCache[str](max_size=10)
+    await cache.set("a", "1")
+    await cache.set("a", "x" * 10)
+
+    assert await cache.get("a") is None and cache.size == 0
+
+
+async def test_lfu_evicts_least_frequent() -> None:
+    cache = MemoryCache[str](max_size=6, policy="lfu")
+    await cache.set("a", "1")
+    await cache.set("b", "1")
+    await cache.set("c", "1")
+    await cache.get("a")
+    await cache.get("a")
+    await cache.get("b")
+
+    await cache.set("d", "1")
+
+    assert await cache.exists("a") and await cache.exists("b")
+    assert not await cache.exists("c") and await cache.exists("d")
+
+
+def test_lfu_min_frequency_bookkeeping() -> None:
+    policy = _LFUPolicy()
+    policy.add("a")
+    policy.add("b")
+    policy.touch("a")
+    policy.touch("b")
+
+    assert policy._min == 2
+
+    policy.touch("b")
+    policy.remove("a")
+
+    assert policy._min == 3 and policy.victim() == "b"
+
+    policy.add("c")
+
+    assert policy._min == 1 and policy.victim() == "c"
+
+    policy.remove("c")
+    policy.remove("b")
+
+    assert policy._min == 0 and not policy._buckets
+
+
+async def test_expired_entries_are_hidden_and_swept() -> None:
+    cache = MemoryCache[str](sweep_interval=0.01)
+    await cache.set("short", "1", expire=0.02)
+    await cache.set("long", "1", expire=10)
+
+    assert await cache.get("short") == "1"
+
+    await asyncio.sleep(0.05)
+
+    assert await cache.get("short") is None
+    assert [key async for key in cache.keys()] == ["long"]
+    assert cache.size == len("long") + 1
+
+    await cache.close()
+
+
+async def test_lists_follow_lpush_order() -> None:
+    cache = MemoryCache[int]()
+    await cache.set_list("list", 1, 2)
+    await cache.set_list("list", 3)
+
+    assert await cache.get_list("list") == [3, 2, 1]
+    assert await cache.get_list("list", start=0, end=1) == [3, 2]
+    assert await cache.get("list") is None
+
+
+async def test_discard_count_semantics() -> None:
+    cache = MemoryCache[int]()
+
+    for count, expected in ((0, [2, 3]), (1, [2, 1, 3, 1]), (2, [2, 3, 1]), (-1, [1, 2, 1, 3])):
+        await cache.set_list("list", *reversed([1, 2, 1, 3, 1]))
+        await cache.discard("list", 1, count=count)
+
+        assert await cache.get_list("list") == expected, count
+
+        await cache.delete_many("list")
+
+
+async def test_namespaces_and_pattern_delete() -> None:
+    cache = MemoryCache[str]()
+    first = await cache.namespace("qc")
+    await cache.invalidate("qc")
+    second = await cache.namespace("qc")
+    await cache.set_many({"entity:1": "1", "entity:2": "2", "other": "3"})
+    await cache.delete("entity:*")
+
+    assert first != second != await cache.namespace("other")
+    assert [key async for key in cache.keys()] == ["other"]
+
+    await cache.clear()
+
+    assert await cache.namespace("qc") not in (first, second)
+    assert cache.size == 0
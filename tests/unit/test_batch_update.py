@@ -0,0 +1,29 @@
+from src.database.alchemy import entity, queries
+
+
+def test_batch_update_groups_rows_by_columns() -> None:
+    query = queries.base.BatchUpdate.with_(entity.User)(
+        [
+            {"id": 1, "login": "a"},
+            {"password": "p", "id": 2},
+            {"id": 3, "login": "c"},
+            {"id": 4},
+        ]
+    )
+
+    assert query._groups() == {
+        ("id", "login"): [(1, "a"), (3, "c")],
+        ("id", "password"): [(2, "p")],
+    }
+
+
+def test_batch_update_merges_duplicate_keys_in_order() -> None:
+    query = queries.base.BatchUpdate.with_(entity.User)(
+        [
+            {"id": 1, "login": "a"},
+            {"id": 1, "password": "p"},
+            {"id": 1, "login": "b"},
+        ]
+    )
+
+    assert query._groups() == {("id", "login", "password"): [(1, "b", "p")]}
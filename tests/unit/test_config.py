@@ -0,0 +1,18 @@
+from typing import Literal
+
+import pytest
+from pydantic import ValidationError
+
+from src.config.core import CacheConfig, ServerConfig, load_config
+
+
+@pytest.mark.parametrize("workers", [2, "auto"])
+def test_memory_cache_is_refused_with_several_workers(workers: int | Literal["auto"]) -> None:
+    with pytest.raises(ValidationError, match="SERVER_WORKERS=1"):
+        load_config(cache=CacheConfig(backend="memory"), server=ServerConfig(workers=workers))
+
+
+def test_memory_cache_runs_with_a_single_worker() -> None:
+    config = load_config(cache=CacheConfig(backend="memory"), server=ServerConfig(workers=1))
+
+    assert config.cache.backend == "memory"
@@ -0,0 +1,84 @@
+from collections.abc import AsyncIterator
+
+from src.api.common import ingest
+from src.api.v1.commands.user.create import CreateUser
+from tests.unit.conftest import *  # noqa
+
+
+async def _stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _rows(format: ingest.IngestFormat, *chunks: bytes) -> list[tuple[int, str | None]]:
+    return [
+        (row, value.login if value else None)
+        async for row, value in ingest.read_rows(_stream(*chunks), CreateUser, format)
+    ]
+
+
+async def test_ndjson_rows_split_across_chunks() -> None:
+    rows = await _rows(
+        "ndjson",
+        b'{"login": "a", "password": "pass',
+        b'word"}\r\n\n{"login": "b"}\n{"login": "c", "password": "password"}',
+    )
+
+    assert rows == [(1, "a"), (2, None), (3, "c")]
+
+
+async def test_csv_quoted_fields_with_newlines() -> None:
+    rows = await _rows(
+        "csv",
+        b'login,password\n"multi\nline",password\n',
+        b'"quoted ""comma"", here",password\nshort,pw\n',
+        b'"a\n\nb",password',
+    )
+
+    assert rows == [
+        (1, "multi\nline"),
+        (2, 'quoted "comma", here'),
+        (3, None),
+        (4, "a\n\nb"),
+    ]
+
+
+async def test_csv_invalid_rows_do_not_break_the_reader() -> None:
+    rows = await _rows(
+        "csv",
+        b"login,password\n",
+        b"a,password,extra\n",
+        b"\xff\xfe,password\n",
+        b"b,password\n",
+    )
+
+    assert rows == [(1, None), (2, None), (3, "b")]
+
+
+async def test_read_chunks_splits_valid_and_invalid_rows() -> None:
+    chunks = [
+        (sorted(rows), invalid)
+        async for rows, invalid in ingest.read_chunks(
+            _stream(b"login,password\na,password\nb,pw\nc,password\nd,password\n"),
+            CreateUser,
+            "csv",
+            2,
+        )
+    ]
+
+    assert chunks == [([1, 3], [2]), ([4], [])]
+
+
+async def test_csv_stray_quote_does_not_swallow_following_rows() -> None:
+    valid = b"".join(b"user%d,password%d\n" % (i, i) for i in range(1000))
+    rows = await _rows("csv", b'login,password\nfoo,bar"baz12345\n', valid)
+
+    assert len(rows) == 1001
+    assert rows[1:3] == [(2, "user0"), (3, "user1")] and rows[-1] == (1001, "user999")
+
+
+async def test_csv_unterminated_quote_is_rejected_at_the_line_cap() -> None:
+    lines = b"".join(b"user%d,password%d\n" % (i, i) for i in range(ingest.MAX_RECORD_LINES))
+    rows = await _rows("csv", b'login,password\n"open,password\n', lines, b"last,password\n")
+
+    assert rows == [(1, None), (2, "user999"), (3, "last")]
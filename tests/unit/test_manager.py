@@ -0,0 +1,132 @@
+import asyncio
+import functools
+from collections.abc import Hashable, Sequence
+from typing import Any, Self
+
+import pytest
+
+from src.database.interfaces.query import BatchableQuery, Query
+from src.database.manager import TransactionManagerImpl
+from tests.unit.conftest import *  # noqa
+
+
+class Connection:
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[Any] = []
+
+    async def commit(self) -> None:
+        self.calls.append("commit")
+
+    async def rollback(self) -> None:
+        self.calls.append("rollback")
+
+
+class Write(BatchableQuery[Any, int]):
+    __slots__ = (
+        "value",
+        "key",
+    )
+
+    def __init__(self, value: int, key: Hashable | None = "write") -> None:
+        self.value = value
+        self.key = key
+
+    def batch_key(self) -> Hashable | None:
+        return self.key
+
+    async def __call__(self, conn: Any, /, **kw: Any) -> int:
+        if self.value < 0:
+            raise ValueError(self.value)
+        conn.calls.append(("single", self.value))
+
+        return self.value
+
+    @classmethod
+    async def send_batch(cls, conn: Any, queries: Sequence[Self], /) -> list[int]:
+        conn.calls.append(("batch", [q.value for q in queries]))
+
+        return [q.value * 10 for q in queries]
+
+
+class Read(Query[Any, str]):
+    __slots__ = ()
+
+    async def __call__(self, conn: Any, /, **kw: Any) -> str:
+        conn.calls.append("read")
+
+        return "read"
+
+
+async def test_flush_batches_by_key_in_first_seen_order() -> None:
+    conn = Connection()
+    manager = TransactionManagerImpl(conn=conn)  # type: ignore[arg-type]
+
+    futures = [
+        manager.defer(Write(1)),
+        manager.defer(Write(2, key=None)),
+        manager.defer(Write(3)),
+        manager.defer(Write(4, key="other")),
+    ]
+    await manager.flush()
+
+    assert [f.result() for f in futures] == [10, 2, 30, 4]
+    assert conn.calls == [("batch", [1, 3]), ("single", 2), ("single", 4)]
+
+
+async def test_send_flushes_deferred_writes_first() -> None:
+    conn = Connection()
+    manager = TransactionManagerImpl(conn=conn)  # type: ignore[arg-type]
+
+    future = manager.defer(Write(1))
+
+    assert await manager.send(Read()) == "read"
+    assert future.result() == 1 and conn.calls == [("single", 1), "read"]
+
+
+async def test_failed_flush_passes_error_to_pending_futures() -> None:
+    conn = Connection()
+    manager = TransactionManagerImpl(conn=conn)  # type: ignore[arg-type]
+
+    done = manager.defer(Write(1, key="first"))
+    failed = manager.defer(Write(-1, key=None))
+    pending = manager.defer(Write(2))
+
+    with pytest.raises(ValueError):
+        await manager.flush()
+
+    assert done.result() == 1
+    for future in (failed, pending):
+        assert not future.cancelled()
+        with pytest.raises(ValueError):
+            await future
+
+
+async def test_rollback_cancels_deferred_writes() -> None:
+    conn = Connection()
+    manager = TransactionManagerImpl(conn=conn)  # type: ignore[arg-type]
+
+    future = manager.defer(Write(1))
+    await manager.rollback()
+    await manager.flush()
+
+    assert future.cancelled() and conn.calls == ["rollback"]
+    with pytest.raises(asyncio.CancelledError):
+        await future
+
+
+async def test_commit_callbacks_run_after_commit_and_drop_on_rollback() -> None:
+    conn = Connection()
+    manager = TransactionManagerImpl(conn=conn)  # type: ignore[arg-type]
+
+    async def callback(name: str) -> None:
+        conn.calls.append(name)
+
+    manager.on_commit(functools.partial(callback, "discarded"))
+    await manager.rollback()
+    manager.on_commit(functools.partial(callback, "evict"))
+    await manager.commit()
+    await manager.commit()
+
+    assert conn.calls == ["rollback", "commit", "evict", "commit"]
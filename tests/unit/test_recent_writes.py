@@ -0,0 +1,44 @@
+import asyncio
+
+from src.api.common.bus.middlewares.routing import RECENT_WRITES_PREFIX, RecentWrites
+from src.config.core import CacheConfig
+from src.services.cache.memory import MemoryCache
+from tests.unit.conftest import *  # noqa
+
+
+async def test_recent_writes_are_shared_between_workers() -> None:
+    shared = MemoryCache[str].from_config(CacheConfig(backend="memory"))
+    first, second = RecentWrites(0.05, shared=shared), RecentWrites(0.05, shared=shared)
+
+    await first.mark("session")
+
+    assert await second.recent("session")
+    assert not await second.recent("other")
+
+    await asyncio.sleep(0.1)
+
+    assert not await first.recent("session") and not await second.recent("session")
+
+    await shared.close()
+
+
+async def test_recent_writes_without_shared_store_are_local() -> None:
+    first, second = RecentWrites(10), RecentWrites(10)
+
+    await first.mark("session")
+
+    assert await first.recent("session") and not await second.recent("session")
+
+
+async def test_shared_write_is_remembered_locally() -> None:
+    shared = MemoryCache[str].from_config(CacheConfig(backend="memory"))
+    first, second = RecentWrites(10, shared=shared), RecentWrites(10, shared=shared)
+
+    await first.mark("session")
+    assert await second.recent("session")
+
+    await shared.delete(f"{RECENT_WRITES_PREFIX}:session")
+
+    assert await second.recent("session")
+
+    await shared.close()
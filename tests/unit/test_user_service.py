@@ -0,0 +1,126 @@
+import asyncio
+import json
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from src.common import exceptions as exc
+from src.database.alchemy import entity, queries
+from src.database.alchemy.tools import cursor_encoder
+from src.services.cache.memory import MemoryCache
+from src.services.internal.user.core import UserServiceImpl
+from tests.unit.conftest import *  # noqa
+
+
+def user(id: uuid.UUID, login: str) -> entity.User:
+    now = datetime.now(UTC)
+
+    return entity.User(id=id, created_at=now, updated_at=now, login=login, password="x")
+
+
+class Manager:
+    __slots__ = (
+        "row",
+        "loaded",
+        "release",
+        "_on_commit",
+    )
+
+    def __init__(self, row: entity.User | None) -> None:
+        self.row = row
+        self.loaded = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+        self._on_commit: list[Callable[[], Awaitable[Any]]] = []
+
+    async def send(self, query: Any, /, **kw: Any) -> Any:
+        if isinstance(query, queries.base.GetOne):
+            row = self.row
+            self.loaded.set()
+            await self.release.wait()
+            return row
+        if isinstance(query, queries.base.Update):
+            assert self.row is not None
+            self.row = user(self.row.id, query._kw["login"])
+            return [self.row]
+        if isinstance(query, queries.base.Delete):
+            row, self.row = self.row, None
+            return [row]
+        if isinstance(query, queries.base.GetManyByCursor):
+            raise ConnectionError("database is down")
+
+        raise AssertionError(query)
+
+    def on_commit(self, callback: Callable[[], Awaitable[Any]], /) -> None:
+        self._on_commit.append(callback)
+
+    async def commit(self) -> None:
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            await callback()
+
+    async def rollback(self) -> None:
+        self._on_commit = []
+
+
+async def test_read_racing_an_update_does_not_cache_the_old_row() -> None:
+    id = uuid.uuid4()
+    cache = MemoryCache[bytes]()
+    manager = Manager(user(id, "old"))
+    service = UserServiceImpl(manager, cache, 60)  # type: ignore[arg-type]
+
+    manager.release.clear()
+    reader = asyncio.create_task(service.get_one(id))
+    await manager.loaded.wait()
+
+    await service.update(id, login="new")
+    await manager.commit()
+    manager.release.set()
+
+    assert (await reader).login == "old"
+    assert (await service.get_one(id)).login == "new"
+    assert (await service.get_one(id)).login == "new"
+    await cache.close()
+
+
+async def test_writes_evict_only_after_commit() -> None:
+    id = uuid.uuid4()
+    cache = MemoryCache[bytes]()
+    manager = Manager(user(id, "old"))
+    service = UserServiceImpl(manager, cache, 60)  # type: ignore[arg-type]
+
+    await service.get_one(id)
+    await service.update(id, login="new")
+    await manager.rollback()
+    manager.row = None
+
+    assert (await service.get_one(id)).login == "old"
+
+    manager.row = user(id, "old")
+    await service.delete(id)
+    await manager.commit()
+    manager.row = user(id, "recreated")
+
+    assert (await service.get_one(id)).login == "recreated"
+    await cache.close()
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "bm90IGpzb24=", "WzFd", "WyJ4IiwgInkiXQ=="])
+async def test_invalid_cursor_is_a_bad_request(cursor: str) -> None:
+    service = UserServiceImpl(Manager(None))  # type: ignore[arg-type]
+
+    with pytest.raises(exc.BadRequestError) as error:
+        await service.get_many_by_cursor(10, cursor)
+
+    assert error.value.content["message"] == "Invalid cursor"
+
+
+async def test_cursor_query_errors_propagate() -> None:
+    service = UserServiceImpl(Manager(None))  # type: ignore[arg-type]
+    cursor = cursor_encoder((datetime.now(UTC), uuid.uuid4()), json.dumps, "UUID")
+
+    with pytest.raises(ConnectionError):
+        await service.get_many_by_cursor(10, cursor)